@@ -0,0 +1,55 @@
+import os  # For reading configuration from environment variables
+import logging  # For logging monitor state
+from disnake.ext import commands  # Framework for creating Discord bot cogs
+from utils.blocking import LoopLagMonitor  # Detects callbacks that hold the event loop for too long
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Seconds a single callback may hold the event loop before it is logged
+LOOP_LAG_THRESHOLD = float(os.getenv('LOOP_LAG_THRESHOLD', '0.25'))
+# Seconds between event loop heartbeats
+LOOP_LAG_INTERVAL = float(os.getenv('LOOP_LAG_INTERVAL', '0.1'))
+
+
+class LoopLagHandler(commands.Cog):
+    """
+    Cog that watches the shared event loop for blocking calls.
+
+    Once the bot is ready it starts a LoopLagMonitor, which logs every callback that
+    holds the loop longer than LOOP_LAG_THRESHOLD, including the stack it was stuck in.
+    """
+
+    def __init__(self, bot):
+        """
+        Initializes the LoopLagHandler cog.
+
+        Args:
+            bot: The instance of the bot.
+        """
+        self.bot = bot
+        self.monitor = LoopLagMonitor(threshold=LOOP_LAG_THRESHOLD, interval=LOOP_LAG_INTERVAL)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """
+        Starts monitoring once the event loop is running (on_ready may fire again after reconnects).
+        """
+        if not self.monitor.running:
+            self.monitor.start()
+            logger.info(f"Loop lag monitor started (threshold {LOOP_LAG_THRESHOLD}s)")
+
+    def cog_unload(self):
+        """
+        Stops the monitor when the cog is unloaded.
+        """
+        self.monitor.stop()
+
+
+def setup(bot):
+    """
+    Registers the LoopLagHandler cog with the bot.
+
+    Args:
+        bot: The instance of the bot.
+    """
+    bot.add_cog(LoopLagHandler(bot))
@@ -1,16 +1,20 @@
-import disnake  # Discord API wrapper for Python
 from disnake.ext import tasks, commands  # Extensions for bot commands and background tasks
 import asyncio  # For asynchronous locks and coroutine management
 import logging  # For logging errors and information
+import os  # For reading the check interval from the environment
 
 logger = logging.getLogger(__name__)  # Create a logger for this module
 
+# Seconds between safety-net checks; playback normally advances on enqueue and track-end events
+QUEUE_WATCHER_INTERVAL = float(os.getenv('QUEUE_WATCHER_INTERVAL', '300'))
+
 class QueueWatcher(commands.Cog):
     """
-    Cog to monitor the music queue and trigger playback when needed.
+    Safety net that restarts playback if a guild's queue stalls.
 
-    This cog periodically checks if the bot's voice client is idle (not playing or paused)
-    while there is still content in the queue. If such a condition is met, it triggers playback.
+    Playback is advanced by events (enqueue, track end, error) in the Play cog; this cog
+    only checks, at a low frequency, for voice clients that are idle while their queue
+    still has tracks, which means an event was lost, and restarts playback for them.
     """
 
     def __init__(self, bot, queue_manager):
@@ -24,41 +28,14 @@ class QueueWatcher(commands.Cog):
         self.bot = bot
         self.queue_manager = queue_manager
         self.lock = asyncio.Lock()  # Ensures that only one queue check runs at a time
-        self._last_ctx = None  # Stored context used for playback commands
         
         # Start the queue check task immediately upon cog initialization
         self.queue_check.start()
 
-    @property
-    def last_ctx(self):
-        """
-        Gets the last valid command context from any relevant Cog.
-
-        Returns:
-            A valid commands.Context object if available; otherwise, returns the stored _last_ctx.
-        """
-        play_cog = self.bot.get_cog('Play')
-        if play_cog and play_cog.last_valid_ctx:
-            return play_cog.last_valid_ctx
-        return self._last_ctx
-
-    @last_ctx.setter
-    def last_ctx(self, value):
-        """
-        Updates the last valid command context in all relevant cogs.
-
-        Args:
-            value: The new context to be stored.
-        """
-        play_cog = self.bot.get_cog('Play')
-        if play_cog:
-            play_cog.last_valid_ctx = value
-        self._last_ctx = value
-
-    @tasks.loop(seconds=30)  # Adjust this interval to 30 seconds if necessary
+    @tasks.loop(seconds=QUEUE_WATCHER_INTERVAL)  # Low-frequency safety net
     async def queue_check(self):
         """
-        Task loop that runs every 10 seconds to monitor the voice clients.
+        Task loop that runs every QUEUE_WATCHER_INTERVAL seconds to monitor the voice clients.
 
         It checks each voice client for conditions that require triggering playback,
         such as when the client is idle and the queue is not empty.
@@ -81,7 +58,8 @@ class QueueWatcher(commands.Cog):
             - The voice client exists.
             - It is not currently playing any audio.
             - It is not paused.
-            - The music queue is not empty.
+            - The guild's playback state is idle (no track being resolved).
+            - The guild's music queue is not empty.
 
         Args:
             vc: The voice client to check.
@@ -89,59 +67,36 @@ class QueueWatcher(commands.Cog):
         Returns:
             True if playback should be triggered; otherwise, False.
         """
+        play_cog = self.bot.get_cog('Play')
         return (
             vc and 
             not vc.is_playing() and 
             not vc.is_paused() and 
-            not self.queue_manager.is_empty()
+            (play_cog is None or play_cog.players.get(vc.guild.id).state.idle) and
+            not self.queue_manager.get_queue(vc.guild.id).is_empty()
         )
 
     async def trigger_playback(self, vc):
         """
         Triggers the next track playback if conditions are met.
 
-        Retrieves the 'Play' cog and uses its play_next method with a valid context.
+        Restarts the guild's GuildPlayer, which posts to the guild's bound channel;
+        no command context is needed.
 
         Args:
             vc: The voice client for which playback should be triggered.
         """
         try:
             play_cog = self.bot.get_cog('Play')
-            if play_cog and self.last_ctx:
-                # Use the stored context if it is a valid commands.Context,
-                # or create a new context if necessary.
-                ctx = self.last_ctx if isinstance(self.last_ctx, commands.Context) else await self.create_context(vc)
-                
-                # Only trigger playback if the voice client is still idle
-                if ctx and not ctx.voice_client.is_playing():
-                    await play_cog.play_next(ctx)
+            if not play_cog:
+                return
+            # Only trigger playback if the voice client is still idle
+            if not vc.is_playing():
+                logger.warning(f"Queue stalled in guild {vc.guild.id}; restarting playback")
+                await play_cog.players.get(vc.guild.id).play_next('watchdog')
         except Exception as e:
             logger.error(f"Playback trigger error: {str(e)}")
 
-    async def create_context(self, vc):
-        """
-        Creates an artificial command context.
-
-        This is useful if no valid context is stored. It attempts to locate a text channel 
-        related to the voice channel or uses the guild's system channel to generate a context.
-        
-        Args:
-            vc: The voice client for which context is needed.
-        
-        Returns:
-            A commands.Context object if successful; otherwise, None.
-        """
-        try:
-            guild = vc.guild
-            # Try to find a text channel with the same name as the voice channel; otherwise, use the system channel
-            channel = disnake.utils.get(guild.text_channels, name=vc.channel.name) or guild.system_channel
-            # Send a temporary message to obtain a context from the bot
-            temp_msg = await channel.send("Obtendo contexto para reprodução...")
-            return await self.bot.get_context(temp_msg)
-        except Exception as e:
-            logger.warning(f"Context creation failed: {str(e)}")
-            return None
-
     @queue_check.before_loop
     async def before_check(self):
         """
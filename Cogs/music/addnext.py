@@ -4,7 +4,12 @@ import yt_dlp as youtube_dl  # YouTube downloader library (yt-dlp fork)
 import asyncio  # Enables asynchronous programming
 from dotenv import load_dotenv  # Loads environment variables from a .env file
 from disnake.ext import commands  # Framework for creating Discord bot commands
-from utils.queue_manager import add_to_queue, get_next  # Functions to manage the music queue
+from utils.queue_manager import get_queue  # Per-guild music queue registry
+from utils.track import Track  # Compact, immutable track record stored in queues and history
+from utils.metadata_cache import metadata_cache  # Shared LRU+TTL cache of yt-dlp extraction results
+from utils.blocking import run_blocking  # Runs blocking Spotify calls in a dedicated thread pool
+from extra_modules.music.ytdl_service import ytdl_service  # Shared yt-dlp extraction service
+from utils.spotify_mapping import spotify_mapping  # Persistent Spotify track -> YouTube video mapping
 from spotipy import Spotify  # Spotify API client
 from spotipy.oauth2 import SpotifyClientCredentials  # Handles Spotify authentication
 from embeds.music.addnext_embed import (  # Import various embed functions for rich Discord messages
@@ -35,31 +40,11 @@ sp = Spotify(auth_manager=SpotifyClientCredentials(
     client_secret=spotify_client_secret
 ))
 
-# Configuration options for yt-dlp to extract the best available audio
-ytdl_format_options = {
-    'format': 'bestaudio/best',  # Download best quality audio
-    'outtmpl': '%(extractor)s-%(id)s-%(title)s.%(ext)s',  # Template for output filename
-    'restrictfilenames': True,  # Restrict filenames to ASCII characters
-    'noplaylist': True,  # Always avoid downloading playlists
-    'nocheckcertificate': True,  # Do not check SSL certificates
-    'ignoreerrors': False,  # Stop processing if an error occurs
-    'logtostderr': False,  # Do not log messages to stderr
-    'quiet': True,  # Run in quiet mode (suppress output)
-    'no_warnings': True,  # Suppress warnings
-    'default_search': 'auto',  # Automatically detect search queries
-    'source_address': '0.0.0.0',  # Bind to this IP address when making network requests
-    'force-ipv4': True,  # Force IPv4 usage
-    'cookiefile': 'cookies.txt'  # Path to a cookie file if needed
-}
-
 # Options for ffmpeg when processing audio streams
 ffmpeg_options = {
     'options': '-vn -loglevel warning'  # Disable video, show warnings only
 }
 
-# Initialize the yt-dlp downloader with the defined options
-ytdl = youtube_dl.YoutubeDL(ytdl_format_options)
-
 
 class EnhancedYTDLSource(disnake.PCMVolumeTransformer):
     """Audio source with extended metadata support"""
@@ -76,24 +61,30 @@ class EnhancedYTDLSource(disnake.PCMVolumeTransformer):
         self.thumbnail = data.get('thumbnail')  # URL to the track thumbnail
 
     @classmethod
-    async def from_url(cls, url, *, loop=None, stream=True):
+    async def extract(cls, url, *, download=False):
         """
-        Asynchronously creates an EnhancedYTDLSource from a given URL.
+        Asynchronously extracts track information from a given URL without creating an audio source.
 
         Args:
             url (str): The URL to extract information from.
-            loop (asyncio.AbstractEventLoop, optional): The event loop to use.
-            stream (bool, optional): Whether to stream the audio (True) or download it.
+            download (bool, optional): Whether to download the audio while extracting.
 
         Returns:
-            tuple: A tuple containing the audio source and a metadata dictionary.
+            tuple: A tuple containing the raw yt-dlp data of the track and a metadata dictionary.
         """
-        # Use the provided event loop or get the current one
-        loop = loop or asyncio.get_event_loop()
-        # Run the yt-dlp extraction in an executor to avoid blocking the event loop
-        raw_data = await loop.run_in_executor(
-            None, lambda: ytdl.extract_info(url, download=not stream)
-        )
+        # Metadata-only lookups are served from the shared cache when possible
+        cached = None if download else await metadata_cache.get(url)
+        if cached is not None:
+            return cached, {
+                'title': cached.get('title'),
+                'duration': cls.format_duration(cached.get('duration')),
+                'thumbnail': cached.get('thumbnail'),
+                'url': url,
+                'is_playlist': False
+            }
+
+        # Run the extraction through the shared service to avoid blocking the event loop
+        raw_data = await ytdl_service.extract(url, download=download)
 
         is_playlist = False
         if 'entries' in raw_data:
@@ -102,13 +93,9 @@ class EnhancedYTDLSource(disnake.PCMVolumeTransformer):
             data = raw_data['entries'][0]  # Use the first entry of the playlist
         else:
             data = raw_data  # Use the raw data directly if it's a single video
+        metadata_cache.put(url, data)
 
-        # Create an instance of EnhancedYTDLSource using FFmpegPCMAudio
-        return cls(
-            disnake.FFmpegPCMAudio(data['url'], **ffmpeg_options),
-            data=data,
-            original_url=url
-        ), {
+        return data, {
             'title': data.get('title'),
             'duration': cls.format_duration(data.get('duration')),
             'thumbnail': data.get('thumbnail'),
@@ -116,6 +103,27 @@ class EnhancedYTDLSource(disnake.PCMVolumeTransformer):
             'is_playlist': is_playlist  # Indicates if the source was part of a playlist
         }
 
+    @classmethod
+    async def from_url(cls, url, *, stream=True):
+        """
+        Asynchronously creates an EnhancedYTDLSource from a given URL.
+
+        Args:
+            url (str): The URL to extract information from.
+            stream (bool, optional): Whether to stream the audio (True) or download it.
+
+        Returns:
+            tuple: A tuple containing the audio source and a metadata dictionary.
+        """
+        data, metadata = await cls.extract(url, download=not stream)
+
+        # Create an instance of EnhancedYTDLSource using FFmpegPCMAudio
+        return cls(
+            disnake.FFmpegPCMAudio(data['url'], **ffmpeg_options),
+            data=data,
+            original_url=url
+        ), metadata
+
     @staticmethod
     def format_duration(seconds):
         """
@@ -214,14 +222,23 @@ class AddNext(commands.Cog):
 
             # Extract the Spotify track ID from the URL
             track_id = url.split('/')[-1].split('?')[0]
-            track = sp.track(track_id)  # Retrieve track information from Spotify
+
+            # A track resolved before goes straight to its YouTube video, without API or search calls
+            if mapped := await spotify_mapping.fetch(track_id):
+                await ctx.send(embed=conversion_embed("Spotify", mapped.title or mapped.url))
+                await self.process_query(ctx, mapped.url, platform="spotify")
+                return
+
+            track = await run_blocking('spotify', sp.track, track_id)  # Retrieve track information from Spotify
             # Create a search query combining track name and primary artist
             search_query = f"{track['name']} {track['artists'][0]['name']}"
 
             # Inform the user about the conversion from Spotify to YouTube search
             await ctx.send(embed=conversion_embed("Spotify", f"{track['name']} - {track['artists'][0]['name']}"))
             # Process the resulting query as a normal YouTube search
-            await self.process_query(ctx, search_query, platform="spotify")
+            youtube_url = await self.process_query(ctx, search_query, platform="spotify")
+            if youtube_url:
+                spotify_mapping.save(track_id, youtube_url, track['name'])
 
         except Exception as e:
             # Send a Spotify error embed if something goes wrong
@@ -235,6 +252,9 @@ class AddNext(commands.Cog):
             ctx: The command context.
             query (str): The search query or URL.
             platform (str): The source platform ("youtube" by default, "spotify" if converted).
+
+        Returns:
+            str or None: The YouTube URL of the queued track, or None if nothing was queued.
         """
         try:
             # If the query is not a valid URL, send a search embed indicating a search is being performed
@@ -247,25 +267,24 @@ class AddNext(commands.Cog):
                 await ctx.send(embed=search_failed_embed(query))
                 return
 
-            # Retrieve the audio player and metadata using the EnhancedYTDLSource class
-            player, metadata = await EnhancedYTDLSource.from_url(
-                youtube_url,
-                loop=self.bot.loop
-            )
+            # Retrieve the track data and metadata; no audio source is opened just to queue the track
+            data, metadata = await EnhancedYTDLSource.extract(youtube_url)
 
             # If the metadata indicates the result is a playlist, warn the user
             if metadata['is_playlist']:
                 await ctx.send(embed=playlist_warning_embed())
 
-            # Add the track to the queue with priority (next in queue)
-            add_to_queue(player, next_in_queue=True)
-            await self.update_context(ctx)
+            # Add a compact record of the track to the queue with priority (next in queue)
+            track = Track.from_info(data, url=youtube_url, source=platform, requester=ctx.author.id)
+            self.bind_channel(ctx)
+            get_queue(ctx.guild.id).add_to_queue(track, next_in_queue=True)
             # Inform the user that the track was successfully added
             await ctx.send(embed=track_added_embed(metadata))
 
             # Send a second warning if the track is from a playlist
             if metadata['is_playlist']:
                 await ctx.send(embed=playlist_warning_embed())
+            return youtube_url
 
         except youtube_dl.DownloadError as e:
             # Handle errors related to YouTube downloading
@@ -289,23 +308,28 @@ class AddNext(commands.Cog):
             str or None: The URL of the first video result or None if no result is found.
         """
         try:
-            # If the query is not a valid URL, prepend 'ytsearch:' to perform a YouTube search
+            # If the query is not a valid URL, perform a YouTube search (results are cached by the service)
             if not query.startswith(('http://', 'https://')):
-                query = f'ytsearch:{query}'
+                results = await ytdl_service.search(query)
+                return results[0].get('webpage_url') if results else None
+            elif (cached := await metadata_cache.get_metadata(query)) is not None:
+                # Known URL: no need to extract it again just to find its page URL
+                return cached.get('webpage_url', query)
 
-            # Run the yt-dlp extraction in an executor to avoid blocking
-            data = await self.bot.loop.run_in_executor(
-                None,
-                lambda: ytdl.extract_info(query, download=False)
-            )
+            # Run the extraction through the shared service to avoid blocking
+            data = await ytdl_service.extract(query)
 
             # Process different types of results
             if 'entries' in data:
-                # The result is either a search result or a playlist; take the first entry
+                # The result is a playlist; take the first entry
                 first_entry = data['entries'][0]
-                return first_entry.get('webpage_url') if first_entry else None
+                if not first_entry:
+                    return None
+                metadata_cache.put(first_entry.get('webpage_url'), first_entry)
+                return first_entry.get('webpage_url')
             else:
                 # The result is a direct video URL
+                metadata_cache.put(query, data)
                 return data.get('webpage_url')
 
         except Exception as e:
@@ -313,15 +337,10 @@ class AddNext(commands.Cog):
             print(f"Detailed search error: {str(e)}")
             return None
     
-    async def update_context(self, ctx):
-        """Atualiza contexto globalmente"""
-        play_cog = self.bot.get_cog('Play')
-        watcher_cog = self.bot.get_cog('QueueWatcher')
-        
-        if play_cog:
-            play_cog.update_context(ctx)
-        if watcher_cog:
-            watcher_cog.last_ctx = ctx
+    def bind_channel(self, ctx):
+        """Makes this command's channel receive the guild's playback messages."""
+        if play_cog := self.bot.get_cog('Play'):
+            play_cog.bind_channel(ctx)
 
 # Function to set up the cog; called by the bot to add this cog
 def setup(bot):
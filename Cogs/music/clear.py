@@ -1,6 +1,6 @@
 import disnake
 from disnake.ext import commands
-from utils.queue_manager import clear_queue, is_empty  # Utility functions to manage the music queue
+from utils.queue_manager import get_queue  # Per-guild music queue registry
 from embeds.music.clear_embed import (
     queue_cleared_embed,  # Embed indicating the queue has been cleared
     queue_empty_embed     # Embed indicating the queue is already empty
@@ -20,13 +20,19 @@ class ClearQueue(commands.Cog):
 
         If the queue is already empty, sends an embed informing that there are no songs to remove.
         """
+        queue = get_queue(ctx.guild.id)
+
+        # Stop any playlist that is still being added to this queue
+        play_cog = self.bot.get_cog('Play')
+        cancelled = play_cog.cancel_ingestion(ctx.guild.id) if play_cog else False
+
         # Check if the queue is empty
-        if is_empty():
+        if queue.is_empty() and not cancelled:
             # Send an embed indicating the queue is empty
             return await ctx.send(embed=queue_empty_embed())
 
         # Clear the queue
-        clear_queue()
+        queue.clear_queue()
         # Send an embed indicating the queue has been cleared
         await ctx.send(embed=queue_cleared_embed())
 
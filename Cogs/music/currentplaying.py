@@ -1,31 +1,15 @@
-import os  # Provides functions for interacting with the operating system (e.g., file management)
 import disnake  # Discord API wrapper for Python, used for creating and managing bot interactions
 import time  # Provides time-related functions (e.g., to measure elapsed time)
 import subprocess  # Allows running external commands (used here to run ffprobe)
 import json  # Used to parse JSON data returned by external commands
 from disnake.ext import commands  # Framework for creating Discord bot commands and cogs
-from utils.queue_manager import get_current_track  # Function to retrieve the current track (if needed)
+from utils.blocking import run_blocking  # Runs blocking calls (here, ffprobe) in dedicated thread pools
 from embeds.music.currentplaying_embed import (
     success_playing_now_embed,  # Embed for displaying the currently playing track successfully
     no_playing_music_embed,     # Embed for when no music is currently playing
     no_data_music_embed         # Embed for when required track data is missing
 )
 
-def find_music_file():
-    """
-    Search the current directory for a music file that starts with "youtube" and
-    has one of the specified audio file extensions (.mp3, .webm, .m4a).
-    
-    Returns:
-        str or None: The first matching file name if found; otherwise, None.
-    """
-    # List all files in the project's root directory
-    for file in os.listdir("."):
-        # Check if the file name starts with "youtube" and ends with a valid audio extension
-        if file.startswith("youtube") and file.endswith((".mp3", ".webm", ".m4a")):
-            return file  # Return the first matching file found
-    return None  # No matching file was found
-
 def create_progress_bar(elapsed: float, duration: float, length: int = 25) -> str:
     """
     Create a progress bar string representing the elapsed time of the track.
@@ -93,6 +77,20 @@ def get_duration_ffmpeg(file_path):
         print(f"Erro ao obter a duração: {e}")
         return 0
 
+async def probe_duration(file_path):
+    """
+    Retrieve the duration of a media file without blocking the event loop.
+    
+    Runs get_duration_ffmpeg in the FFmpeg thread pool.
+    
+    Args:
+        file_path (str): Path to the media file.
+    
+    Returns:
+        int: Duration of the file in seconds, or 0 if an error occurs.
+    """
+    return await run_blocking('ffmpeg', get_duration_ffmpeg, file_path)
+
 class CurrentPlaying(commands.Cog):
     """
     A Cog that defines the 'currentplaying' command, which displays the currently
@@ -127,13 +125,16 @@ class CurrentPlaying(commands.Cog):
         # Retrieve the track title and duration from the audio source metadata
         current_track = source.title
         duration = source.duration
+        # Fall back to probing the downloaded file when the extractor reported no duration
+        if not duration and getattr(source, 'filename', None):
+            duration = await probe_duration(source.filename)
 
-        # Check if the necessary data (duration and start_time) is available
-        if not duration or not hasattr(source, 'start_time'):
+        # Check if the necessary data (duration and playback position) is available
+        if not duration or not hasattr(source, 'position'):
             return await ctx.send(embed=no_data_music_embed())
         
-        # Calculate the elapsed time by subtracting the start time from the current time
-        elapsed = time.time() - source.start_time
+        # The position counts the audio frames actually played, so pauses and seeks are accounted for
+        elapsed = source.position
         # Format elapsed time and total duration into MM:SS strings
         elapsed_str = f"{int(elapsed // 60)}:{int(elapsed % 60):02d}"
         duration_str = f"{int(duration // 60)}:{int(duration % 60):02d}"
@@ -0,0 +1,40 @@
+from disnake.ext import commands
+from extra_modules.music.dsp import EQ_PRESETS
+from embeds.music.equalizer_embed import (
+    equalizer_embed,              # Embed to show the current preset
+    equalizer_updated_embed,      # Embed to confirm the new preset
+    invalid_preset_embed,         # Embed to indicate an unknown preset
+    equalizer_unavailable_embed   # Embed to indicate that NumPy is missing
+)
+
+class Equalizer(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name="equalizer", aliases=["eq"])
+    @commands.has_any_role(1137297683862802503, 1335963261878665229, 1336673321223192659, 739241340189278279, 733923101506666547, 811070168163680286)
+    async def equalizer(self, ctx, preset: str = None):
+        """
+        Mostra ou troca o preset de equalização do servidor.
+
+        A troca vale a partir do próximo trecho de áudio da faixa atual, sem reiniciar
+        a reprodução, e continua valendo para as próximas faixas.
+        """
+        play_cog = self.bot.get_cog('Play')
+        if not play_cog or not ctx.guild:
+            return
+        player = play_cog.players.get(ctx.guild.id)
+        if player.dsp is None:
+            return await ctx.send(embed=equalizer_unavailable_embed())
+
+        if preset is None:
+            return await ctx.send(embed=equalizer_embed(player.dsp.preset, EQ_PRESETS))
+        preset = preset.lower()
+        if preset not in EQ_PRESETS:
+            return await ctx.send(embed=invalid_preset_embed(EQ_PRESETS))
+
+        await player.set_equalizer(preset)
+        await ctx.send(embed=equalizer_updated_embed(preset))
+
+def setup(bot):
+    bot.add_cog(Equalizer(bot))
@@ -92,10 +92,8 @@ class Join(commands.Cog):
             channel = ctx.author.voice.channel
             # Connect the bot to the voice channel.
             await channel.connect()
-            vc = ctx.voice_client
-            vc.just_connected = True
-            # Start/Restar the timer on new music play
-            self.inactivity.start_inactivity_task(channel=ctx.channel)
+            # Disconnect automatically if nothing starts playing
+            self.inactivity.arm_idle(ctx.guild.id, channel=ctx.channel)
             # Notify the user of a successful connection using a success embed.
             await ctx.send(embed=join_success_embed(channel))
             
@@ -1,4 +1,3 @@
-import os  # Provides operating system-related functions such as file removal
 import disnake  # Discord API wrapper for Python
 from disnake.ext import commands  # Framework for creating commands and cogs
 import utils.queue_manager as qm  # Module for managing the music queue
@@ -26,7 +25,7 @@ class Leave(commands.Cog):
 
     async def cleanup_voice_resources(self, vc):
         """
-        Stops playback, cleans up downloaded files, clears the music queue, and disconnects the bot.
+        Stops playback, clears the music queue, and disconnects the bot.
         
         Args:
             vc: The voice client instance representing the current voice connection.
@@ -34,21 +33,21 @@ class Leave(commands.Cog):
         if vc is None:
             return
 
+        # Cancel the disconnect deadline since the bot is leaving.
+        self.inactivity.forget(vc.guild.id)
+
+        # Stop any playlist that is still being added to the queue and detach the guild's player,
+        # so the track-end callback of the stopped track neither recreates the queue nor arms a deadline.
+        if play_cog := self.bot.get_cog('Play'):
+            play_cog.cancel_ingestion(vc.guild.id)
+            play_cog.players.remove(vc.guild.id)
+
         # Stop the audio playback and release audio resources.
+        # A downloaded file is unpinned by the source's cleanup and stays in the audio cache.
         vc.stop()
-        if vc.source:
-            print('aaaaaaaaaa')
-            try:
-                # If the source has an associated filename, remove the downloaded file.
-                if vc.source.filename.startswith('youtube') and vc.source.filename:
-                    print(vc.source.filename)
-                    os.remove(vc.source.filename)
-            except Exception as e:
-                print(f"Error while removing file: {e}")
 
-        # Clear the music queue and any history of played tracks.
-        qm.music_queue.clear()
-        qm.clear_played()
+        # Drop this guild's music queue and history of played tracks.
+        qm.registry.remove(vc.guild.id)
 
         # Disconnect the bot from the voice channel, forcing disconnection.
         await vc.disconnect(force=True)
@@ -58,7 +57,7 @@ class Leave(commands.Cog):
     async def leave(self, ctx):
         """
         Command to disconnect the bot from the voice channel, stop streaming,
-        clear the queue, and remove any downloaded files.
+        and clear the queue.
         
         Args:
             ctx: The command context.
@@ -68,8 +67,6 @@ class Leave(commands.Cog):
             await ctx.send(embed=not_connected_embed())
         else:
             await self.cleanup_voice_resources(vc)
-            # Cancel the inactivity timer since the bot is leaving.
-            self.inactivity.cancel_inactivity_task()
             await ctx.send(embed=success_embed())
 
     @commands.Cog.listener()
@@ -90,8 +87,8 @@ class Leave(commands.Cog):
             # If the bot was connected and is now disconnected.
             if before.channel is not None and after.channel is None:
                 await self.cleanup_voice_resources(before.channel.guild.voice_client)
-                # Cancel the inactivity timer because the bot is no longer connected.
-                self.inactivity.cancel_inactivity_task()
+                # Cancel the disconnect deadline because the bot is no longer connected.
+                self.inactivity.forget(before.channel.guild.id)
 
 def setup(bot):
     """
@@ -2,6 +2,7 @@ import disnake
 from disnake.ext import commands
 import os
 import lyricsgenius
+from utils.blocking import run_blocking
 from embeds.music.lyrics_embed import (
     lyrics_found_embed,
     lyrics_not_found_embed,
@@ -38,7 +39,8 @@ class Lyrics(commands.Cog):
         await ctx.send(f"🔍 Buscando a letra completa de **{song}**...")
 
         try:
-            found_song = genius.search_song(song)
+            # A busca no Genius é bloqueante; roda no pool de threads próprio
+            found_song = await run_blocking('genius', genius.search_song, song)
             if not found_song:
                 return await ctx.send(embed=lyrics_not_found_embed(song))
             
@@ -18,6 +18,8 @@ class Pause(commands.Cog):
             return await ctx.send(embed=not_playing_embed())
 
         ctx.voice_client.pause()
+        if play_cog := self.bot.get_cog('Play'):
+            play_cog.players.get(ctx.guild.id).state.pause()
         await ctx.send(embed=paused_embed())
 
 def setup(bot):
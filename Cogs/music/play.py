@@ -1,4 +1,4 @@
-import concurrent.futures  # For executing blocking operations using a thread pool
+import logging  # For reporting playback fallbacks and timings
 import os  # For file system operations
 import time  # For tracking playback time
 import disnake  # Discord API wrapper for Python
@@ -8,10 +8,22 @@ from dotenv import load_dotenv  # To load environment variables from a .env file
 from disnake.ext import commands  # Command framework for creating cogs (extensions) for Discord bots
 from spotipy import Spotify  # Spotify API client
 from spotipy.oauth2 import SpotifyClientCredentials  # Spotify client credentials authentication
-from utils.queue_manager import add_to_queue, get_next, add_to_played  # Utility functions for managing the music queue
+from utils.queue_manager import get_queue, registry  # Per-guild music queue registry
+from utils.track import Track  # Compact, immutable track record stored in queues and history
+from utils.metadata_cache import metadata_cache  # Shared LRU+TTL cache of yt-dlp extraction results
+from utils.audio_cache import audio_cache  # Disk cache of downloaded audio files (LRU with a byte budget)
+from utils.blocking import run_blocking  # Runs blocking Spotify/FFmpeg calls in dedicated thread pools
+from utils.spotify_mapping import spotify_mapping, spotify_track_id  # Persistent Spotify track -> YouTube video mapping
 from main import inactivity_handler  # Inactivity tracking system for automatic disconnection
+from extra_modules.music.prefetcher import Prefetcher  # Background resolver for upcoming queued tracks
+from extra_modules.music.guild_player import GuildPlayer, GuildPlayers  # Per-guild playback with its own lock and state
+from extra_modules.music.ytdl_service import ytdl_service, COOKIES_FILE  # Shared yt-dlp extraction service
+from extra_modules.music.spotify_resolver import PlaylistResolver, fetch_playlist_items  # Concurrent Spotify-to-YouTube resolution
+from extra_modules.music.progress_reporter import ProgressReporter  # Debounced playlist progress message
+from extra_modules.music.audio_pipeline import DEFAULT_VOLUME, needs_pcm, open_ffmpeg  # Opus passthrough or PCM FFmpeg sources
+from extra_modules.music.dsp import DSPSource, db_to_gain  # NumPy volume, loudness and equalizer stage
+from extra_modules.music.loudness_analyzer import loudness_analyzer  # Cached per-track normalization gains
 from embeds.music.play_embed import (
-    success_playing_now_embed,
     voice_channel_error_embed,
     already_connected_embed,
     connection_failed_embed,
@@ -19,9 +31,9 @@ from embeds.music.play_embed import (
     youtube_not_found_embed,
     track_added_embed,
     download_error_embed,
-    playback_error_embed,
     empty_playlist_embed,
     added_playlist_tracks_embed,
+    playlist_progress_embed,
     processing_spotify_playlist,
     processing_youtube_playlist
 )
@@ -29,19 +41,17 @@ from embeds.music.play_embed import (
 # Load environment variables from the .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
 start_time = time.time()  # Record the start time for tracking purposes
 
 # ======================
 # INITIAL CONFIGURATIONS
 # ======================
 
-# Define the project root by going up two directories from the current file's directory
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-# Construct the path to the cookies file
-cookies_file = os.path.join(project_root, 'cookies.txt')
-# Raise an error if the cookies file does not exist
-if not os.path.isfile(cookies_file):
-    raise FileNotFoundError(f'Arquivo de cookies não encontrado: {cookies_file}')
+# Raise an error if the cookies file shared by the extraction service does not exist
+if not os.path.isfile(COOKIES_FILE):
+    raise FileNotFoundError(f'Arquivo de cookies não encontrado: {COOKIES_FILE}')
 
 # ======================
 # SPOTIFY CONFIGURATION
@@ -54,78 +64,181 @@ sp = Spotify(auth_manager=SpotifyClientCredentials(
 ))
 
 # ======================
-# YT-DLP CONFIGURATION
+# PLAYBACK CONFIGURATION
 # ======================
 
-# Options for yt-dlp to specify format, file naming, and other preferences
-ytdl_format_options = {
-    'format': 'bestaudio/best',
-    'outtmpl': '%(extractor)s-%(id)s-%(title)s.%(ext)s',
-    'restrictfilenames': True,
-    'noplaylist': False,
-    'nocheckcertificate': True,
-    'ignoreerrors': False,
-    'logtostderr': False,
-    'quiet': True,
-    'no_warnings': True,
-    'default_search': 'auto',
-    'source_address': '0.0.0.0',  # Bind to IPv4 address
-    'cookiefile': cookies_file  # Use the cookies file for authenticated requests
+# Options for ffmpeg when reading a remote stream; reconnect flags are input options
+ffmpeg_stream_options = {
+    'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5',
+    'options': '-vn'
 }
-
-# Options for ffmpeg to ensure proper streaming and reconnection behavior
-ffmpeg_options = {
-    'options': '-vn -reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5'
+# Options for ffmpeg when reading a downloaded file
+ffmpeg_file_options = {
+    'options': '-vn'
 }
 
-# Initialize yt-dlp with the provided options
-ytdl = youtube_dlp.YoutubeDL(ytdl_format_options)
-# Create a thread pool executor with a maximum of 4 workers for yt-dlp tasks
-yt_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+# Playback mode: 'stream' pipes the direct audio URL to FFmpeg (falling back to a
+# download if the stream is rejected); 'download' always downloads the file first
+PLAYBACK_MODE = os.getenv('PLAYBACK_MODE', 'stream').lower()
+# Seconds to wait for the first audio frame before a stream is considered rejected
+STREAM_START_TIMEOUT = float(os.getenv('STREAM_START_TIMEOUT', '15'))
+# Number of entries flat-extracted per page when ingesting a YouTube playlist
+PLAYLIST_PAGE_SIZE = int(os.getenv('PLAYLIST_PAGE_SIZE', '100'))
+
+async def iter_playlist_pages(url, *, page_size=PLAYLIST_PAGE_SIZE):
+    """
+    Yields a playlist page by page as tuples (playlist_info, entries).
+    Each page is flat-extracted by the extraction service, so the first tracks
+    can be queued long before the whole playlist has been read.
+    """
+    start = 1
+    while True:
+        info = await ytdl_service.playlist_page(url, start, page_size)
+        entries = list(info.get('entries') or [])
+        yield info, [entry for entry in entries if entry]
+        if len(entries) < page_size:
+            return
+        start += page_size
 
 # ======================
 # AUDIO CLASS: YTDLSource
 # ======================
 
-class YTDLSource(disnake.PCMVolumeTransformer):
+class YTDLSource(disnake.AudioSource):
     """
-    A class that wraps an audio source for playback in Discord.
-    Extends PCMVolumeTransformer to allow volume control.
+    The audio source of one track, with its metadata.
+
+    At volume 1.0 FFmpeg hands out Opus packets that are sent to Discord as they are
+    (Opus tracks are not even decoded). Only a different volume, a loudness gain or an
+    equalizer needs the PCM path, where FFmpeg decodes the audio, the guild's DSPChain
+    (or PCMVolumeTransformer without NumPy) processes every frame and disnake encodes it again.
     """
-    def __init__(self, source, *, data, volume=0.5, original_url=None, filename=None):
-        # Initialize the parent class with the audio source and volume
-        super().__init__(source, volume)
+    def __init__(self, source, *, data, volume=DEFAULT_VOLUME, original_url=None, filename=None, chain=None, gain_db=0.0):
+        self.original = source  # FFmpeg source, primed ahead of playback
+        self.chain = chain  # The guild's DSPChain, also used if the track is reopened on the PCM path
+        self.gain_db = gain_db  # Loudness normalization gain of the track
+        # Processes the decoded audio; Opus sources are played without any processing
+        if source.is_opus():
+            self.transformer = None
+        elif chain is not None:
+            self.transformer = DSPSource(source, chain, gain_db=gain_db)
+        else:
+            self.transformer = disnake.PCMVolumeTransformer(source, volume * db_to_gain(gain_db))
+        self._volume = volume
         self.data = data  # Store metadata extracted from yt-dlp
         self.title = data.get('title')  # Track title
         self.duration = data.get('duration')  # Track duration in seconds
         self.url = data.get('url')  # URL of the audio stream
         self.original_url = original_url or self.url  # Original URL provided
-        self.filename = filename  # Local filename if the track was downloaded
+        self.filename = filename  # Local file in the audio cache if the track was downloaded (pinned until cleanup)
         self.start_time = None  # Time when playback starts
+        self.track = Track.from_info(data, url=self.original_url)  # Compact record kept in the history
+
+    @property
+    def volume(self):
+        """Volume of the track (1.0 is the original level)."""
+        return self._volume
+
+    @volume.setter
+    def volume(self, value):
+        # An Opus source cannot be scaled; GuildPlayer.set_volume reopens it on the PCM path
+        self._volume = max(value, 0.0)
+        if isinstance(self.transformer, DSPSource):
+            self.transformer.volume = self._volume  # Ramped by the chain, which applies the gain itself
+        elif self.transformer:
+            self.transformer.volume = self._volume * db_to_gain(self.gain_db)
+
+    @property
+    def position(self):
+        """Seconds of the track played so far."""
+        return self.original.position
+
+    def read(self):
+        return (self.transformer or self.original).read()
+
+    def is_opus(self):
+        return self.original.is_opus()
+
+    def cleanup(self):
+        """
+        Stops FFmpeg and unpins the downloaded file, which stays in the audio cache
+        for repeat plays. Safe to call more than once.
+        """
+        self.original.cleanup()
+        if self.filename:
+            filename, self.filename = self.filename, None
+            audio_cache.release(filename)
 
     @classmethod
-    async def from_url(cls, url, *, loop=None, stream=False):
+    async def from_url(cls, url, *, stream=False, volume=DEFAULT_VOLUME, chain=None):
         """
         Asynchronously creates a YTDLSource instance from a URL.
-        Uses a thread pool to run the blocking yt-dlp extraction.
+        Streams reuse a still-valid cached stream URL, so no extraction is needed;
+        otherwise the extraction service resolves (or downloads) the track and caches the result.
         """
-        loop = loop or asyncio.get_event_loop()
-        # Run yt-dlp extraction in a separate thread
-        data = await loop.run_in_executor(
-            yt_executor,
-            lambda: ytdl.extract_info(url, download=not stream)
-        )
-        # If data contains a playlist, select the first entry
-        if 'entries' in data:
-            data = data['entries'][0]
-        # Prepare filename if not streaming
-        filename = ytdl.prepare_filename(data) if not stream else None
+        if stream:
+            data, filename = await ytdl_service.resolve(url, require_stream=True), None
+        else:
+            data, filename = await ytdl_service.download(url)
+        return cls.from_data(data, url=url, filename=filename, volume=volume, chain=chain)
+
+    @classmethod
+    def from_data(cls, data, *, url, filename=None, volume=DEFAULT_VOLUME, start=0.0, chain=None, gain_db=None):
+        """
+        Creates a YTDLSource from already resolved info: plays the local file if one
+        is given (the source takes over its audio cache pin), otherwise streams the direct audio URL.
+        The track's loudness normalization gain is read from the loudness cache unless given.
+        The Opus path is used unless the volume, gain or the guild's equalizer need the audio decoded to PCM.
+        """
+        if gain_db is None:
+            gain_db = loudness_analyzer.gain_db(data)
         return cls(
-            disnake.FFmpegPCMAudio(filename or data['url'], **ffmpeg_options),
+            open_ffmpeg(
+                filename or data['url'],
+                pcm=needs_pcm(volume, gain_db=gain_db, dsp=chain),
+                acodec=data.get('acodec'),
+                start=start,
+                **(ffmpeg_file_options if filename else ffmpeg_stream_options)
+            ),
             data=data,
+            volume=volume,
             original_url=url,
-            filename=filename
+            filename=filename,
+            chain=chain,
+            gain_db=gain_db
+        )
+
+    def reopen(self, *, volume, start=None):
+        """
+        Creates a source for the same track that continues from the current position (or
+        seeks to `start`), on the path the volume and the equalizer require (e.g. when they
+        change during an Opus track). FFmpeg is restarted with -ss on the downloaded file or
+        the already resolved stream URL, so no yt-dlp extraction is needed.
+        The new source holds its own pin of the downloaded file.
+        """
+        if self.filename:
+            audio_cache.acquire(self.filename)
+        source = YTDLSource.from_data(
+            self.data, url=self.original_url, filename=self.filename, volume=volume,
+            start=self.position if start is None else start,
+            chain=self.chain,
+            gain_db=self.gain_db
         )
+        source.track = self.track
+        return source
+
+    async def prime(self, *, timeout=None):
+        """
+        Reads the first audio frame in the FFmpeg thread pool.
+        Returns False if FFmpeg produced no audio or did not start within the timeout.
+        """
+        try:
+            return await asyncio.wait_for(
+                run_blocking('ffmpeg', self.original.prime),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return False
 
 # ======================
 # MAIN MUSIC COG (OPTIMIZED)
@@ -137,11 +250,26 @@ class Play(commands.Cog):
     """
     def __init__(self, bot):
         self.bot = bot
-        self.first_channel = None  # The first channel used for playback (for inactivity tracking)
         self.inactivity = inactivity_handler  # Handler for inactivity to auto-disconnect
-        self.last_valid_ctx = None  # Last valid context used for commands
-        self.play_lock = asyncio.Lock()  # Lock to avoid race conditions in playback
-        self.info_cache = {}  # Cache for track metadata to reduce redundant downloads
+        # One player per guild, advanced on enqueue, track-end and error events;
+        # state changes arm the inactivity deadlines
+        self.players = GuildPlayers(lambda guild_id: GuildPlayer(
+            guild_id,
+            create_source=self.create_player,
+            voice_client=lambda: self.voice_client(guild_id),
+            on_state_change=self.inactivity.on_playback_state
+        ))
+        # Resolves the next queued tracks of every guild while the current one plays
+        self.prefetcher = Prefetcher(
+            resolve=lambda url: ytdl_service.resolve(url, require_stream=PLAYBACK_MODE == 'stream'),
+            download=self.prefetch_download,
+            release=audio_cache.release
+        )
+        registry.add_listener(self.prefetcher.on_queue_changed)
+        registry.add_listener(self.on_queue_changed)
+        # Resolves Spotify playlist tracks to YouTube URLs with bounded parallelism
+        self.playlist_resolver = PlaylistResolver(self.search_youtube_url, mapping=spotify_mapping)
+        self.ingestions = {}  # guild_id -> task adding a playlist to that guild's queue
         # Dictionary containing URLs for embed icons used in various messages
         self.embed_icons = {
             'error': 'https://i.imgur.com/7F6G3ZZ.png',
@@ -149,6 +277,17 @@ class Play(commands.Cog):
             'playlist': 'https://i.imgur.com/5XyWZ3J.png'
         }
 
+    def cog_unload(self):
+        """
+        Stops prefetching when the cog is unloaded.
+        """
+        registry.remove_listener(self.prefetcher.on_queue_changed)
+        registry.remove_listener(self.on_queue_changed)
+        self.prefetcher.cancel_all()
+        for task in self.ingestions.values():
+            task.cancel()
+        self.ingestions.clear()
+
     async def ensure_no_other_bot(self, ctx):
         """
         Checks if there is another bot in the user's voice channel.
@@ -161,14 +300,21 @@ class Play(commands.Cog):
                     return False
         return True
 
-    def update_context(self, ctx):
+    def voice_client(self, guild_id):
         """
-        Updates the last valid command context.
-        Also updates context for the QueueWatcher cog if it exists.
+        Returns the voice client of a guild, or None if the bot is not connected there.
         """
-        self.last_valid_ctx = ctx
-        if watcher := self.bot.get_cog('QueueWatcher'):
-            watcher.last_ctx = ctx
+        guild = self.bot.get_guild(guild_id)
+        return guild.voice_client if guild else None
+
+    def bind_channel(self, ctx):
+        """
+        Makes the command's text channel the one that receives the guild's playback
+        and disconnect messages.
+        """
+        if ctx.guild:
+            self.players.get(ctx.guild.id).notifier.bind(ctx.channel)
+            self.inactivity.set_channel(ctx.guild.id, ctx.channel)
 
     @commands.command(aliases=['p', 'playmusic'])
     @commands.has_any_role(1137297683862802503, 1335963261878665229, 1336673321223192659, 739241340189278279, 733923101506666547, 811070168163680286)
@@ -177,7 +323,7 @@ class Play(commands.Cog):
         Main command for playing music.
         If no query is provided, it checks the queue and starts playback.
         """
-        self.update_context(ctx)
+        self.bind_channel(ctx)
 
         # Ensure the user is connected to a voice channel
         if not ctx.author.voice or not ctx.author.voice.channel:
@@ -194,8 +340,7 @@ class Play(commands.Cog):
                     return await ctx.send(embed=connection_failed_embed())
             
             # If nothing is playing, start the next track in the queue
-            if not ctx.voice_client.is_playing():
-                await self.play_next(ctx)
+            await self.play_next(ctx)
             return
 
         async with ctx.typing():
@@ -207,23 +352,20 @@ class Play(commands.Cog):
                 if ctx.voice_client is None:
                     return await ctx.send(embed=connection_failed_embed())
 
-            vc = ctx.voice_client
-            vc.just_connected = True  # Flag to indicate recent connection
-
             try:
                 # Handle different types of queries based on URL content
                 if "spotify.com" in query:
                     await self.handle_spotify(ctx, query)
                 elif "youtube.com/playlist" in query:
-                    await self.add_youtube_playlist(ctx, query)
+                    await self.run_ingestion(ctx, self.add_youtube_playlist(ctx, query))
                 else:
                     await self.handle_youtube(ctx, query)
             except Exception as e:
                 # Send an error embed if any exception occurs during processing
                 await ctx.send(embed=download_error_embed(str(e)))
 
-        # If no source is set, attempt to play the next track
-        if not ctx.voice_client.source:
+        # Enqueued tracks start on their own; this only covers a guild that was left idle
+        if ctx.voice_client and not ctx.voice_client.source:
             await self.play_next(ctx)
 
     async def handle_spotify(self, ctx, query):
@@ -231,17 +373,24 @@ class Play(commands.Cog):
         Processes Spotify links.
         If a playlist is detected, calls the playlist handler;
         otherwise, searches for a track and processes it.
+        Tracks resolved before are taken from the mapping store without any API or search call.
         """
         if "playlist" in query:
-            await self.add_spotify_playlist(ctx, query)
+            await self.run_ingestion(ctx, self.add_spotify_playlist(ctx, query))
         else:
-            track_info = self.get_spotify_track_info(query)
+            track_id = spotify_track_id(query)
+            if track_id and (mapped := await spotify_mapping.fetch(track_id)):
+                return await self.process_track(ctx, mapped.url, mapped.title)
+
+            track_info = await run_blocking('spotify', self.get_spotify_track_info, query)
             if not track_info:
                 return await ctx.send(embed=spotify_not_found_embed())
             title, search_query = track_info
-            youtube_url = self.get_youtube_url(search_query)
+            youtube_url = await self.search_youtube_url(search_query)
             if not youtube_url:
                 return await ctx.send(embed=spotify_not_found_embed())
+            if track_id:
+                spotify_mapping.save(track_id, youtube_url, title)
             await self.process_track(ctx, youtube_url, title)
 
     async def handle_youtube(self, ctx, query):
@@ -252,7 +401,7 @@ class Play(commands.Cog):
         if "youtube.com" in query or "youtu.be" in query:
             url = query
         else:
-            url = self.get_youtube_url(query)
+            url = await self.search_youtube_url(query)
             if not url:
                 return await ctx.send(embed=youtube_not_found_embed())
         await self.process_track(ctx, url)
@@ -260,170 +409,230 @@ class Play(commands.Cog):
     async def process_track(self, ctx, url: str, title: str = None):
         """
         Processes a single track.
-        Extracts track info using yt-dlp, caches it, adds the track to the queue,
-        and initiates playback if nothing is playing.
+        Extracts track info using yt-dlp, caches it and adds the track to the queue;
+        the enqueue event starts playback if the guild is idle.
         """
         try:
-            # Check if the track info is already cached
-            if url in self.info_cache:
-                info = self.info_cache[url]
-            else:
-                loop = asyncio.get_event_loop()
-                # Extract track information in a separate thread
-                info = await loop.run_in_executor(
-                    yt_executor,
-                    lambda: ytdl.extract_info(url, download=False)
-                )
-                self.info_cache[url] = info
-
-            # If the result is a playlist, take the first entry
-            if "entries" in info:
-                info = info["entries"][0]
-
-            track_title = title or info.get('title', 'Unknown Track')
-            add_to_queue({"original_url": url, "title": track_title})
-            global x  # Global message variable used to update the user
-            x = await ctx.send(embed=track_added_embed(track_title))
-            
-            # If nothing is playing, start the next track
-            if not ctx.voice_client.is_playing():
-                await self.play_next(ctx)
+            # Resolve the track info through the shared metadata cache
+            info = await ytdl_service.resolve(url)
+
+            track = Track.from_info(info, url=url, title=title, requester=ctx.author.id)
+            track_title = track.title
+            get_queue(ctx.guild.id).add_to_queue(track)
+            await ctx.send(embed=track_added_embed(track_title))
 
         except youtube_dlp.utils.DownloadError as e:
             await ctx.send(embed=download_error_embed(str(e)))
 
+    async def run_ingestion(self, ctx, coro):
+        """
+        Runs a playlist ingestion as a task that can be cancelled per guild
+        (by leaving the channel or clearing the queue).
+        Only one ingestion runs per guild; starting a new one cancels the previous.
+        """
+        guild_id = ctx.guild.id
+        self.cancel_ingestion(guild_id)
+        task = asyncio.ensure_future(coro)
+        self.ingestions[guild_id] = task
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            logger.info(f"Playlist ingestion cancelled in guild {guild_id}")
+        finally:
+            if self.ingestions.get(guild_id) is task:
+                del self.ingestions[guild_id]
+
+    def cancel_ingestion(self, guild_id):
+        """
+        Cancels the playlist still being added to a guild's queue, if any.
+        Returns True if an ingestion was cancelled.
+        """
+        task = self.ingestions.pop(guild_id, None)
+        if task and not task.done():
+            task.cancel()
+            return True
+        return False
+
     async def add_spotify_playlist(self, ctx, url):
         """
         Handles adding a Spotify playlist.
-        Retrieves tracks from the playlist, searches for each on YouTube, and adds them to the queue.
+        Fetches every page of the playlist off the event loop, resolves the tracks on YouTube
+        concurrently and adds them to the queue in playlist order as they become available.
         """
-        results = sp.playlist_tracks(url)
-        total_tracks = len(results['items'])
+        tracks = await run_blocking('spotify', fetch_playlist_items, sp, url)
+        total_tracks = len(tracks)
         if total_tracks == 0:
             return await ctx.send(embed=empty_playlist_embed())
 
-        await ctx.send(embed=processing_spotify_playlist(total_tracks=total_tracks))
-        added_count = 0
-        first_track = True
-
-        for item in results['items']:
-            track = item['track']
-            search_query = f"{track['name']} {track['artists'][0]['name']}"
-            youtube_url = self.get_youtube_url(search_query)
-            if youtube_url:
-                try:
-                    # Play immediately if it's the first track and nothing is playing
-                    if first_track and not ctx.voice_client.is_playing():
-                        await self.process_track(ctx, youtube_url, track['name'])
-                        first_track = False
-                    else:
-                        add_to_queue({"original_url": youtube_url, "title": track['name']})
-                        await x.edit(embed=track_added_embed(title=track['name'], artist=track['artists'][0]['name']))
-                    added_count += 1
-                except:
-                    pass
-
-        await ctx.send(embed=added_playlist_tracks_embed(added_count))
+        progress = self.playlist_progress(ctx, 'Spotify', total_tracks)
+        try:
+            await progress.start(processing_spotify_playlist(total_tracks=total_tracks))
+            async for track, youtube_url in self.playlist_resolver.resolve(tracks):
+                if not youtube_url:
+                    progress.skip()
+                    continue
+                # The first enqueued track starts playing right away if the guild is idle
+                result = get_queue(ctx.guild.id).add_many([Track(
+                    title=track['name'],
+                    url=youtube_url,
+                    duration=(track.get('duration_ms') or 0) // 1000,
+                    source='spotify',
+                    requester=ctx.author.id
+                )])
+                if result.rejected:
+                    progress.skip(total_tracks - progress.processed)
+                    break  # The queue is full; stop resolving the remaining tracks
+                progress.advance(current=f"{track['name']} - {track['artists'][0]['name']}")
+            await progress.close()
+        finally:
+            progress.cancel()
+
+        await ctx.send(embed=added_playlist_tracks_embed(progress.added, progress.skipped, progress.elapsed))
     
     async def add_youtube_playlist(self, ctx, url):
         """
-        Handles adding a YouTube playlist.
-        Extracts playlist information and adds each track to the queue.
+        Handles adding a YouTube playlist lazily.
+        The playlist is flat-extracted page by page off the event loop and every entry is
+        queued right away as a lightweight placeholder; its full metadata is only resolved
+        when the prefetcher or play_next reaches it.
         """
-        data = ytdl.extract_info(url, download=False)
-        total_tracks = len(data['entries'])
-        if total_tracks == 0:
-            return await ctx.send(embed=empty_playlist_embed())
+        queue = get_queue(ctx.guild.id)
+        progress = None
 
-        await ctx.send(embed=processing_youtube_playlist(total_tracks=total_tracks))
-        added_count = 0
-        first_track = True
+        try:
+            async for info, entries in iter_playlist_pages(url):
+                if progress is None:
+                    total_tracks = info.get('playlist_count') or len(entries)
+                    if total_tracks == 0:
+                        return await ctx.send(embed=empty_playlist_embed())
+                    progress = self.playlist_progress(ctx, 'YouTube', info.get('playlist_count'))
+                    await progress.start(processing_youtube_playlist(total_tracks=total_tracks))
+
+                tracks = [
+                    Track.from_info(
+                        entry,
+                        url=entry.get('url') or f"https://www.youtube.com/watch?v={entry['id']}",
+                        requester=ctx.author.id
+                    )
+                    for entry in entries
+                ]
+                # The whole page is queued at once; its first entry starts playback through the enqueue event
+                result = queue.add_many(tracks)
+                if result.accepted:
+                    progress.advance(len(result.accepted), current=result.accepted[-1].title)
+                if result.rejected:
+                    progress.skip(len(result.rejected))
+                    break  # The queue is full; stop reading the playlist
+            if progress is None:
+                return
+            await progress.close()
+        finally:
+            if progress is not None:
+                progress.cancel()
 
-        for entry in data['entries']:
-            youtube_url = entry['webpage_url']
-            try:
-                # Play immediately if it's the first track and nothing is playing
-                if first_track and not ctx.voice_client.is_playing():
-                    await self.process_track(ctx, youtube_url)
-                    first_track = False
-                else:
-                    add_to_queue({"original_url": youtube_url, "title": entry['title']})
-                    await x.edit(embed=track_added_embed(title=entry['title']))
-                added_count += 1
-            except:
-                pass
+        await ctx.send(embed=added_playlist_tracks_embed(progress.added, progress.skipped, progress.elapsed))
 
-        await ctx.send(embed=added_playlist_tracks_embed(added_count))
+    def playlist_progress(self, ctx, platform, total):
+        """
+        Creates the progress reporter of a playlist ingestion.
+        Its message is edited in place through the guild's notifier at most once per
+        PROGRESS_UPDATE_INTERVAL, however fast tracks are enqueued.
+        """
+        notifier = self.players.get(ctx.guild.id).notifier
+        notifier.forget('playlist')  # Every ingestion gets its own progress message
+        return ProgressReporter(
+            lambda embed: notifier.update('playlist', embed),
+            lambda progress: playlist_progress_embed(
+                platform,
+                added=progress.added,
+                total=progress.total,
+                skipped=progress.skipped,
+                rate=progress.rate,
+                eta=progress.eta,
+                current=progress.current
+            ),
+            total
+        )
 
-    async def play_next(self, ctx=None):
+    def on_queue_changed(self, queue, event):
         """
-        Plays the next track in the queue.
-        Uses a lock to ensure that only one track is processed at a time.
+        Queue listener: starts playback as soon as a track is enqueued in an idle guild
+        that is connected to a voice channel, and keeps the track a playing guild
+        opened ahead of time in line with its queue.
         """
-        async with self.play_lock:
-            ctx = ctx or self.last_valid_ctx
-            # If no valid context or something is already playing, do nothing
-            if not ctx or ctx.voice_client.is_playing():
-                return
+        if queue.guild_id in self.players:
+            self.players.get(queue.guild_id).on_queue_changed(event)
+        if event != 'add':
+            return
+        player = self.players.get(queue.guild_id)
+        if not player.state.idle or player.voice_client is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Queue changed outside the event loop; nothing to schedule
+        # The player keeps the task referenced until it finishes and logs its failure
+        player.spawn(player.play_next('enqueue'))
 
-            await asyncio.sleep(0.5)  # Small delay to ensure previous track is finished
-            if ctx.voice_client.is_playing():
-                return
+    async def play_next(self, ctx, *, event='command'):
+        """
+        Plays the next track of the command's guild through its GuildPlayer.
 
-            track_info = get_next()  # Get next track from the queue
-            if not track_info:
-                return
+        Args:
+            ctx: The command context; its channel receives the playback messages.
+            event: What triggered the advance, used for the transition latency metrics.
+        """
+        if not ctx.guild:
+            return
+        self.bind_channel(ctx)
+        await self.players.get(ctx.guild.id).play_next(event)
 
-            try:
-                url = track_info["original_url"]
-                # Check if track info is cached; if not, extract and cache it
-                if url in self.info_cache:
-                    info = self.info_cache[url]
-                else:
-                    loop = asyncio.get_event_loop()
-                    info = await loop.run_in_executor(
-                        yt_executor,
-                        lambda: ytdl.extract_info(url, download=False)
-                    )
-                    self.info_cache[url] = info
-
-                # Create a new player source from the URL
-                new_player = await YTDLSource.from_url(url, loop=self.bot.loop, stream=False)
-                new_player.start_time = time.time()
-                
-                # Start playback and set a callback for when the track ends
-                ctx.voice_client.play(
-                    new_player,
-                    after=lambda e: self.bot.loop.create_task(self.on_track_end(ctx, new_player))
-                )
-                
-                duration = new_player.duration or 0
-                await ctx.send(embed=success_playing_now_embed(
-                    current_track=new_player.title,
-                    duration_str=f"{duration//60}:{duration%60:02}",
-                    playing_time="0:00",
-                    current_vol=str(int(new_player.volume * 100)),
-                    is_playing=True
-                ))
-            except Exception as e:
-                # Send a playback error message and try playing the next track
-                await ctx.send(embed=playback_error_embed(str(e)))
-                await self.play_next(ctx)
+    async def prefetch_download(self, url):
+        """
+        Downloads an upcoming track for the prefetcher and starts its loudness analysis,
+        so the track is usually normalized already on its first play.
+        """
+        info, filename = await ytdl_service.download(url)
+        loudness_analyzer.schedule(info, filename)
+        return info, filename
 
-    async def on_track_end(self, ctx, player):
+    async def create_player(self, guild_id, url):
         """
-        Callback function when a track ends.
-        Updates inactivity tracking, cleans up downloaded files, and triggers the next track.
+        Creates the audio source for a track and waits for its first frame.
+        A file downloaded ahead of time by the prefetcher is used directly.
+        In stream mode the direct audio URL is piped to FFmpeg; if FFmpeg rejects it,
+        the cached stream URL is dropped and the track is downloaded instead.
+        The guild's volume and equalizer decide between the Opus passthrough and the PCM path.
+        Tracks without a loudness measurement are analyzed in the background for their next plays.
+        Returns the player and the mode that was actually used ('prefetched', 'stream' or 'download').
         """
-        self.inactivity.first_channel = ctx.channel  # Set the channel for inactivity monitoring
-        add_to_played(player)  # Mark the track as played
-        # Remove the downloaded file if it exists
-        if player.filename and os.path.exists(player.filename):
-            try:
-                os.remove(player.filename)
-            except Exception as e:
-                print(f"Erro ao limpar arquivo: {str(e)}")
-        await self.play_next(ctx)
+        guild_player = self.players.get(guild_id)
+        volume, chain = guild_player.volume, guild_player.dsp
+        prefetched = self.prefetcher.take_download(guild_id, url)
+        if prefetched:
+            info, filename = prefetched
+            player = YTDLSource.from_data(info, url=url, filename=filename, volume=volume, chain=chain)
+            await player.prime()
+            loudness_analyzer.schedule(player.data, player.filename)
+            return player, 'prefetched'
+
+        if PLAYBACK_MODE == 'stream':
+            player = await YTDLSource.from_url(url, stream=True, volume=volume, chain=chain)
+            if await player.prime(timeout=STREAM_START_TIMEOUT):
+                loudness_analyzer.schedule(player.data)
+                return player, 'stream'
+
+            # The stream was rejected (expired URL, 403, ...): fall back to downloading
+            player.cleanup()
+            metadata_cache.invalidate_stream(url)
+            logger.warning(f"Stream rejected for {url}; falling back to download")
+
+        player = await YTDLSource.from_url(url, stream=False, volume=volume, chain=chain)
+        await player.prime()
+        loudness_analyzer.schedule(player.data, player.filename)
+        return player, 'download'
 
     def get_spotify_track_info(self, url):
         """
@@ -436,14 +645,16 @@ class Play(commands.Cog):
         except:
             return None
 
-    def get_youtube_url(self, query):
+    async def search_youtube_url(self, query):
         """
         Searches YouTube for the given query and returns the URL of the first result.
+        The search already extracts the video, so queueing it afterwards is a cache hit.
         """
         try:
-            results = ytdl.extract_info(f"ytsearch:{query}", download=False)['entries']
+            results = await ytdl_service.search(query)
             return results[0]['webpage_url'] if results else None
-        except:
+        except Exception as e:
+            logger.warning(f"YouTube search failed for {query!r}: {str(e)}")
             return None
 
 def setup(bot):
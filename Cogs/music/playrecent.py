@@ -1,6 +1,6 @@
 from disnake.ext import commands  # Import commands for creating bot commands and cogs
 import disnake  # Discord API library
-from utils.queue_manager import get_recent_tracks, clear_played, add_to_queue  # Import functions to manage the playback queue and history
+from utils.queue_manager import get_queue  # Per-guild music queue registry
 from embeds.music.playrecent_embed import (
     empty_history_embed,  # Embed to indicate that no track history exists
     success_add_recenplayed_embed  # Embed to confirm that history was re-added to the queue
@@ -33,33 +33,27 @@ class PlayRecent(commands.Cog):
         Args:
             ctx: The command context from which the command is invoked.
         """
+        queue = get_queue(ctx.guild.id)
+
         # Retrieve the list of recently played tracks
-        recent_tracks = get_recent_tracks()
+        recent_tracks = queue.get_recent_tracks()
         
         # If no recent tracks exist, send an embed notifying the user
         if not recent_tracks:
             return await ctx.send(embed=empty_history_embed())
         
-        # Reverse the order to ensure the oldest track is added first
-        for track in reversed(recent_tracks):
-            add_to_queue(track)  # Add each track back into the queue
+        # Reverse the order to ensure the oldest track is added first; tracks beyond the queue limit are dropped
+        queue.add_many(reversed(recent_tracks))
         
-        clear_played()  # Clear the history after re-adding tracks to the queue
+        queue.clear_played()  # Clear the history after re-adding tracks to the queue
         
         # Send a confirmation embed showing that the recent tracks were added successfully
         await ctx.send(embed=success_add_recenplayed_embed(recent_tracks=recent_tracks))
         
-        # Get the Play cog to update the global command context and check if playback should begin
+        # Start playback through the Play cog if the guild is idle (it also binds this channel for messages)
         play_cog = self.bot.get_cog('Play')
         if play_cog:
-            # Update the last valid context in the Play cog, if possible
-            if hasattr(play_cog, "update_context"):
-                play_cog.update_context(ctx)
-            
-            # If the bot's voice client is connected but not currently playing, trigger the next track
-            voice_client = ctx.voice_client
-            if voice_client and not voice_client.is_playing():
-                await play_cog.play_next(ctx)
+            await play_cog.play_next(ctx)
 
 def setup(bot):
     """Register the PlayRecent cog with the bot."""
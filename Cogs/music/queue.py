@@ -1,6 +1,8 @@
 import disnake  # Discord API library for Python
 from disnake.ext import commands  # Bot command framework for creating cogs and commands
-from utils.queue_manager import show_queue, get_current_track  # Functions to retrieve the current queue and track
+from typing import Optional  # Type hint for the optional current track
+from utils.queue_manager import get_queue  # Per-guild music queue registry
+from utils.track import Track  # Compact, immutable track record stored in queues and history
 from embeds.music.queue_embed import (
     create_queue_embed,  # Function to create an embed that displays the music queue
     create_error_embed   # Function to create an embed that displays error messages
@@ -13,12 +15,12 @@ class QueueView(disnake.ui.View):
     This view creates interactive buttons that allow users to navigate through different pages of the queue.
     It also supports deleting the message with a dedicated button.
     """
-    def __init__(self, queue_pages: list, current_track: dict, timeout: float = 60):
+    def __init__(self, queue_pages: list, current_track: Optional[Track], timeout: float = 60):
         """
         Initialize the QueueView.
         
-        :param queue_pages: List of pages, each page being a sub-list of queue entries.
-        :param current_track: Dictionary containing metadata of the currently playing track.
+        :param queue_pages: List of pages, each page being a sub-list of queued Track records.
+        :param current_track: Track record of the currently playing track (None if nothing is playing).
         :param timeout: Duration in seconds after which the view will become inactive.
         """
         super().__init__(timeout=timeout)
@@ -101,17 +103,9 @@ class Queue(commands.Cog):
         :param ctx: Command context representing the invocation details.
         """
         try:
-            current_track = get_current_track() or {}
-            raw_queue = show_queue() or []
-            
-            # Prepare a list of dictionaries with track title and URL for display
-            queue_list = [
-                {
-                    'title': track.get('title', 'Título desconhecido'),
-                    'original_url': track.get('original_url', '')
-                }
-                for track in raw_queue
-            ]
+            guild_queue = get_queue(ctx.guild.id)
+            current_track = guild_queue.get_current_track()
+            queue_list = guild_queue.show_queue()
             
             # Define the number of items per page
             page_size = 10
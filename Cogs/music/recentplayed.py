@@ -1,6 +1,6 @@
 import disnake  # Importing the Disnake library for Discord API interactions
 from disnake.ext import commands  # Importing the commands extension from Disnake
-from utils.queue_manager import get_recent_tracks  # Function to retrieve recently played tracks
+from utils.queue_manager import get_queue  # Per-guild music queue registry
 from embeds.music.recentplayed_embed import (
     create_history_embed,  # Function to create an embed displaying the history
     create_history_empty_embed,  # Function to create an embed indicating an empty history
@@ -86,7 +86,7 @@ class RecentPlayed(commands.Cog):
         :param ctx: Command context representing the invocation details.
         """
         try:
-            recent_tracks = get_recent_tracks()  # Fetch recently played tracks
+            recent_tracks = get_queue(ctx.guild.id).get_recent_tracks()  # Fetch this guild's recently played tracks
             
             if not recent_tracks:
                 # If no tracks have been played recently, send an embed indicating an empty history
@@ -23,6 +23,8 @@ class Resume(commands.Cog):
         # Check if the audio is currently paused
         if ctx.voice_client.is_paused():
             ctx.voice_client.resume()  # Resume playback
+            if play_cog := self.bot.get_cog('Play'):
+                play_cog.players.get(ctx.guild.id).state.resume()  # Keep the playback state in sync
             await ctx.send(embed=resumed_embed())
         else:
             await ctx.send(embed=not_paused_embed())
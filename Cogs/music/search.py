@@ -1,8 +1,9 @@
 import asyncio
 import disnake
 from disnake.ext import commands
-import yt_dlp as youtube_dlp
-from utils.queue_manager import add_to_queue, get_next  # Functions for managing the queue
+from utils.queue_manager import get_queue  # Per-guild music queue registry
+from utils.track import Track  # Compact, immutable track record stored in queues and history
+from extra_modules.music.ytdl_service import ytdl_service  # Shared yt-dlp extraction service
 from embeds.music.search_embeds import (
     voice_channel_error_embed,  # Embed for error when user is not in a voice channel
     youtube_not_found_embed,    # Embed for when no YouTube results are found
@@ -15,22 +16,6 @@ from embeds.music.search_embeds import (
     success_embed               # Embed for success add
 )
 
-# yt-dlp configuration options for extracting audio from YouTube
-ytdl_format_options = {
-    'format': 'bestaudio/best',                # Select the best available audio quality
-    'outtmpl': '%(extractor)s-%(id)s-%(title)s.%(ext)s',  # Template for output filename
-    'restrictfilenames': True,                 # Restrict filenames to ASCII characters and avoid special characters
-    'noplaylist': False,                       # Allow playlists to be processed
-    'nocheckcertificate': True,                # Do not check SSL certificates
-    'ignoreerrors': False,                     # Stop on errors
-    'logtostderr': False,                      # Do not log messages to stderr
-    'quiet': True,                             # Suppress verbose output
-    'no_warnings': True,                       # Suppress warnings
-    'default_search': 'auto',                  # Automatically search if the input is not a URL
-    'source_address': '0.0.0.0'                  # Bind to an IPv4 address to avoid potential issues with IPv6
-}
-ytdl = youtube_dlp.YoutubeDL(ytdl_format_options)
-
 class Search(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -54,8 +39,8 @@ class Search(commands.Cog):
 
         # Perform the search using "ytsearch3:" to obtain 3 results from YouTube
         try:
-            data = ytdl.extract_info(f"ytsearch3:{query}", download=False)
-            results = data.get("entries", [])
+            # Every result is cached, so playing the chosen one does not extract it again
+            results = await ytdl_service.search(query, limit=3)
             if not results:
                 return await msg.edit(embed=youtube_not_found_embed())
         except Exception as e:
@@ -97,9 +82,11 @@ class Search(commands.Cog):
 
         # Retrieve the chosen video information
         chosen_video = results[chosen_index]
-        track_title = chosen_video.get("title", "No title")
-        # Add the selected track to the queue
-        add_to_queue({"original_url": chosen_video.get("webpage_url"), "title": track_title})
+        # Playback may start from the enqueue itself, so bind this channel for its messages first
+        if play_cog := self.bot.get_cog('Play'):
+            play_cog.bind_channel(ctx)
+        # Add a compact record of the selected track to the queue
+        get_queue(ctx.guild.id).add_to_queue(Track.from_info(chosen_video, requester=ctx.author.id))
 
         # Clear all reactions from the message
         await msg.clear_reactions()
@@ -0,0 +1,46 @@
+from disnake.ext import commands
+from extra_modules.music.audio_pipeline import format_position, parse_position
+from embeds.music.seek_embed import (
+    seek_success_embed,           # Embed to confirm the new position
+    invalid_position_embed,       # Embed to explain the accepted formats
+    position_out_of_range_embed,  # Embed to indicate a position outside the track
+    seek_failed_embed,            # Embed to indicate that FFmpeg could not start there
+    not_playing_embed             # Embed to indicate that no track is playing
+)
+
+class Seek(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(name="seek", aliases=["goto"])
+    @commands.has_any_role(1137297683862802503, 1335963261878665229, 1336673321223192659, 739241340189278279, 733923101506666547, 811070168163680286)
+    async def seek(self, ctx, position: str = None):
+        """
+        Pula para um ponto da música atual, por exemplo `1:30`, `+15` ou `-10`.
+
+        O FFmpeg é reiniciado nessa posição no arquivo baixado ou na URL do stream já
+        resolvida, sem nova extração do yt-dlp e sem parar a reprodução.
+        """
+        play_cog = self.bot.get_cog('Play')
+        if not play_cog or not ctx.guild:
+            return
+        player = play_cog.players.get(ctx.guild.id)
+        if not ctx.voice_client or player.position is None:
+            return await ctx.send(embed=not_playing_embed())
+        if position is None:
+            return await ctx.send(embed=invalid_position_embed())
+
+        try:
+            target = parse_position(position, player.position)
+        except ValueError:
+            return await ctx.send(embed=invalid_position_embed())
+        duration = player.source.duration
+        if target < 0 or (duration and target >= duration):
+            return await ctx.send(embed=position_out_of_range_embed(format_position(duration or 0)))
+
+        if not await player.seek(target):
+            return await ctx.send(embed=seek_failed_embed())
+        await ctx.send(embed=seek_success_embed(format_position(target), format_position(duration or 0)))
+
+def setup(bot):
+    bot.add_cog(Seek(bot))
@@ -1,6 +1,6 @@
 import asyncio
 from disnake.ext import commands
-from utils.queue_manager import music_queue  # Queue management for music tracks
+from utils.queue_manager import get_queue  # Per-guild music queue registry
 from embeds.music.skip_embeds import (
     not_playing_embed,         # Embed for when no music is playing
     invalid_index_embed,       # Embed for invalid track index
@@ -30,13 +30,15 @@ class Skip(commands.Cog):
             await ctx.send(embed=not_playing_embed())
             return
 
+        queue = get_queue(ctx.guild.id)
+
         # Validate the provided index
-        if index > len(music_queue) or index < 1:
-            await ctx.send(embed=invalid_index_embed(len(music_queue)))
+        if index > queue.queue_length() or index < 1:
+            await ctx.send(embed=invalid_index_embed(queue.queue_length()))
             return
 
         # Remove tracks from the queue up to the specified index
-        del music_queue[:index - 1]
+        queue.skip(index - 1)
 
         # Send confirmation embed and add reaction for voting
         confirmation_message = await ctx.send(embed=confirmation_embed())
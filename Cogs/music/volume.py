@@ -34,7 +34,7 @@ class Volume(commands.Cog):
         if volume is not None:
             if volume < 0 or volume > 100:
                 return await ctx.send(embed=invalid_volume_embed())
-            source.volume = volume / 100.0  # Normalize volume to a 0.0 - 1.0 scale
+            await self.set_volume(ctx, volume / 100.0)  # Normalize volume to a 0.0 - 1.0 scale
             return await ctx.send(embed=volume_updated_embed(volume))
         
         # Interactive mode: no volume value provided; show current volume and allow interactive adjustments
@@ -68,12 +68,12 @@ class Volume(commands.Cog):
             if str(reaction.emoji) == "🔼":
                 # Increase volume by 10%, ensuring it does not exceed 100%
                 current_volume = min(current_volume + 10, 100)
-                source.volume = current_volume / 100.0
+                await self.set_volume(ctx, current_volume / 100.0)
                 await msg.edit(embed=current_volume_embed(current_volume))
             elif str(reaction.emoji) == "🔽":
                 # Decrease volume by 10%, ensuring it does not drop below 0%
                 current_volume = max(current_volume - 10, 0)
-                source.volume = current_volume / 100.0
+                await self.set_volume(ctx, current_volume / 100.0)
                 await msg.edit(embed=current_volume_embed(current_volume))
             elif str(reaction.emoji) == "✅":
                 # Confirm the volume setting and exit the interactive loop
@@ -94,5 +94,16 @@ class Volume(commands.Cog):
         except Exception:
             pass
 
+    async def set_volume(self, ctx, volume):
+        """
+        Changes the guild's volume through its player in the Play cog, which keeps it
+        for the next tracks and switches an Opus passthrough track to the PCM path if needed.
+        """
+        play_cog = self.bot.get_cog('Play')
+        if play_cog:
+            await play_cog.players.get(ctx.guild.id).set_volume(volume)
+        else:
+            ctx.voice_client.source.volume = volume
+
 def setup(bot):
     bot.add_cog(Volume(bot))
@@ -3,6 +3,7 @@ import disnake
 import typing
 from disnake.ext import commands
 from pillow.userinfo_pillow import create_user_info_canvas
+from utils.blocking import run_blocking
 
 class Userinfo(commands.Cog):
     
@@ -29,8 +30,8 @@ class Userinfo(commands.Cog):
         # Debug print
         print(member)
         
-        # Create the image with user info
-        buffer = create_user_info_canvas(member)
+        # Create the image with user info (downloads the avatar, so it runs in the HTTP thread pool)
+        buffer = await run_blocking('http', create_user_info_canvas, member)
         
         # Send the image to the channel
         await ctx.send(file=disnake.File(buffer, filename="user_info.png"))
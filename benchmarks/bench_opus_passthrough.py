@@ -0,0 +1,104 @@
+"""
+CPU benchmark of the playback paths with N simultaneous guilds.
+
+Every guild gets its own thread that drains an FFmpeg source as fast as it can,
+doing the per-frame work disnake's audio player does:
+
+- pcm: FFmpegPCMAudio decodes to PCM, PCMVolumeTransformer scales every frame
+  and the bot encodes it back to Opus (the path used for volumes other than 1.0)
+- passthrough: FFmpegOpusAudio copies the Opus packets of the file without
+  decoding them (FFmpeg runs with -c:a copy; the path used at volume 1.0)
+
+The reported cost is CPU seconds (bot process plus its FFmpeg children) spent
+per second of audio and per stream. A 20 ms frame budget means a path costing
+more than 1.0 cannot keep up in real time.
+
+Requires ffmpeg on the PATH and libopus for the PCM encoder.
+Run with: python benchmarks/bench_opus_passthrough.py
+"""
+
+import os  # Path helpers for locating the project root
+import resource  # CPU time of the FFmpeg child processes
+import subprocess  # To generate the Opus test file with FFmpeg
+import sys  # Provides access to Python runtime environment
+import tempfile  # Directory for the generated test file
+import threading  # One playback thread per simulated guild
+import time  # Process CPU time of the bot itself
+
+# Ensure the project root is importable when running this script directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import disnake  # Discord API wrapper for Python
+from extra_modules.music.audio_pipeline import open_ffmpeg  # Playback paths under test
+
+GUILDS = (1, 4, 16)  # Simultaneous streams to benchmark
+SECONDS = 30         # Length of the generated track
+
+
+def make_track(directory):
+    """Generate a stereo 48 kHz Opus/WebM file, like YouTube's audio formats."""
+    path = os.path.join(directory, 'track.webm')
+    subprocess.run(
+        ['ffmpeg', '-loglevel', 'error', '-f', 'lavfi', '-i', f'sine=frequency=440:duration={SECONDS}',
+         '-ac', '2', '-ar', '48000', '-c:a', 'libopus', '-b:a', '128k', path],
+        check=True
+    )
+    return path
+
+
+def drain(path, pcm):
+    """Play a whole track as fast as possible through one of the paths."""
+    source = open_ffmpeg(path, pcm=pcm, acodec='opus', options='-vn')
+    if not pcm:
+        # Make sure the numbers measure a packet copy, not a libopus re-encode
+        args = source.source._process.args
+        if args[args.index('-c:a') + 1] != 'copy':
+            raise RuntimeError(f"Opus path does not copy the packets: {' '.join(args)}")
+    if pcm:
+        source = disnake.PCMVolumeTransformer(source, 0.5)
+        encoder = disnake.opus.Encoder()
+    try:
+        while True:
+            frame = source.read()
+            if not frame:
+                break
+            if pcm:
+                encoder.encode(frame, encoder.SAMPLES_PER_FRAME)
+    finally:
+        source.cleanup()
+
+
+def cpu_seconds():
+    """CPU time used by this process and its finished children."""
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def cpu_per_stream(path, guilds, pcm):
+    """Return CPU seconds per audio second and stream for `guilds` simultaneous streams."""
+    threads = [threading.Thread(target=drain, args=(path, pcm)) for _ in range(guilds)]
+    started = cpu_seconds()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return (cpu_seconds() - started) / (SECONDS * guilds)
+
+
+def main():
+    if not disnake.opus.is_loaded():
+        disnake.opus._load_default()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = make_track(directory)
+        header = f"{'path':<12}" + "".join(f"{f'{n} guilds':>12}" for n in GUILDS)
+        print(header)
+        print("-" * len(header))
+        for name, pcm in (('pcm', True), ('passthrough', False)):
+            costs = [cpu_per_stream(path, guilds, pcm) for guilds in GUILDS]
+            print(f"{name:<12}" + "".join(f"{cost * 1000:>10.1f}ms" for cost in costs))
+        print("\nCPU milliseconds per second of audio, per stream")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Micro-benchmark for the per-guild queue engine.
+
+Measures the per-operation cost of the hot queue operations (enqueue at the
+back and front, get_next, add_to_played with history eviction and length
+checks) at increasing queue sizes, comparing the deque-backed GuildQueue
+against the list-based implementation it replaced. The deque timings should
+stay flat from 10 up to 10,000 entries, while the list timings grow with n.
+
+Run with: python benchmarks/bench_queue_manager.py
+"""
+
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import timeit  # High resolution timing of small code snippets
+
+# Ensure the project root is importable when running this script directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import queue_manager  # Queue engine under test
+from utils.track import Track  # Compact track record stored in the queues
+
+SIZES = (10, 100, 1000, 10000)  # Queue/history sizes to benchmark
+REPEAT = 5                      # Timing rounds per measurement (best is kept)
+NUMBER = 2000                   # Operations per timing round
+
+
+class ListQueue:
+    """Reference copy of the original list-based queue operations."""
+
+    def __init__(self):
+        self.music_queue = []
+        self.played_queue = []
+
+    def add_to_queue(self, track, next_in_queue=False):
+        if len(self.music_queue) >= queue_manager.QUEUE_LIMIT:
+            raise ValueError("A fila de reprodução está cheia!")
+        if next_in_queue:
+            self.music_queue.insert(0, track)
+        else:
+            self.music_queue.append(track)
+
+    def get_next(self):
+        return self.music_queue.pop(0) if self.music_queue else None
+
+    def add_to_played(self, track):
+        self.played_queue.insert(0, track)
+        if len(self.played_queue) > queue_manager.MAX_HISTORY:
+            self.played_queue.pop()
+
+
+def filled(factory, size):
+    """Create a queue with `size` entries in both the queue and the history."""
+    queue = factory()
+    for i in range(size):
+        queue.add_to_queue(Track(str(i), "url"))
+        queue.add_to_played(Track(str(i), "url"))
+    return queue
+
+
+def per_op_ns(factory, size, operation):
+    """Return the best per-operation cost in nanoseconds at a given size."""
+    queue = filled(factory, size)
+    track = Track("bench", "url")
+
+    if operation == "get_next":
+        # Pop one and push one back so the queue keeps its size
+        def op():
+            queue.get_next()
+            queue.add_to_queue(track)
+    elif operation == "add_next":
+        # Priority insert at the front, then drop from the back to keep the size
+        def op():
+            queue.add_to_queue(track, next_in_queue=True)
+            queue.music_queue.pop()
+    else:
+        def op():
+            queue.add_to_played(track)
+
+    best = min(timeit.repeat(op, repeat=REPEAT, number=NUMBER))
+    return best / NUMBER * 1e9
+
+
+def main():
+    # Make the history bound equal to the largest size so eviction is exercised,
+    # and leave room in the queue for the priority insert benchmark
+    queue_manager.MAX_HISTORY = max(SIZES)
+    queue_manager.QUEUE_LIMIT = max(SIZES) + 1
+
+    implementations = {
+        "deque": lambda: queue_manager.GuildQueue(0),
+        "list": ListQueue,
+    }
+    operations = ("get_next", "add_next", "add_to_played")
+
+    header = f"{'impl':<6} {'operation':<14}" + "".join(f"{size:>10}" for size in SIZES)
+    print(header)
+    print("-" * len(header))
+    for name, factory in implementations.items():
+        for operation in operations:
+            timings = [per_op_ns(factory, size, operation) for size in SIZES]
+            print(f"{name:<6} {operation:<14}" + "".join(f"{t:>8.0f}ns" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
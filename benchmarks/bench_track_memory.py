@@ -0,0 +1,110 @@
+"""
+Memory benchmark for the history representation.
+
+Compares the memory retained by 10,000 history entries stored as the old
+audio-source style objects (which keep the whole yt-dlp `data` dict with its
+formats, thumbnails and headers) against the compact, slotted Track record.
+The yt-dlp payload is synthetic but mirrors the shape and size of a real
+YouTube extraction.
+
+Run with: python benchmarks/bench_track_memory.py
+"""
+
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import tracemalloc  # Tracks memory blocks allocated by Python
+
+# Ensure the project root is importable when running this script directly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.track import Track  # Compact track record under test
+
+ENTRIES = 10000  # History size to compare (MAX_HISTORY)
+
+
+class SourceLike:
+    """Stand-in for YTDLSource: keeps the full yt-dlp data dict like the real class."""
+
+    def __init__(self, data, original_url):
+        self.data = data
+        self.title = data.get('title')
+        self.duration = data.get('duration')
+        self.url = data.get('url')
+        self.original_url = original_url
+        self.filename = f"youtube-{data['id']}-{data['title']}.webm"
+        self.start_time = None
+
+
+def fake_info(i):
+    """Build a yt-dlp-like info dict for a single YouTube video."""
+    video_id = f"vid{i:08d}"
+    formats = [
+        {
+            'format_id': str(fid),
+            'url': f"https://rr1---sn.googlevideo.com/videoplayback?id={video_id}&itag={fid}&expire=1700000000&sig={'x' * 120}",
+            'ext': 'webm' if fid % 2 else 'm4a',
+            'acodec': 'opus' if fid % 2 else 'mp4a.40.2',
+            'vcodec': 'none',
+            'abr': 48 + fid,
+            'asr': 48000,
+            'filesize': 3_000_000 + fid,
+            'http_headers': {
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-us,en;q=0.5',
+            },
+            'format_note': 'medium',
+            'protocol': 'https',
+        }
+        for fid in range(25)
+    ]
+    return {
+        'id': video_id,
+        'title': f"Artist {i} - Song Title {i} (Official Video)",
+        'webpage_url': f"https://www.youtube.com/watch?v={video_id}",
+        'url': formats[-1]['url'],
+        'duration': 180 + i % 240,
+        'thumbnail': f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
+        'thumbnails': [
+            {'url': f"https://i.ytimg.com/vi/{video_id}/{size}.jpg", 'id': str(n)}
+            for n, size in enumerate(('default', 'mqdefault', 'hqdefault', 'sddefault', 'maxresdefault'))
+        ],
+        'description': "Lyrics and credits " * 40,
+        'tags': [f"tag{t}" for t in range(15)],
+        'uploader': f"Artist {i}",
+        'channel_id': f"UC{i:022d}",
+        'formats': formats,
+        'extractor': 'youtube',
+    }
+
+
+def measure(build):
+    """Return the bytes retained by the list produced by `build`."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    entries = build()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del entries
+    return retained
+
+
+def main():
+    def build_sources():
+        return [SourceLike(fake_info(i), fake_info(i)['webpage_url']) for i in range(ENTRIES)]
+
+    def build_tracks():
+        # The info dict is created and dropped per entry, as in on_track_end
+        return [Track.from_info(fake_info(i), requester=1234567890) for i in range(ENTRIES)]
+
+    source_bytes = measure(build_sources)
+    track_bytes = measure(build_tracks)
+
+    print(f"{ENTRIES} history entries")
+    print(f"  source objects: {source_bytes / 1024 / 1024:8.2f} MiB ({source_bytes / ENTRIES:8.0f} B/entry)")
+    print(f"  Track records:  {track_bytes / 1024 / 1024:8.2f} MiB ({track_bytes / ENTRIES:8.0f} B/entry)")
+    print(f"  reduction:      {source_bytes / max(track_bytes, 1):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import disnake
+
+def equalizer_embed(preset: str, presets):
+    """Retorna um embed com o preset de equalização atual e os disponíveis."""
+    return disnake.Embed(
+        title="🎚️ Equalizador",
+        description=(
+            f"Preset atual: **{preset}**\n"
+            f"Disponíveis: {', '.join(f'`{name}`' for name in presets)}"
+        ),
+        color=disnake.Color.blue()
+    )
+
+def equalizer_updated_embed(preset: str):
+    """Retorna um embed confirmando a troca do preset de equalização."""
+    return disnake.Embed(
+        title="🎚️ Equalizador Atualizado",
+        description=f"Preset **{preset}** aplicado.",
+        color=disnake.Color.green()
+    )
+
+def invalid_preset_embed(presets):
+    """Retorna um embed informando que o preset pedido não existe."""
+    return disnake.Embed(
+        title="❌ Preset Inválido",
+        description=f"Use um destes presets: {', '.join(f'`{name}`' for name in presets)}",
+        color=disnake.Color.red()
+    )
+
+def equalizer_unavailable_embed():
+    """Retorna um embed informando que o equalizador não está disponível."""
+    return disnake.Embed(
+        title="❌ Equalizador Indisponível",
+        description="O equalizador precisa do NumPy instalado no bot.",
+        color=disnake.Color.red()
+    )
@@ -95,13 +95,46 @@ def playback_error_embed(error_message: str):
         color=disnake.Color.red()
     )
 
-def added_playlist_tracks_embed(count: int):
+def added_playlist_tracks_embed(count: int, skipped: int = 0, elapsed: float = None):
+    description = f"Adicionados **{count}** faixas à fila."
+    if skipped:
+        description += f"\n**{skipped}** faixas não puderam ser adicionadas."
+    if elapsed is not None:
+        description += f"\nConcluído em `{_format_seconds(elapsed)}`."
     return disnake.Embed(
         title="✅ Playlist Adicionada",
-        description=f"Adicionados **{count}** faixas à fila.",
+        description=description,
         color=disnake.Color.green()
     )
 
+def _format_seconds(seconds: float):
+    seconds = int(round(seconds))
+    return f"{seconds//60}:{seconds%60:02}"
+
+def playlist_progress_embed(
+    platform: str,
+    added: int,
+    total: int = None,
+    skipped: int = 0,
+    rate: float = 0.0,
+    eta: float = None,
+    current: str = None
+):
+    counts = f"{added}/{total}" if total else f"{added}"
+    description = f"**📥 │ Adicionadas:** `{counts}`"
+    if skipped:
+        description += f"\n**⚠️ │ Ignoradas:** `{skipped}`"
+    description += f"\n**⚡ │ Velocidade:** `{rate:.1f} faixas/s`"
+    if eta is not None:
+        description += f"\n**⌛ │ Tempo Restante:** `{_format_seconds(eta)}`"
+    if current:
+        description += f"\n\n**🎻 │ Última Faixa:**\n`{current}`"
+    return disnake.Embed(
+        title=f"⏳ Processando Playlist do {platform}",
+        description=description,
+        color=disnake.Color.blue()
+    )
+
 def spotify_not_found_embed():
     return disnake.Embed(
         title="❌ Música Não Encontrada",
@@ -1,7 +1,7 @@
 import disnake
 from disnake import Embed
 
-def create_queue_embed(current_track: dict, queue_page: list, current_page: int, total_pages: int) -> Embed:
+def create_queue_embed(current_track, queue_page: list, current_page: int, total_pages: int) -> Embed:
     """Cria embed para exibição da fila de reprodução"""
     embed = Embed(
         title="🎶 Fila de Reprodução",
@@ -10,8 +10,8 @@ def create_queue_embed(current_track: dict, queue_page: list, current_page: int,
     
     # Seção da música atual
     current_text = (
-        f"**{current_track.get('title', 'Título desconhecido')}**\n"
-        f"🔗 [Link da música]({current_track.get('original_url', '')})"
+        f"**{current_track.title or 'Título desconhecido'}**\n"
+        f"🔗 [Link da música]({current_track.url or ''})"
     ) if current_track else "`Nenhuma música tocando no momento`"
     
     embed.add_field(
@@ -23,8 +23,8 @@ def create_queue_embed(current_track: dict, queue_page: list, current_page: int,
     # Seção da fila
     if queue_page:
         queue_items = [
-            f"**{(current_page * 10) + i + 1}.** {track.get('title', 'Título desconhecido')}\n"
-            f"🔗 [Link]({track.get('original_url', '')})"
+            f"**{(current_page * 10) + i + 1}.** {track.title or 'Título desconhecido'}\n"
+            f"🔗 [Link]({track.url or ''})"
             for i, track in enumerate(queue_page)
         ]
         queue_text = "\n\n".join(queue_items)
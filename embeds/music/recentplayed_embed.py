@@ -16,7 +16,7 @@ def create_history_embed(page: int, total_pages: int, tracks: list) -> Embed:
     for i, track in enumerate(page_tracks, start=start_idx + 1):
         embed.add_field(
             name=f"{i}. {track.title}",
-            value=f"[🔗 Link]({track.original_url})",
+            value=f"[🔗 Link]({track.url})",
             inline=False
         )
     
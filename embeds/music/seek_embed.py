@@ -0,0 +1,44 @@
+import disnake
+
+def seek_success_embed(position: str, duration: str):
+    """Retorna um embed confirmando o novo ponto da música."""
+    return disnake.Embed(
+        title="⏩ Posição Alterada",
+        description=f"Tocando a partir de **{position}** / `{duration}`.",
+        color=disnake.Color.green()
+    )
+
+def invalid_position_embed():
+    """Retorna um embed explicando os formatos de posição aceitos."""
+    return disnake.Embed(
+        title="❌ Posição Inválida",
+        description=(
+            "Use segundos ou minutos:segundos, por exemplo `90`, `1:30` ou `1:01:30`.\n"
+            "Com `+` ou `-` a posição é relativa: `+15` avança e `-10` volta."
+        ),
+        color=disnake.Color.red()
+    )
+
+def position_out_of_range_embed(duration: str):
+    """Retorna um embed informando que a posição está fora da música."""
+    return disnake.Embed(
+        title="❌ Posição Fora da Música",
+        description=f"A posição precisa estar entre `0:00` e `{duration}`.",
+        color=disnake.Color.red()
+    )
+
+def seek_failed_embed():
+    """Retorna um embed informando que não foi possível pular para a posição."""
+    return disnake.Embed(
+        title="❌ Erro ao Pular",
+        description="Não foi possível continuar a música a partir dessa posição.",
+        color=disnake.Color.red()
+    )
+
+def not_playing_embed():
+    """Retorna um embed informando que nenhuma música está tocando."""
+    return disnake.Embed(
+        title="❌ Sem Música",
+        description="O bot precisa estar tocando alguma música primeiro!",
+        color=disnake.Color.red()
+    )
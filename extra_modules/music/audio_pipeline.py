@@ -0,0 +1,174 @@
+import os  # For reading the playback settings from the environment
+import math  # For rejecting non-finite seek positions
+import disnake  # Discord API wrapper for Python
+from extra_modules.music.dsp import available as dsp_available  # Crossfades are mixed with NumPy
+
+# Volume of a guild until someone changes it; 1.0 plays tracks at their original level
+DEFAULT_VOLUME = float(os.getenv('DEFAULT_VOLUME', '1.0'))
+# Whether Opus sources may be sent to Discord without decoding and re-encoding them
+OPUS_PASSTHROUGH = os.getenv('OPUS_PASSTHROUGH', 'true').lower() in ('1', 'true', 'yes')
+# Whether the next track is opened ahead of time and started without a gap
+GAPLESS_PLAYBACK = os.getenv('GAPLESS_PLAYBACK', 'true').lower() in ('1', 'true', 'yes')
+# Seconds consecutive tracks overlap while fading into each other (0 disables crossfades)
+CROSSFADE_SECONDS = float(os.getenv('CROSSFADE_SECONDS', '0'))
+# Seconds before the end of a track at which the next one is opened
+PRELOAD_SECONDS = float(os.getenv('PRELOAD_SECONDS', '15'))
+
+FRAME_SECONDS = 0.02  # Duration of one Discord audio frame (20 ms)
+
+
+def needs_pcm(volume: float, *, gain_db: float = 0.0, dsp=None) -> bool:
+    """
+    Tells whether a track must be decoded to PCM, i.e. whether its audio has to be
+    changed in Python (any volume other than 1.0, a loudness gain, an equalizer or crossfades).
+    Otherwise FFmpeg hands out Opus packets that disnake sends as they are: the
+    packets of Opus tracks are copied without decoding, and other codecs are
+    encoded once inside FFmpeg instead of by the bot for every 20 ms frame.
+
+    Args:
+        volume: The guild's volume (1.0 is the original level).
+        gain_db: Loudness normalization gain of the track in dB.
+        dsp: The guild's DSPChain, if any.
+    """
+    return (
+        not OPUS_PASSTHROUGH
+        or abs(volume - 1.0) > 1e-6
+        or abs(gain_db) > 0.01
+        or (dsp is not None and dsp.filtering)
+        or crossfades()
+    )
+
+
+def crossfades() -> bool:
+    """Tells whether consecutive tracks are crossfaded (which needs them decoded to PCM)."""
+    return GAPLESS_PLAYBACK and CROSSFADE_SECONDS > 0 and dsp_available()
+
+
+def open_ffmpeg(path: str, *, pcm: bool, acodec: str = None, start: float = 0.0,
+                before_options: str = '', options: str = '') -> 'PrimedAudio':
+    """
+    Starts FFmpeg for a file or stream URL on the PCM or the Opus path.
+
+    Args:
+        path: Local file or direct audio URL.
+        pcm: Decode to PCM (for volume scaling) instead of producing Opus packets.
+        acodec: Audio codec reported by yt-dlp; Opus audio is copied instead of re-encoded.
+        start: Position in seconds where playback starts.
+        before_options: FFmpeg input options.
+        options: FFmpeg output options.
+
+    Returns:
+        The FFmpeg source, wrapped so its first frame can be read ahead of playback.
+    """
+    if start > 0:
+        before_options = f"{before_options} -ss {start:.3f}".strip()
+    if pcm:
+        source = disnake.FFmpegPCMAudio(path, before_options=before_options or None, options=options or None)
+    else:
+        # yt-dlp already reports the codec, so no extra ffprobe process is needed per track.
+        # disnake turns codec='opus' into '-c:a copy'; any other value means libopus
+        source = disnake.FFmpegOpusAudio(
+            path,
+            codec='opus' if acodec == 'opus' else None,
+            before_options=before_options or None,
+            options=options or None
+        )
+    return PrimedAudio(source, start=start)
+
+
+def format_position(seconds: float) -> str:
+    """Formats a playback position or duration as M:SS (H:MM:SS from one hour on)."""
+    minutes, secs = divmod(int(max(seconds, 0)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{secs:02}" if hours else f"{minutes}:{secs:02}"
+
+
+def parse_position(text: str, current: float = 0.0) -> float:
+    """
+    Reads a position typed by a user: '90', '1:30' or '1:01:30' from the start of the
+    track, or '+15' / '-1:00' relative to the current position.
+
+    Args:
+        text: The position as typed.
+        current: Current position in seconds, for relative positions.
+
+    Returns:
+        The position in seconds.
+
+    Raises:
+        ValueError: If the text is not a position.
+    """
+    text = text.strip()
+    relative = text[:1] in ('+', '-')
+    parts = (text[1:] if relative else text).split(':')
+    if len(parts) > 3:
+        raise ValueError(f"Invalid position: {text}")
+    seconds = 0.0
+    for part in parts:
+        value = float(part)
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"Invalid position: {text}")
+        seconds = seconds * 60 + value
+    if not relative:
+        return seconds
+    return current - seconds if text.startswith('-') else current + seconds
+
+
+class PlaybackClock:
+    """
+    Position of a track, counted from the 20 ms frames actually handed to the voice client.
+    Unlike the wall clock it stands still while playback is paused or the connection
+    stalls, and it starts from the position FFmpeg was opened at (-ss) after a seek.
+    """
+    def __init__(self, start: float = 0.0):
+        self.start = start  # Position in seconds of the first frame
+        self.frames = 0  # Frames handed to the voice client so far
+
+    def tick(self):
+        """Counts one frame read by the voice client."""
+        self.frames += 1
+
+    @property
+    def position(self) -> float:
+        """Seconds of the track played so far."""
+        return self.start + self.frames * FRAME_SECONDS
+
+
+class PrimedAudio(disnake.AudioSource):
+    """
+    Wraps an FFmpeg source so its first frame can be read before playback starts.
+    This tells whether FFmpeg actually accepted the input without losing any audio.
+    Its PlaybackClock counts the frames handed to the voice client, which gives the playback position.
+    """
+    def __init__(self, source, *, start=0.0):
+        self.source = source  # The wrapped FFmpeg audio source
+        self.first_frame = None  # First frame read ahead of playback
+        self.clock = PlaybackClock(start)
+
+    @property
+    def position(self):
+        """Seconds of the track played so far."""
+        return self.clock.position
+
+    def prime(self):
+        """
+        Blocks until FFmpeg produces the first frame.
+        Returns False if FFmpeg exited without producing audio (e.g. a rejected stream).
+        """
+        self.first_frame = self.source.read()
+        return bool(self.first_frame)
+
+    def read(self):
+        if self.first_frame is not None:
+            frame, self.first_frame = self.first_frame, None
+        else:
+            frame = self.source.read()
+        if frame:
+            self.clock.tick()
+        return frame
+
+    def is_opus(self):
+        return self.source.is_opus()
+
+    def cleanup(self):
+        self.source.cleanup()
@@ -0,0 +1,275 @@
+import math  # For the biquad coefficient formulas
+import disnake  # Discord API wrapper for Python
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # Vectorized processing of whole frames
+except ImportError:
+    np = None
+
+SAMPLE_RATE = 48000  # Discord audio: 48 kHz, 16-bit stereo PCM
+CHANNELS = 2
+
+# Equalizer presets: lists of (kind, frequency in Hz, gain in dB, Q)
+EQ_PRESETS: Dict[str, List[Tuple[str, float, float, float]]] = {
+    'flat': [],
+    'bass': [('lowshelf', 120.0, 6.0, 0.707)],
+    'vocal': [('lowshelf', 150.0, -3.0, 0.707), ('peaking', 2500.0, 4.0, 1.0)],
+    'treble': [('highshelf', 6000.0, 6.0, 0.707)],
+}
+
+
+def available() -> bool:
+    """Tells whether NumPy is installed, i.e. whether the DSP stage can be used."""
+    return np is not None
+
+
+def db_to_gain(db: float) -> float:
+    """Converts decibels to a linear amplitude factor."""
+    return 10 ** (db / 20)
+
+
+def biquad_coefficients(kind: str, frequency: float, gain_db: float, q: float,
+                        rate: int = SAMPLE_RATE) -> Tuple[List[float], List[float]]:
+    """
+    Computes normalized biquad coefficients (Audio EQ Cookbook formulas).
+
+    Args:
+        kind: 'peaking', 'lowshelf' or 'highshelf'.
+        frequency: Center or corner frequency in Hz.
+        gain_db: Boost (positive) or cut (negative) in dB.
+        q: Quality factor (bandwidth of a peak, slope of a shelf).
+        rate: Sample rate in Hz.
+
+    Returns:
+        The feed-forward coefficients [b0, b1, b2] and feedback coefficients [1, a1, a2].
+    """
+    amplitude = 10 ** (gain_db / 40)
+    w0 = 2 * math.pi * frequency / rate
+    cos_w0, alpha = math.cos(w0), math.sin(w0) / (2 * q)
+
+    if kind == 'peaking':
+        b = [1 + alpha * amplitude, -2 * cos_w0, 1 - alpha * amplitude]
+        a = [1 + alpha / amplitude, -2 * cos_w0, 1 - alpha / amplitude]
+    elif kind in ('lowshelf', 'highshelf'):
+        sign = 1 if kind == 'lowshelf' else -1
+        root = 2 * math.sqrt(amplitude) * alpha
+        b = [
+            amplitude * ((amplitude + 1) - sign * (amplitude - 1) * cos_w0 + root),
+            sign * 2 * amplitude * ((amplitude - 1) - sign * (amplitude + 1) * cos_w0),
+            amplitude * ((amplitude + 1) - sign * (amplitude - 1) * cos_w0 - root)
+        ]
+        a = [
+            (amplitude + 1) + sign * (amplitude - 1) * cos_w0 + root,
+            -sign * 2 * ((amplitude - 1) + sign * (amplitude + 1) * cos_w0),
+            (amplitude + 1) + sign * (amplitude - 1) * cos_w0 - root
+        ]
+    else:
+        raise ValueError(f"Unknown filter kind: {kind}")
+    return [value / a[0] for value in b], [1.0, a[1] / a[0], a[2] / a[0]]
+
+
+class Biquad:
+    """
+    One equalizer band, processed a whole frame at a time.
+
+    A biquad is linear, so its output over a block of n samples is the block
+    convolved with the first n samples of the impulse response plus the response
+    to the filter's state at the start of the block. Both responses are computed
+    once per block length, which turns the per-sample recursion into an FFT
+    convolution and a small matrix product per frame.
+    """
+
+    def __init__(self, kind: str, frequency: float, gain_db: float, q: float = 0.707):
+        """
+        Initializes the band.
+
+        Args:
+            kind: 'peaking', 'lowshelf' or 'highshelf'.
+            frequency: Center or corner frequency in Hz.
+            gain_db: Boost or cut in dB.
+            q: Quality factor.
+        """
+        self.b, self.a = biquad_coefficients(kind, frequency, gain_db, q)
+        self.state = np.zeros((4, CHANNELS))  # x[-1], x[-2], y[-1], y[-2] of every channel
+        self._blocks: Dict[int, tuple] = {}  # Block length -> (FFT of the impulse response, FFT size, state responses)
+
+    def _simulate(self, x, state):
+        """Runs the recursion sample by sample (only used to precompute the responses)."""
+        b0, b1, b2 = self.b
+        _, a1, a2 = self.a
+        x1, x2, y1, y2 = state
+        y = []
+        for sample in x:
+            out = b0 * sample + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x2, x1, y2, y1 = x1, sample, y1, out
+            y.append(out)
+        return y
+
+    def _block(self, n):
+        block = self._blocks.get(n)
+        if block is None:
+            impulse = self._simulate([1.0] + [0.0] * (n - 1), (0.0, 0.0, 0.0, 0.0))
+            state_responses = np.array([
+                self._simulate([0.0] * n, unit) for unit in np.eye(4)
+            ]).T  # (n, 4)
+            size = 1 << (2 * n - 1).bit_length()
+            block = self._blocks[n] = (np.fft.rfft(impulse, size), size, state_responses)
+        return block
+
+    def filter(self, samples, state):
+        """
+        Filters a block of samples of one stream.
+
+        Args:
+            samples: Array of shape (n, channels).
+            state: The stream's filter state at the start of the block.
+
+        Returns:
+            The filtered block (float64) and the state at its end.
+        """
+        n = len(samples)
+        spectrum, size, state_responses = self._block(n)
+        y = np.fft.irfft(np.fft.rfft(samples, size, axis=0) * spectrum[:, None], size, axis=0)[:n]
+        y += state_responses @ state
+        if n >= 2:
+            state = np.stack([samples[-1], samples[-2], y[-1], y[-2]])
+        return y, state
+
+    def process(self, samples):
+        """
+        Filters a block of samples, keeping the state in the band itself.
+
+        Args:
+            samples: Array of shape (n, channels).
+
+        Returns:
+            The filtered block (float64).
+        """
+        y, self.state = self.filter(samples, self.state)
+        return y
+
+
+class DSPStream:
+    """
+    Processing state of one audio stream: the level applied at the end of its last
+    frame and the memory of every equalizer band. Two tracks mixed together (e.g.
+    during a crossfade) each keep their own, so they never disturb each other.
+    """
+
+    def __init__(self):
+        self.level: Optional[float] = None  # Amplitude factor applied at the end of the last frame
+        self.filters: Dict[Biquad, object] = {}  # Band -> filter state of this stream
+
+
+class DSPChain:
+    """
+    Per-guild audio processing between the FFmpeg source and the Opus encoder.
+
+    Every 20 ms frame is processed as one NumPy array: the equalizer bands, then
+    the track's loudness gain and the volume. Volume changes are ramped over one
+    frame so they never click. Settings can be changed from the event loop while
+    the audio thread is playing; they apply from the next frame, without
+    restarting FFmpeg.
+    """
+
+    def __init__(self, volume: float = 1.0):
+        """
+        Initializes the DSPChain.
+
+        Args:
+            volume: Initial volume (1.0 is the original level).
+        """
+        self.volume = volume  # Target volume, reached by the ramp within one frame
+        self.bands: List[Biquad] = []  # Equalizer bands, replaced as a whole on changes
+        self.preset = 'flat'  # Name of the current equalizer preset
+        self.stream = DSPStream()  # State used when no stream is given
+
+    @property
+    def filtering(self) -> bool:
+        """True if the equalizer changes the audio."""
+        return bool(self.bands)
+
+    def set_equalizer(self, bands: Sequence[Tuple[str, float, float, float]], preset: Optional[str] = None) -> None:
+        """
+        Replaces the equalizer bands; the next frame is already filtered with them.
+
+        Args:
+            bands: Sequence of (kind, frequency, gain_db, q).
+            preset: Name shown for these bands.
+        """
+        self.bands = [Biquad(*band) for band in bands]
+        self.preset = preset or 'custom'
+
+    def process(self, frame: bytes, gain: float = 1.0, stream: Optional[DSPStream] = None) -> bytes:
+        """
+        Processes one frame of 16-bit stereo PCM.
+
+        Args:
+            frame: The PCM frame read from FFmpeg.
+            gain: Loudness normalization factor of the current track.
+            stream: Processing state of the track (defaults to the chain's own).
+
+        Returns:
+            The processed frame.
+        """
+        if not frame:
+            return frame
+        stream = stream or self.stream
+        bands = self.bands  # Read once: the event loop may replace the list meanwhile
+        level = self.volume * gain
+        if not bands and level == 1.0 and stream.level in (None, 1.0):
+            stream.level = level
+            return frame
+
+        samples = np.frombuffer(frame, dtype=np.int16).reshape(-1, CHANNELS).astype(np.float64)
+        if bands:
+            filters = {}
+            for band in bands:
+                samples, filters[band] = band.filter(samples, stream.filters.get(band, band.state))
+            stream.filters = filters  # Drops the state of bands that were replaced
+        previous = level if stream.level is None else stream.level
+        if previous != level:
+            samples *= np.linspace(previous, level, len(samples))[:, None]
+        elif level != 1.0:
+            samples *= level
+        stream.level = level
+        np.clip(samples, -32768, 32767, out=samples)
+        return samples.astype(np.int16).tobytes()
+
+
+class DSPSource(disnake.AudioSource):
+    """
+    PCM source processed by a guild's DSPChain, used instead of PCMVolumeTransformer
+    when NumPy is available.
+    """
+
+    def __init__(self, original, chain: DSPChain, *, gain_db: float = 0.0):
+        """
+        Initializes the DSPSource.
+
+        Args:
+            original: The PCM source read from FFmpeg.
+            chain: The guild's processing chain.
+            gain_db: Loudness normalization gain of the track in dB.
+        """
+        if original.is_opus():
+            raise disnake.ClientException('AudioSource must not be Opus encoded.')
+        self.original = original
+        self.chain = chain
+        self.gain = db_to_gain(gain_db)
+        self.stream = DSPStream()  # This track's own ramp and filter state
+
+    @property
+    def volume(self):
+        return self.chain.volume
+
+    @volume.setter
+    def volume(self, value):
+        self.chain.volume = max(value, 0.0)
+
+    def read(self):
+        return self.chain.process(self.original.read(), self.gain, self.stream)
+
+    def cleanup(self):
+        self.original.cleanup()
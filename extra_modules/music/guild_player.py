@@ -0,0 +1,521 @@
+import asyncio  # For the per-guild lock and thread-safe track-end callbacks
+import logging  # For reporting playback errors
+import time  # For time-to-first-audio measurements and playback start times
+from typing import Awaitable, Callable, Coroutine, Dict, Optional, Set, Tuple
+
+import disnake  # Discord API wrapper for Python
+
+from utils.metrics import metrics  # Latency metrics (time-to-first-audio per playback mode)
+from utils.queue_manager import get_queue  # Per-guild music queue registry
+from utils.track import Track  # Compact, immutable track record stored in the history
+from extra_modules.music.playback_state import PlaybackState, PlaybackStateMachine  # Per-guild playback state
+from extra_modules.music.notifier import GuildNotifier  # Per-guild status messages
+from extra_modules.music.audio_pipeline import (  # Playback settings; whether a track needs the PCM path
+    CROSSFADE_SECONDS, DEFAULT_VOLUME, GAPLESS_PLAYBACK, PRELOAD_SECONDS, crossfades, format_position, needs_pcm
+)
+from extra_modules.music.mixer import MixerSource  # Plays consecutive tracks without a gap
+from extra_modules.music.dsp import DSPChain, EQ_PRESETS, available as dsp_available  # Per-guild NumPy processing
+from embeds.music.play_embed import success_playing_now_embed, playback_error_embed  # Playback messages
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Coroutine function building the audio source of a track: (guild_id, url) -> (source, mode)
+SourceFactory = Callable[[int, str], Awaitable[Tuple[disnake.AudioSource, str]]]
+
+
+class GuildPlayer:
+    """
+    Playback of one guild: its queue, voice client, current source, notifier,
+    playback state and lock.
+
+    Each guild has its own lock, so a slow track start (a long resolve or
+    download) only delays that guild; starts in different guilds run in parallel.
+
+    With gapless playback the voice client plays a MixerSource: shortly before the
+    current track ends, the head of the queue is opened and handed to the mixer,
+    which moves on to it (or crossfades into it) without stopping the voice client.
+    The track is only taken from the queue once it actually starts.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        create_source: SourceFactory,
+        voice_client: Callable[[], Optional[disnake.VoiceClient]],
+        on_state_change: Optional[Callable[[int, PlaybackState], None]] = None,
+        *,
+        gapless: bool = GAPLESS_PLAYBACK,
+        crossfade: Optional[float] = None,
+        preload: float = PRELOAD_SECONDS
+    ):
+        """
+        Initializes the GuildPlayer.
+
+        Args:
+            guild_id: The guild this player belongs to.
+            create_source: Coroutine function returning (source, mode) for a track URL.
+            voice_client: Callable returning the guild's current voice client (or None).
+            on_state_change: Optional callable notified with (guild_id, new_state) after every transition.
+            gapless: Whether the next track is opened ahead of time and started without a gap.
+            crossfade: Seconds consecutive tracks overlap (defaults to CROSSFADE_SECONDS when crossfades are possible).
+            preload: Seconds before the end of a track at which the next one is opened.
+        """
+        self.guild_id = guild_id
+        self.create_source = create_source
+        self._voice_client = voice_client
+        self.state = PlaybackStateMachine(guild_id, on_change=on_state_change)
+        self.notifier = GuildNotifier(guild_id)  # Posts playback messages to the guild's music channel
+        self.lock = asyncio.Lock()  # Serializes track starts of this guild only
+        self.source = None  # Source currently loaded in the voice client
+        self.volume = DEFAULT_VOLUME  # Volume of this guild's tracks, kept across tracks
+        # Volume, loudness and equalizer processing of the PCM path (None without NumPy)
+        self.dsp = DSPChain(DEFAULT_VOLUME) if dsp_available() else None
+        self.loop = None  # Event loop that track-end callbacks are sent back to
+        self.gapless = gapless
+        self.crossfade = (CROSSFADE_SECONDS if crossfades() else 0.0) if crossfade is None else crossfade
+        self.preload = preload
+        self.mixer = None  # MixerSource loaded in the voice client while gapless playback is on
+        self._preload = None  # Task opening the next track ahead of time
+        self._tasks: Set[asyncio.Task] = set()  # Background tasks, kept so they are not garbage-collected
+        self.closed = False  # Set once the guild's player is removed; late callbacks are ignored
+
+    @property
+    def queue(self):
+        """The guild's music queue."""
+        return get_queue(self.guild_id)
+
+    @property
+    def voice_client(self):
+        """The guild's voice client, or None if the bot is not connected."""
+        return self._voice_client()
+
+    async def play_next(self, event='command'):
+        """
+        Plays the next track in the queue.
+        Only starts a track while the playback state is idle, so concurrent events
+        (enqueue, track end, error, commands) start at most one track.
+
+        Args:
+            event: What triggered the advance, used for the transition latency metrics.
+        """
+        vc = self.voice_client
+        # If there is no voice connection or something is already playing, do nothing
+        if self.closed or vc is None or vc.is_playing():
+            return
+        if not self.state.begin(event):
+            return  # Another event is already starting a track, or one is loaded
+
+        self.loop = asyncio.get_running_loop()
+        async with self.lock:
+            track = self.queue.get_next()  # Get next track from this guild's queue
+            if not track:
+                self.state.stop()
+                return
+            started = time.perf_counter()
+            source = None
+
+            try:
+                # Create a new player source from the URL, streaming first when enabled
+                source, mode = await self.create_source(self.guild_id, track.url)
+                # Time from dequeuing the track until its first audio frame is ready
+                metrics.record(f'time_to_first_audio.{mode}', time.perf_counter() - started)
+                source.start_time = time.time()
+                self._attach_track(source, track)
+
+                # Start playback; the callback runs in the audio thread when the track ends
+                vc = self.voice_client
+                if vc is None:
+                    raise RuntimeError('Disconnected from the voice channel')
+                playing = source
+                if self.gapless:
+                    playing = self.mixer = MixerSource(
+                        source, crossfade=self.crossfade, on_transition=self._transition
+                    )
+                vc.play(playing, after=lambda error: self._after(playing, error))
+                self.source = source
+                self.state.started()
+
+                await self._announce(source)
+                self._schedule_preload()
+            except Exception as e:
+                # Send a playback error message and try playing the next track
+                failed = self.state.state is PlaybackState.RESOLVING
+                if failed:
+                    self.state.stop()
+                    self.mixer = None
+                    if source is not None:
+                        source.cleanup()  # Never reached the voice client
+                await self.notifier.send(playback_error_embed(str(e)))
+                if failed:
+                    self.spawn(self.play_next(event='error'))
+
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Runs a coroutine in the background on the running event loop. The task is
+        referenced until it finishes, and its exception, if any, is logged.
+
+        Args:
+            coro: The coroutine to run (e.g. play_next after a queue change).
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background task of guild {self.guild_id} failed: {task.exception()!r}")
+
+    def _attach_track(self, source, track):
+        """Keeps only a compact record of the track for the history, refreshed with full metadata."""
+        source.track = Track.from_info(
+            source.data,
+            url=track.url,
+            title=track.title,
+            source=track.source,
+            requester=track.requester
+        )
+
+    async def _announce(self, source):
+        """Posts the "now playing" message of a track that just started."""
+        await self.notifier.send(success_playing_now_embed(
+            current_track=source.title,
+            duration_str=format_position(source.duration or 0),
+            playing_time=format_position(source.position),
+            current_vol=str(int(source.volume * 100)),
+            is_playing=True
+        ))
+
+    def _schedule_preload(self):
+        """(Re)starts the task opening the head of the queue before the current track ends."""
+        if self._preload is not None:
+            self._preload.cancel()
+            self._preload = None
+        if self.mixer is not None and self.loop is not None:
+            self._preload = self.loop.create_task(self._preload_next(self.mixer))
+
+    async def _preload_next(self, mixer):
+        """
+        Waits until the current track is about to end, then opens the head of the queue
+        and hands it to the mixer. The track stays in the queue until it starts.
+
+        Args:
+            mixer: The mixer the next track is meant for.
+        """
+        lead = self.preload + mixer.crossfade
+        while True:
+            # The position only advances while frames are read, so a paused track keeps waiting
+            remaining = mixer.remaining(mixer.current)
+            if remaining is None or remaining <= lead:
+                break
+            await asyncio.sleep(remaining - lead)
+
+        head = self.queue.peek()
+        if not head or mixer is not self.mixer or mixer.next is not None:
+            return
+        track = head[0]
+        # Cancelling the preload must not abandon an FFmpeg process that is starting
+        creation = asyncio.ensure_future(self.create_source(self.guild_id, track.url))
+        try:
+            source, mode = await asyncio.shield(creation)
+        except asyncio.CancelledError:
+            creation.add_done_callback(_discard_source)
+            raise
+        except Exception as e:
+            # play_next tries again (and reports the error) when the current track ends
+            logger.warning(f"Could not preload the next track of guild {self.guild_id}: {str(e)}")
+            return
+        head = self.queue.peek()
+        if mixer is not self.mixer or not head or head[0] is not track:
+            source.cleanup()  # Playback stopped or the queue changed while the track was opening
+            return
+        self._attach_track(source, track)
+        source.queued = track  # Queue entry taken off the queue when the track starts
+        self._ensure_encoder(source)
+        if not mixer.queue_next(source):
+            source.cleanup()
+
+    def _ensure_encoder(self, source):
+        """
+        disnake only creates the voice client's Opus encoder when playback starts with
+        a PCM source, so a PCM track following an Opus passthrough track needs one.
+        """
+        vc = self.voice_client
+        if vc is not None and hasattr(vc, 'encoder') and not vc.encoder and not source.is_opus():
+            vc.encoder = disnake.opus.Encoder()
+
+    def _drop_next(self, *, reload: bool = True):
+        """
+        Discards the track the mixer opened ahead of time, e.g. because the queue or the
+        volume changed, and optionally opens the new head of the queue instead.
+        """
+        if self.mixer is None:
+            return
+        dropped = self.mixer.cancel_next()
+        if dropped is not None:
+            dropped.cleanup()
+        if reload and self.mixer.next is None:  # A track already fading in is kept
+            self._schedule_preload()
+
+    def on_queue_changed(self, event: str) -> None:
+        """
+        Keeps the track opened ahead of time in line with the queue: when the head of
+        the queue changes it is reopened, and a track enqueued while the current one is
+        ending is still opened in time.
+
+        Args:
+            event: The queue event ('add', 'next', 'remove' or 'clear').
+        """
+        if self.mixer is None or event == 'next':
+            return
+        upcoming = self.mixer.next
+        head = self.queue.peek()
+        if upcoming is not None:
+            if head and head[0] is upcoming.queued:
+                return
+            self._drop_next()
+        elif head and (self._preload is None or self._preload.done()):
+            self._schedule_preload()
+
+    async def set_volume(self, volume: float) -> None:
+        """
+        Changes the guild's volume for the current and the next tracks.
+        A track played through the Opus passthrough cannot be scaled, so when the new
+        volume needs the PCM path it is reopened there from its current position.
+
+        Args:
+            volume: The new volume (1.0 is the original level).
+        """
+        self.volume = volume
+        if self.dsp is not None:
+            self.dsp.volume = volume
+        if self.source is not None:
+            self.source.volume = volume  # Ramped by the DSP chain on the PCM path
+        self._refresh_next()
+        await self._reopen_if_needed()
+
+    async def set_equalizer(self, preset: str) -> bool:
+        """
+        Applies an equalizer preset to the current and the next tracks.
+        On the PCM path the bands apply from the next frame; an Opus passthrough track
+        is reopened on the PCM path from its current position.
+
+        Args:
+            preset: Name of a preset in EQ_PRESETS.
+
+        Returns:
+            False if the equalizer is unavailable (NumPy is not installed).
+        """
+        if self.dsp is None:
+            return False
+        self.dsp.set_equalizer(EQ_PRESETS[preset], preset)
+        self._refresh_next()
+        await self._reopen_if_needed()
+        return True
+
+    def _refresh_next(self):
+        """Reopens the track opened ahead of time if it can no longer use the Opus passthrough."""
+        upcoming = self.mixer.next if self.mixer is not None else None
+        if upcoming is not None and upcoming.is_opus() and needs_pcm(
+                self.volume, gain_db=upcoming.gain_db, dsp=self.dsp):
+            self._drop_next()
+
+    @property
+    def position(self) -> Optional[float]:
+        """
+        Exact position of the current track in seconds, counted from the frames actually
+        played (so pauses do not advance it), or None if nothing is loaded. Shown in the
+        now-playing messages; a track can be restored from it with seek after a reconnect.
+        """
+        return self.source.position if self.source is not None else None
+
+    async def seek(self, position: float) -> bool:
+        """
+        Jumps to a position of the current track. FFmpeg is restarted there (-ss) on the
+        downloaded file or the already resolved stream URL, without a new extraction,
+        and swapped in without stopping the voice client.
+
+        Args:
+            position: Seconds from the start of the track.
+
+        Returns:
+            False if nothing is playing or FFmpeg could not start at that position.
+        """
+        source = self._loaded_source()
+        if source is None:
+            return False
+        fading = self.mixer is not None and self.mixer.fading
+        if not await self._replace(source, start=max(position, 0.0)):
+            return False
+        if fading:
+            self._drop_next()  # The next track already started fading in; it is opened again from its start
+        else:
+            self._schedule_preload()  # The current track now ends at another time
+        return True
+
+    def _loaded_source(self):
+        """The current track's source if the voice client is still reading it, else None."""
+        source, vc, mixer = self.source, self.voice_client, self.mixer
+        if source is None or vc is None or vc.source is not (mixer or source):
+            return None
+        if mixer is not None and mixer.current is not source:
+            return None
+        return source
+
+    async def _reopen_if_needed(self):
+        """
+        Moves the current track to the PCM path when it is played through the Opus
+        passthrough but the volume or the equalizer now need its audio processed.
+        """
+        source = self._loaded_source()
+        if source is None or not source.is_opus():
+            return
+        if not needs_pcm(self.volume, gain_db=source.gain_db, dsp=self.dsp):
+            return
+        if not await self._replace(source):
+            logger.warning(f"Could not reopen the current track of guild {self.guild_id} on the PCM path")
+
+    async def _replace(self, source, *, start: Optional[float] = None) -> bool:
+        """
+        Opens the current track again, on the path the volume and the equalizer need and
+        from `start` (or its current position), and swaps it in for the voice client.
+
+        Returns:
+            False if FFmpeg produced no audio or the track ended meanwhile.
+        """
+        replacement = source.reopen(volume=self.volume, start=start)
+        if not await replacement.prime():
+            replacement.cleanup()
+            return False
+        replacement.start_time = source.start_time
+        replacement.queued = getattr(source, 'queued', None)
+        if self._loaded_source() is not source:
+            replacement.cleanup()  # The track ended while the replacement was starting
+            return False
+        self._ensure_encoder(replacement)
+        mixer = self.mixer
+        if mixer is None:
+            self.voice_client.source = replacement
+        elif not mixer.replace_current(source, replacement):
+            replacement.cleanup()  # The mixer moved on to the next track meanwhile
+            return False
+        self.source = replacement
+        # The audio thread may still be reading a frame of the old source
+        await asyncio.sleep(0.1)
+        source.cleanup()
+        return True
+
+    def close(self) -> None:
+        """
+        Detaches the player before its voice client is stopped (e.g. when the bot leaves),
+        so the track-end callbacks still on their way neither recreate the guild's queue
+        nor report the guild as idle.
+        """
+        self.closed = True
+        self.mixer = None
+        self._schedule_preload()  # Only cancels it: there is no mixer any more
+
+    def _after(self, source, error):
+        """
+        Track-end callback, called by the voice client from its audio thread.
+        Hands the event over to the event loop thread-safely.
+        """
+        if error:
+            logger.error(f"Playback error in guild {self.guild_id}: {error}")
+        if self.closed:
+            return
+        if self.loop is not None and not self.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.on_track_end(source), self.loop)
+
+    def _transition(self, previous, upcoming):
+        """
+        Mixer callback, called from the audio thread when it moved on to the next track.
+        Hands the event over to the event loop thread-safely.
+        """
+        if self.closed:
+            return
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._on_transition, previous, upcoming)
+
+    def _on_transition(self, previous, upcoming):
+        """
+        Does the bookkeeping of a gapless transition: records the previous track as
+        played, takes the new one off the queue and opens the following one in time.
+        """
+        if self.closed:
+            return
+        self.queue.add_to_played(previous.track)
+        head = self.queue.peek()
+        if head and head[0] is upcoming.queued:
+            self.queue.get_next()
+        metrics.record('time_to_first_audio.gapless', 0.0)
+        upcoming.start_time = time.time()
+        self.source = upcoming
+        self.spawn(self._announce(upcoming))
+        self._schedule_preload()
+
+    async def on_track_end(self, source):
+        """
+        Called when a track ends: records it as played and starts the next one.
+        Downloaded files stay in the audio cache; the source already unpinned them on cleanup.
+
+        Args:
+            source: The source that finished playing (the mixer with gapless playback).
+        """
+        if self.closed:
+            return  # The bot left the voice channel; its queue and state are gone
+        if isinstance(source, MixerSource):
+            if self.mixer is source:
+                self.mixer = None
+                self._schedule_preload()  # Only cancels it: there is no mixer any more
+            source = source.current
+        self.queue.add_to_played(source.track)  # Mark the track as played
+        if self.source is not None and self.source.track is source.track:
+            self.source = None  # The source that ended, or the one that replaced it after a volume change
+        self.state.stop()
+        await self.play_next(event='track_end')
+
+
+def _discard_source(creation: asyncio.Future) -> None:
+    """Cleans up a source whose creation finished after nobody needed it any more."""
+    if not creation.cancelled() and creation.exception() is None:
+        creation.result()[0].cleanup()
+
+
+class GuildPlayers:
+    """Registry of the GuildPlayer of every guild."""
+
+    def __init__(self, factory: Callable[[int], GuildPlayer]):
+        """
+        Initializes the registry.
+
+        Args:
+            factory: Callable building the player of a guild from its ID.
+        """
+        self.factory = factory
+        self._players: Dict[int, GuildPlayer] = {}
+
+    def get(self, guild_id: int) -> GuildPlayer:
+        """
+        Returns the player of a guild, creating an idle one if needed.
+
+        Args:
+            guild_id: The guild ID.
+        """
+        player = self._players.get(guild_id)
+        if player is None:
+            player = self._players[guild_id] = self.factory(guild_id)
+        return player
+
+    def remove(self, guild_id: int) -> None:
+        """Forgets and closes a guild's player (e.g. when the bot leaves its voice channel)."""
+        player = self._players.pop(guild_id, None)
+        if player is not None:
+            player.close()
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._players
+
+    def __len__(self) -> int:
+        return len(self._players)
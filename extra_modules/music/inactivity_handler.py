@@ -1,139 +1,171 @@
-import os  # Provides functions for interacting with the operating system (e.g., file removal)
+import os  # For reading the timeouts from the environment
+import logging  # For reporting failed disconnections
 import disnake  # Discord API wrapper for Python
-import time  # Module for time-related functions, used here to track elapsed time
-from disnake.ext import tasks, commands  # Extensions for creating commands and running background tasks
+from disnake.ext import commands  # Extensions for creating commands and cogs
+from utils.deadline_scheduler import DeadlineScheduler  # Heap of per-guild disconnect deadlines
+from extra_modules.music.playback_state import PlaybackState  # Playback states that arm or cancel the deadlines
 from embeds.music.auto_disconnect_embed import (
     paused_timeout_embed,
     inactivity_timeout_embed
 )
 
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Seconds the bot may stay connected without playing anything
+IDLE_TIMEOUT = float(os.getenv('INACTIVITY_IDLE_TIMEOUT', '180'))
+# Seconds the bot may stay connected while paused
+PAUSED_TIMEOUT = float(os.getenv('INACTIVITY_PAUSED_TIMEOUT', '300'))
+
+
 class InactivityHandler(commands.Cog):
     """
     A Cog for managing bot inactivity in voice channels.
-    
-    This class periodically checks the bot's activity in voice channels and disconnects
-    if it has been inactive (neither playing nor paused) for 3 minutes or paused for 5 minutes.
+
+    Instead of scanning every voice client periodically, a per-guild disconnect
+    deadline is armed when the guild's player goes idle (3 minutes) or is paused
+    (5 minutes), and cancelled when playback resumes. Deadlines live in a heap
+    served by a single event loop timer, so disconnections happen on time and
+    the cost scales with playback state changes rather than connected guilds.
     """
 
-    def __init__(self, bot, queue_manager):
+    def __init__(self, bot, queue_manager, *, idle_timeout=IDLE_TIMEOUT, paused_timeout=PAUSED_TIMEOUT):
         """
         Initializes the InactivityHandler.
-        
+
         Args:
             bot: The instance of the bot.
             queue_manager: The queue manager responsible for handling the music queue.
+            idle_timeout: Seconds without playback before disconnecting.
+            paused_timeout: Seconds paused before disconnecting.
         """
         self.bot = bot
         self.queue_manager = queue_manager
-        self.first_channel = None  # Stores the channel where the bot first connected
-
-    def start_inactivity_task(self, channel):
-        """
-        Starts the inactivity timer if it's not already running.
-        
-        Also stores the channel where the bot is connected to send disconnection messages.
-        """
-        if not self.inactivity_timer.is_running():
-            self.inactivity_timer.start()
-            self.first_channel = channel
-
-    def cancel_inactivity_task(self):
-        """
-        Cancels the inactivity timer task if it is currently running.
-        """
-        if self.inactivity_timer.is_running():
-            self.inactivity_timer.cancel()
-
-    @tasks.loop(seconds=30)
-    async def inactivity_timer(self):
-        """
-        A loop that runs every 30 seconds to check for inactivity or prolonged pause.
-        
-        The bot will disconnect from the voice channel if it has been paused for 5 minutes
-        or inactive (neither playing nor paused) for 3 minutes.
-        """
-        for vc in self.bot.voice_clients:
-            # Skip check if the bot has just connected or is currently downloading content
-            if hasattr(vc, 'just_connected') and vc.just_connected:
-                vc.just_connected = False
-                continue
-
-            current_time = time.time()
-
-            if vc.is_paused():
-                # If pause start time isn't recorded, record it now
-                if not hasattr(vc, 'pause_start_time'):
-                    vc.pause_start_time = current_time
-                else:
-                    # Disconnect if paused for 5 minutes (300 seconds) or more
-                    if current_time - vc.pause_start_time >= 300:
-                        if self.first_channel:
-                            await self.first_channel.send(embed=paused_timeout_embed())
-                            self.first_channel = None
-                        await self.cleanup_voice_resources(vc)
-                        continue
-            else:
-                # If not paused, remove the pause start time marker if it exists
-                if hasattr(vc, 'pause_start_time'):
-                    del vc.pause_start_time
-
-            if not vc.is_playing() and not vc.is_paused():
-                # Record inactivity start time if not already set
-                if not hasattr(vc, 'inactivity_start_time'):
-                    vc.inactivity_start_time = current_time
-                else:
-                    # Disconnect if inactive for 3 minutes (180 seconds) or more
-                    if current_time - vc.inactivity_start_time >= 180:
-                        if self.first_channel:
-                            await self.first_channel.send(embed=inactivity_timeout_embed())
-                            self.first_channel = None
-                        await self.cleanup_voice_resources(vc)
-                        continue
-            else:
-                # Remove inactivity marker if the bot is playing or paused
-                if hasattr(vc, 'inactivity_start_time'):
-                    del vc.inactivity_start_time
+        self.idle_timeout = idle_timeout
+        self.paused_timeout = paused_timeout
+        self.scheduler = DeadlineScheduler()
+        self.channels = {}  # guild_id -> text channel that receives the disconnect message
+
+    def set_channel(self, guild_id, channel):
+        """
+        Stores the text channel where the disconnect message of a guild is sent.
+
+        Args:
+            guild_id: The guild ID.
+            channel: The text channel used for playback commands.
+        """
+        self.channels[guild_id] = channel
+
+    def arm_idle(self, guild_id, channel=None):
+        """
+        Arms the idle disconnect deadline of a guild (e.g. right after joining or when the queue ends).
+
+        Args:
+            guild_id: The guild ID.
+            channel: Optional text channel for the disconnect message.
+        """
+        if channel is not None:
+            self.set_channel(guild_id, channel)
+        self.scheduler.arm(guild_id, self.idle_timeout, lambda: self.expire(guild_id, paused=False))
+
+    def arm_paused(self, guild_id):
+        """
+        Arms the paused disconnect deadline of a guild.
+
+        Args:
+            guild_id: The guild ID.
+        """
+        self.scheduler.arm(guild_id, self.paused_timeout, lambda: self.expire(guild_id, paused=True))
+
+    def disarm(self, guild_id):
+        """
+        Cancels the disconnect deadline of a guild (playback started or resumed).
+
+        Args:
+            guild_id: The guild ID.
+        """
+        self.scheduler.cancel(guild_id)
+
+    def forget(self, guild_id):
+        """
+        Drops every inactivity state of a guild (the bot left its voice channel).
+
+        Args:
+            guild_id: The guild ID.
+        """
+        self.scheduler.cancel(guild_id)
+        self.channels.pop(guild_id, None)
+
+    def on_playback_state(self, guild_id, state):
+        """
+        Playback state listener: arms or cancels the guild's deadline.
+
+        Args:
+            guild_id: The guild whose playback state changed.
+            state: The new PlaybackState.
+        """
+        if state is PlaybackState.IDLE:
+            self.arm_idle(guild_id)
+        elif state is PlaybackState.PAUSED:
+            self.arm_paused(guild_id)
+        else:
+            self.disarm(guild_id)
+
+    async def expire(self, guild_id, *, paused):
+        """
+        Disconnects a guild whose deadline expired, if it is still inactive.
+
+        Args:
+            guild_id: The guild ID.
+            paused: Whether the expired deadline was the paused one.
+        """
+        guild = self.bot.get_guild(guild_id)
+        vc = guild.voice_client if guild else None
+        if vc is None:
+            return self.forget(guild_id)
+        # Playback may have resumed without a state change reaching this handler
+        if vc.is_playing() or (vc.is_paused() and not paused):
+            return
+
+        channel = self.channels.get(guild_id)
+        if channel:
+            try:
+                await channel.send(embed=paused_timeout_embed() if paused else inactivity_timeout_embed())
+            except disnake.HTTPException as e:
+                logger.warning(f"Could not send disconnect message: {str(e)}")
+        await self.cleanup_voice_resources(vc)
 
     async def cleanup_voice_resources(self, vc):
         """
         Cleans up resources and disconnects the bot from the voice channel.
-        
+        Delegates to the Leave cog when it is loaded, so both paths clean up the same way.
+
         Args:
             vc: The voice client instance to disconnect.
         """
         if vc is None:
             return
+        self.forget(vc.guild.id)
 
-        # Stop any ongoing audio playback
+        if leave_cog := self.bot.get_cog('Leave'):
+            return await leave_cog.cleanup_voice_resources(vc)
+
+        # Stop any ongoing audio playback (the source's cleanup unpins its cached file)
         vc.stop()
-        if vc.source:
-            try:
-                # Call source cleanup if available to free internal buffers/resources
-                if hasattr(vc.source, "cleanup"):
-                    vc.source.cleanup()
-                # Remove any downloaded file associated with the source
-                if hasattr(vc.source, "filename") and vc.source.filename:
-                    os.remove(vc.source.filename)
-            except Exception as e:
-                print(f"Error during cleanup: {e}")
-
-        # Clear the music queue and played tracks from the queue manager
-        self.queue_manager.music_queue.clear()
-        self.queue_manager.clear_played()
+        # Drop this guild's music queue and played tracks from the queue manager
+        self.queue_manager.registry.remove(vc.guild.id)
         # Force disconnect from the voice channel
         await vc.disconnect(force=True)
 
-    @inactivity_timer.before_loop
-    async def before_inactivity(self):
+    def cog_unload(self):
         """
-        Waits until the bot is ready before starting the inactivity timer loop.
+        Cancels every pending deadline.
         """
-        await self.bot.wait_until_ready()
+        self.scheduler.close()
 
 def setup(bot):
     """
     Sets up the InactivityHandler cog.
-    
+
     Args:
         bot: The instance of the bot.
     """
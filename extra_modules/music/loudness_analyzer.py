@@ -0,0 +1,184 @@
+import os  # For reading the normalization settings from the environment
+import re  # For parsing the ebur128 summary printed by FFmpeg
+import asyncio  # For the background analysis tasks
+import logging  # For reporting failed analyses
+import subprocess  # For running the FFmpeg analysis pass
+from typing import Any, Callable, Dict, Optional
+
+from utils.audio_cache import audio_cache, cache_key  # Pins analyzed files; video keys of the measurements
+from utils.blocking import run_blocking  # Runs FFmpeg in the dedicated loudness thread pool
+from utils.loudness_cache import Loudness, LoudnessStore, loudness_cache  # Persistent per-video measurements
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Whether tracks are played at a common loudness
+LOUDNESS_NORMALIZATION = os.getenv('LOUDNESS_NORMALIZATION', 'true').lower() in ('1', 'true', 'yes')
+# Integrated loudness every track is brought to, in LUFS (YouTube normalizes to about -14)
+LOUDNESS_TARGET = float(os.getenv('LOUDNESS_TARGET', '-14'))
+# Largest boost applied to quiet tracks, in dB
+LOUDNESS_MAX_BOOST = float(os.getenv('LOUDNESS_MAX_BOOST', '6'))
+# Tracks this close to the target are left alone, so they keep the Opus passthrough
+LOUDNESS_TOLERANCE = float(os.getenv('LOUDNESS_TOLERANCE', '1'))
+# Seconds of a streamed track that are analyzed (the whole file is analyzed once downloaded)
+LOUDNESS_STREAM_SECONDS = float(os.getenv('LOUDNESS_STREAM_SECONDS', '60'))
+
+PEAK_HEADROOM = 1.0  # dB kept below full scale when boosting
+
+_INTEGRATED = re.compile(r'I:\s*(-?[\d.]+|-inf)\s*LUFS')
+_PEAK = re.compile(r'Peak:\s*(-?[\d.]+|-inf)\s*dBFS')
+
+
+def parse_ebur128(output: str) -> Optional[Loudness]:
+    """
+    Reads the integrated loudness and true peak from FFmpeg's ebur128 summary.
+
+    Args:
+        output: FFmpeg's stderr.
+
+    Returns:
+        The measurement (not partial), or None if the summary is missing or the track is silent.
+    """
+    summary = output[output.rfind('Summary:'):]
+    integrated, peak = _INTEGRATED.search(summary), _PEAK.search(summary)
+    if not integrated or integrated.group(1) == '-inf':
+        return None
+    peak_value = float(peak.group(1)) if peak and peak.group(1) != '-inf' else 0.0
+    return Loudness(float(integrated.group(1)), peak_value, False)
+
+
+def measure(path: str, seconds: Optional[float] = None) -> Optional[Loudness]:
+    """
+    Measures a file or stream URL with an FFmpeg ebur128 pass (blocking).
+
+    Args:
+        path: Local file or direct audio URL.
+        seconds: Only analyze the beginning of the track.
+
+    Returns:
+        The measurement, or None if FFmpeg could not analyze the input.
+    """
+    command = ['ffmpeg', '-nostats', '-hide_banner', '-vn']
+    if seconds:
+        command += ['-t', str(seconds)]
+    command += ['-i', path, '-af', 'ebur128=peak=true', '-f', 'null', '-']
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, errors='replace')
+    loudness = parse_ebur128(result.stderr)
+    if loudness and seconds:
+        loudness = loudness._replace(partial=True)
+    return loudness
+
+
+def normalization_gain(loudness: Optional[Loudness], *, target: float = LOUDNESS_TARGET,
+                       max_boost: float = LOUDNESS_MAX_BOOST, tolerance: float = LOUDNESS_TOLERANCE) -> float:
+    """
+    Computes the gain that brings a track to the target loudness.
+    Boosts are limited so the true peak stays below full scale; a quiet track whose
+    peak leaves no headroom is left as it is rather than attenuated.
+
+    Args:
+        loudness: The track's measurement, or None if it was not analyzed yet.
+        target: Target integrated loudness in LUFS.
+        max_boost: Largest boost in dB.
+        tolerance: Gains smaller than this are not applied.
+
+    Returns:
+        The gain in dB (0.0 if unknown or within the tolerance).
+    """
+    if loudness is None:
+        return 0.0
+    gain = target - loudness.integrated
+    if gain > 0:
+        gain = max(0.0, min(gain, max_boost, -PEAK_HEADROOM - loudness.peak))
+    return gain if abs(gain) >= tolerance else 0.0
+
+
+class LoudnessAnalyzer:
+    """
+    Measures every track once in the background and provides its normalization gain.
+
+    Looking up the gain at track start only reads the loudness cache, so it adds no
+    latency. The first play of a track is not normalized; meanwhile it is analyzed
+    in the 'loudness' thread pool (the whole file if it was downloaded, the first
+    seconds if it is streamed), and every later play starts with the right gain.
+    """
+
+    def __init__(self, store: LoudnessStore, *, measure: Callable = measure, enabled: bool = LOUDNESS_NORMALIZATION,
+                 stream_seconds: float = LOUDNESS_STREAM_SECONDS):
+        """
+        Initializes the LoudnessAnalyzer.
+
+        Args:
+            store: Persistent cache of the measurements.
+            measure: Blocking function measuring a file or URL, as measure(path, seconds).
+            enabled: Whether gains are applied and tracks analyzed.
+            stream_seconds: Seconds analyzed for streamed tracks.
+        """
+        self.store = store
+        self.measure = measure
+        self.enabled = enabled
+        self.stream_seconds = stream_seconds
+        self.pending: Dict[str, asyncio.Task] = {}  # Video key -> analysis in progress
+
+    def gain_db(self, info: Dict[str, Any]) -> float:
+        """
+        Returns the normalization gain of a track from the cache.
+
+        Args:
+            info: The track's yt-dlp info.
+
+        Returns:
+            The gain in dB, 0.0 if the track was not analyzed yet.
+        """
+        key = cache_key(info)
+        if not self.enabled or key is None:
+            return 0.0
+        return normalization_gain(self.store.get(key))
+
+    def schedule(self, info: Dict[str, Any], filename: Optional[str] = None) -> Optional[asyncio.Task]:
+        """
+        Starts analyzing a track in the background unless it is already measured.
+        A streamed track measured partially is measured again once it is downloaded.
+
+        Args:
+            info: The track's yt-dlp info.
+            filename: The downloaded file, if any; otherwise the stream URL is analyzed.
+
+        Returns:
+            The analysis task, or None if nothing needs to be analyzed.
+        """
+        key = cache_key(info)
+        if not self.enabled or key is None or key in self.pending:
+            return None
+        current = self.store.get(key)
+        if current is not None and (not current.partial or not filename):
+            return None
+        path = filename or info.get('url')
+        if not path:
+            return None
+        if filename:
+            audio_cache.acquire(filename)  # Keep the file in the cache until it is analyzed
+        task = asyncio.ensure_future(self._analyze(key, path, filename))
+        self.pending[key] = task
+        return task
+
+    async def _analyze(self, key, path, filename):
+        try:
+            await run_blocking(
+                'loudness', self._measure_and_store, key, path, None if filename else self.stream_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Loudness analysis of {key} failed: {str(e)}")
+        finally:
+            self.pending.pop(key, None)
+            if filename:
+                audio_cache.release(filename)
+
+    def _measure_and_store(self, key, path, seconds):
+        """Measures a track and writes the result to the store, all in the 'loudness' pool."""
+        loudness = self.measure(path, seconds)
+        if loudness is not None:
+            self.store.put(key, loudness)
+
+
+# Shared analyzer backed by the persistent loudness cache
+loudness_analyzer = LoudnessAnalyzer(loudness_cache)
@@ -0,0 +1,187 @@
+import math  # For the equal-power crossfade curves
+import threading  # Guards the hand-over between the event loop and the audio thread
+from typing import Callable, Optional
+
+import disnake  # Discord API wrapper for Python
+
+from extra_modules.music.audio_pipeline import FRAME_SECONDS  # Duration of one frame
+from extra_modules.music.dsp import np  # NumPy (None if not installed) for mixing frames
+
+Transition = Callable[[disnake.AudioSource, disnake.AudioSource], None]
+
+
+class MixerSource(disnake.AudioSource):
+    """
+    Audio source that owns the current track and, once it is opened ahead of time,
+    the next one, so the voice client plays a whole run of tracks without stopping.
+
+    When the current track ends, the first frame of the next one is returned by the
+    same read, so there is no gap at all. With a crossfade, the last seconds of the
+    current track are mixed with the first seconds of the next one using
+    equal-power curves, one NumPy operation per frame. Crossfades need both tracks
+    decoded to PCM; Opus passthrough tracks are joined back to back instead.
+
+    read() runs in the voice client's audio thread. queue_next, cancel_next and
+    replace_current are called from the event loop; the hand-over happens under a
+    lock, and a next track that started fading in can no longer be cancelled.
+    is_opus() describes the last frame returned, so the voice client encodes every
+    frame according to the track it came from, even when the track changes between
+    two frames.
+    """
+
+    def __init__(self, current, *, crossfade: float = 0.0, on_transition: Optional[Transition] = None):
+        """
+        Initializes the MixerSource.
+
+        Args:
+            current: Source of the track to play first.
+            crossfade: Seconds consecutive tracks overlap (0 joins them back to back).
+            on_transition: Called from the audio thread with (previous, current) whenever
+                playback moves on to the next track.
+        """
+        self.current = current
+        self.next = None  # Source of the following track, once opened
+        self.crossfade = crossfade if np is not None else 0.0
+        self.on_transition = on_transition
+        self.transitions = 0  # Tracks started by this mixer after the first one
+        self._fading = None  # Next source that already started fading in
+        self._opus = current.is_opus()  # Whether the last frame returned is an Opus packet
+        self._lock = threading.Lock()
+
+    def queue_next(self, source) -> bool:
+        """
+        Hands over the already opened source of the following track.
+
+        Returns:
+            False if a next track is already queued (the caller keeps the source).
+        """
+        with self._lock:
+            if self.next is not None:
+                return False
+            self.next = source
+            return True
+
+    def cancel_next(self):
+        """
+        Takes back the queued next track (e.g. when the queue changed).
+
+        Returns:
+            The source, which the caller must clean up, or None if there was none or
+            it is already fading in.
+        """
+        with self._lock:
+            if self.next is None or self.next is self._fading:
+                return None
+            source, self.next = self.next, None
+            return source
+
+    def replace_current(self, previous, source) -> bool:
+        """
+        Swaps the source of the current track (e.g. reopened at another volume).
+
+        Args:
+            previous: The source expected to be current; the caller cleans it up once it is no longer read.
+            source: Its replacement.
+
+        Returns:
+            False if playback already moved on from `previous` (the caller keeps `source`).
+        """
+        with self._lock:
+            if self.current is not previous:
+                return False
+            self.current = source
+            self._fading = None  # Re-evaluated from the new source's position
+            return True
+
+    @property
+    def fading(self) -> bool:
+        """True while the next track is fading in."""
+        return self._fading is not None
+
+    def __getattr__(self, name):
+        # Commands read the track's metadata (title, duration, volume, ...) from the voice
+        # client's source; hand them the current track's
+        if name.startswith('_') or name == 'current':
+            raise AttributeError(name)
+        return getattr(self.current, name)
+
+    def is_opus(self):
+        return self._opus
+
+    def remaining(self, source) -> Optional[float]:
+        """Seconds left in a track, if its duration is known."""
+        duration = getattr(source, 'duration', None)
+        if not duration:
+            return None
+        return duration - source.position
+
+    def read(self):
+        with self._lock:
+            current, upcoming = self.current, self.next
+        if upcoming is not None and self._should_fade(current, upcoming):
+            self._opus = False  # Both tracks are decoded to PCM while they overlap
+            return self._mix(current, upcoming)
+        frame = current.read()
+        if not frame and upcoming is not None and self._advance(current, upcoming):
+            current, frame = upcoming, upcoming.read()
+        self._opus = current.is_opus()
+        return frame
+
+    def _should_fade(self, current, upcoming):
+        if upcoming is self._fading:
+            return True
+        if self.crossfade <= 0 or current.is_opus() or upcoming.is_opus():
+            return False
+        remaining = self.remaining(current)
+        if remaining is None or remaining > self.crossfade:
+            return False
+        with self._lock:
+            if self.next is not upcoming:
+                return False  # Cancelled meanwhile
+            self._fading = upcoming
+        return True
+
+    def _mix(self, current, upcoming):
+        """Mixes one frame of the ending track with one frame of the next track."""
+        before = self.remaining(current) or 0.0
+        outgoing = current.read()
+        incoming = upcoming.read()
+        if not outgoing:
+            # The current track ended: the next one carries on from the frame just read
+            self._advance(current, upcoming)
+            return incoming
+        if not incoming:
+            return outgoing
+
+        a = np.frombuffer(outgoing, dtype=np.int16).reshape(-1, 2).astype(np.float32)
+        b = np.frombuffer(incoming, dtype=np.int16).reshape(-1, 2).astype(np.float32)
+        if len(b) < len(a):
+            b = np.pad(b, ((0, len(a) - len(b)), (0, 0)))
+        b = b[:len(a)]
+        # Fade progress from 0 (only the current track) to 1 (only the next one) over this frame
+        start = 1.0 - min(max(before / self.crossfade, 0.0), 1.0)
+        end = min(start + FRAME_SECONDS / self.crossfade, 1.0)
+        angle = np.linspace(start, end, len(a), dtype=np.float32)[:, None] * (math.pi / 2)
+        mixed = a * np.cos(angle) + b * np.sin(angle)
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype(np.int16).tobytes()
+
+    def _advance(self, previous, upcoming) -> bool:
+        """Makes the next track the current one and reports the transition."""
+        with self._lock:
+            if self.next is not upcoming:
+                return False  # Cancelled meanwhile
+            self.current, self.next, self._fading = upcoming, None, None
+            self.transitions += 1
+        previous.cleanup()
+        if self.on_transition:
+            self.on_transition(previous, upcoming)
+        return True
+
+    def cleanup(self):
+        with self._lock:
+            sources = [self.current, self.next]
+            self.next = None
+        for source in sources:
+            if source is not None:
+                source.cleanup()
@@ -0,0 +1,95 @@
+import logging  # For reporting messages that could not be sent
+from typing import Dict, Optional
+
+import disnake  # Discord API wrapper for Python
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+
+class GuildNotifier:
+    """
+    Posts and updates the music status messages of one guild.
+
+    The notifier only keeps the guild's text channel (bound by the last music
+    command used there) and the status messages it posted, so background
+    playback never needs to retain or fabricate a command context, and its
+    messages always go to the guild they belong to. Send failures are logged
+    instead of interrupting playback.
+    """
+
+    def __init__(self, guild_id: int, channel=None):
+        """
+        Initializes the GuildNotifier.
+
+        Args:
+            guild_id: The guild this notifier belongs to.
+            channel: Optional text channel to post to.
+        """
+        self.guild_id = guild_id
+        self.channel = channel
+        self._messages: Dict[str, disnake.Message] = {}  # Status key -> message that is edited in place
+
+    def bind(self, channel) -> None:
+        """
+        Sets the text channel that receives this guild's messages.
+        Status messages posted in a previous channel are no longer edited.
+
+        Args:
+            channel: The text channel of the last music command.
+        """
+        if channel is not self.channel:
+            self._messages.clear()
+        self.channel = channel
+
+    async def send(self, embed) -> Optional[disnake.Message]:
+        """
+        Posts a new message.
+
+        Args:
+            embed: The embed to post.
+
+        Returns:
+            The posted message, or None if there is no channel or sending failed.
+        """
+        if self.channel is None:
+            return None
+        try:
+            return await self.channel.send(embed=embed)
+        except disnake.HTTPException as e:
+            logger.warning(f"Could not send message in guild {self.guild_id}: {str(e)}")
+            return None
+
+    async def update(self, key: str, embed) -> Optional[disnake.Message]:
+        """
+        Edits the status message stored under `key`, posting it first if needed.
+
+        Args:
+            key: Identifies the status message (e.g. 'playlist').
+            embed: The new content of the message.
+
+        Returns:
+            The status message, or None if it could not be posted.
+        """
+        message = self._messages.get(key)
+        if message is not None:
+            try:
+                await message.edit(embed=embed)
+                return message
+            except disnake.NotFound:
+                pass  # Deleted by someone: post a new one
+            except disnake.HTTPException as e:
+                logger.warning(f"Could not update message in guild {self.guild_id}: {str(e)}")
+                return message
+        message = await self.send(embed)
+        if message is not None:
+            self._messages[key] = message
+        return message
+
+    def forget(self, key: str) -> None:
+        """
+        Stops editing a status message; the next update of `key` posts a new one.
+
+        Args:
+            key: Identifies the status message.
+        """
+        self._messages.pop(key, None)
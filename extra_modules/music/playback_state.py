@@ -0,0 +1,125 @@
+import enum  # For the set of playback states
+import logging  # For reporting invalid transitions
+import time  # For measuring how long each state lasted
+from typing import Callable, Optional
+
+from utils.metrics import metrics  # Transition latency metrics
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+
+class PlaybackState(enum.Enum):
+    """The playback states of a guild."""
+
+    IDLE = 'idle'  # Nothing playing; the next event may start a track
+    RESOLVING = 'resolving'  # A track was dequeued and its audio is being prepared
+    PLAYING = 'playing'  # Audio is being sent to the voice channel
+    PAUSED = 'paused'  # A track is loaded but paused
+
+
+# Allowed transitions from each state
+TRANSITIONS = {
+    PlaybackState.IDLE: {PlaybackState.RESOLVING},
+    PlaybackState.RESOLVING: {PlaybackState.PLAYING, PlaybackState.IDLE},
+    PlaybackState.PLAYING: {PlaybackState.PAUSED, PlaybackState.IDLE},
+    PlaybackState.PAUSED: {PlaybackState.PLAYING, PlaybackState.IDLE},
+}
+
+
+class PlaybackStateMachine:
+    """
+    Playback state of one guild, advanced by events instead of polling.
+
+    Events (a track was enqueued, a track ended, playback failed) call `begin`,
+    which only succeeds while the guild is idle, so concurrent events start at
+    most one track. Every transition records how long the previous state lasted
+    as `playback.<old>_to_<new>`, and reaching PLAYING records the latency from
+    the event that started the track as `playback.advance.<event>`.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        clock: Callable[[], float] = time.perf_counter,
+        on_change: Optional[Callable[[int, PlaybackState], None]] = None
+    ):
+        """
+        Initializes the PlaybackStateMachine.
+
+        Args:
+            guild_id: The guild whose playback is tracked.
+            clock: Function returning the current time in seconds (useful in tests).
+            on_change: Optional callable notified with (guild_id, new_state) after every transition.
+        """
+        self.guild_id = guild_id
+        self.clock = clock
+        self.on_change = on_change
+        self.state = PlaybackState.IDLE
+        self.changed_at = clock()  # When the current state was entered
+        self.event: Optional[str] = None  # Event that started the track being resolved or played
+
+    def transition(self, new_state: PlaybackState) -> bool:
+        """
+        Moves to a new state if the transition is allowed.
+
+        Args:
+            new_state: The state to move to.
+
+        Returns:
+            bool: True if the state changed; False if the transition is not allowed.
+        """
+        old_state = self.state
+        if new_state not in TRANSITIONS[old_state]:
+            logger.debug(f"Ignoring playback transition {old_state.value} -> {new_state.value} in guild {self.guild_id}")
+            return False
+        now = self.clock()
+        metrics.record(f'playback.{old_state.value}_to_{new_state.value}', now - self.changed_at)
+        self.state = new_state
+        self.changed_at = now
+        if self.on_change:
+            self.on_change(self.guild_id, new_state)
+        return True
+
+    def begin(self, event: str) -> bool:
+        """
+        Claims the guild to start the next track (IDLE -> RESOLVING).
+
+        Args:
+            event: What triggered the advance ('enqueue', 'track_end', 'error', 'command', 'watchdog').
+
+        Returns:
+            bool: True if the caller should start the next track; False if the guild is busy.
+        """
+        if not self.transition(PlaybackState.RESOLVING):
+            return False
+        self.event = event
+        return True
+
+    def started(self) -> bool:
+        """Marks the resolved track as playing (RESOLVING -> PLAYING)."""
+        resolving_since = self.changed_at
+        if not self.transition(PlaybackState.PLAYING):
+            return False
+        metrics.record(f'playback.advance.{self.event}', self.changed_at - resolving_since)
+        return True
+
+    def pause(self) -> bool:
+        """Marks the current track as paused (PLAYING -> PAUSED)."""
+        return self.transition(PlaybackState.PAUSED)
+
+    def resume(self) -> bool:
+        """Marks the current track as playing again (PAUSED -> PLAYING)."""
+        return self.transition(PlaybackState.PLAYING)
+
+    def stop(self) -> bool:
+        """Returns to IDLE after a track ended, failed or was never found."""
+        if self.state is PlaybackState.IDLE:
+            return False
+        self.event = None
+        return self.transition(PlaybackState.IDLE)
+
+    @property
+    def idle(self) -> bool:
+        """Whether the next event may start a track."""
+        return self.state is PlaybackState.IDLE
+
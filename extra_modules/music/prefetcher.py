@@ -0,0 +1,139 @@
+import asyncio  # For background prefetch tasks
+import logging  # For logging prefetch failures
+import os  # For reading configuration and checking pre-downloaded files
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Number of upcoming tracks resolved ahead of time in each guild
+PREFETCH_DEPTH = int(os.getenv('PREFETCH_DEPTH', '2'))
+# Whether upcoming tracks are also downloaded ahead of time (useful in download playback mode)
+PREFETCH_DOWNLOAD = os.getenv('PREFETCH_DOWNLOAD', 'false').lower() in ('1', 'true', 'yes')
+
+
+class Prefetcher:
+    """
+    Resolves the next tracks of every guild queue in the background.
+
+    While the current track plays, the next `depth` queued tracks are resolved
+    (and optionally downloaded) so that play_next finds them already in the
+    metadata cache. Work for tracks that leave the prefetch window because they
+    were removed, skipped or cleared is cancelled. Pre-downloaded files stay
+    pinned until they are handed to the player or discarded.
+    """
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Awaitable],
+        download: Optional[Callable[[str], Awaitable[Tuple[dict, str]]]] = None,
+        depth: int = PREFETCH_DEPTH,
+        release: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initializes the Prefetcher.
+
+        Args:
+            resolve: Coroutine function that resolves a track URL and fills the metadata cache.
+            download: Optional coroutine function returning (info, filename) after downloading a URL.
+            depth: Number of upcoming tracks to prefetch per guild.
+            release: Optional callable unpinning a downloaded file that will not be played.
+        """
+        self.resolve = resolve
+        self.download = download
+        self.depth = depth
+        self.release = release
+        self._tasks: Dict[int, Dict[str, asyncio.Task]] = {}  # guild_id -> {url: task}
+        self._downloads: Dict[Tuple[int, str], Tuple[dict, str]] = {}  # (guild_id, url) -> (info, filename)
+
+    def on_queue_changed(self, queue, event):
+        """
+        Queue listener: reconciles the prefetch window with the guild's queue.
+
+        Args:
+            queue: The GuildQueue that changed.
+            event: The kind of change ('add', 'next', 'remove' or 'clear').
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Queue changed outside the event loop (e.g. in tests); nothing to schedule
+
+        wanted = [track.url for track in queue.peek(self.depth)]
+        current = queue.current_track.url if queue.current_track else None
+        tasks = self._tasks.setdefault(queue.guild_id, {})
+
+        # Cancel work for tracks that left the window, except the one that just started
+        # playing: its resolve is about to be used by play_next
+        for url in list(tasks):
+            if url not in wanted:
+                task = tasks.pop(url)
+                if url != current:
+                    task.cancel()
+                    self._discard_download(queue.guild_id, url)
+
+        for url in wanted:
+            if url not in tasks:
+                tasks[url] = loop.create_task(self._prefetch(queue.guild_id, url))
+
+        if not tasks:
+            self._tasks.pop(queue.guild_id, None)
+
+    async def _prefetch(self, guild_id, url):
+        """
+        Resolves (and optionally downloads) one track.
+
+        Args:
+            guild_id: The guild whose queue contains the track.
+            url: The track URL to prefetch.
+        """
+        try:
+            if self.download and PREFETCH_DOWNLOAD:
+                if (guild_id, url) not in self._downloads:
+                    self._downloads[(guild_id, url)] = await self.download(url)
+            else:
+                await self.resolve(url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # A failed prefetch is not fatal: play_next will resolve the track itself
+            logger.warning(f"Prefetch failed for {url}: {str(e)}")
+
+    def take_download(self, guild_id, url):
+        """
+        Hands a pre-downloaded track over to the player, together with its file pin.
+
+        Args:
+            guild_id: The guild that is about to play the track.
+            url: The track URL.
+
+        Returns:
+            A tuple (info, filename) if the track was downloaded ahead of time; otherwise None.
+        """
+        prefetched = self._downloads.pop((guild_id, url), None)
+        if prefetched and os.path.exists(prefetched[1]):
+            return prefetched
+        if prefetched and self.release:
+            self.release(prefetched[1])
+        return None
+
+    def _discard_download(self, guild_id, url):
+        """
+        Unpins a pre-downloaded file that will no longer be played.
+        The file itself stays in the audio cache in case the track is queued again.
+
+        Args:
+            guild_id: The guild whose queue contained the track.
+            url: The track URL.
+        """
+        prefetched = self._downloads.pop((guild_id, url), None)
+        if prefetched and self.release:
+            self.release(prefetched[1])
+
+    def cancel_all(self):
+        """Cancels every pending prefetch and unpins unused pre-downloaded files."""
+        for tasks in self._tasks.values():
+            for task in tasks.values():
+                task.cancel()
+        self._tasks.clear()
+        for guild_id, url in list(self._downloads):
+            self._discard_download(guild_id, url)
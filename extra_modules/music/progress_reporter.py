@@ -0,0 +1,167 @@
+import os  # For reading the update interval from the environment
+import time  # For throughput and ETA measurements
+import asyncio  # For the background task that publishes coalesced updates
+import logging  # For reporting failed progress updates
+from typing import Awaitable, Callable, Optional
+
+import disnake  # Discord API wrapper for Python
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Minimum seconds between two edits of a progress message
+PROGRESS_UPDATE_INTERVAL = float(os.getenv('PROGRESS_UPDATE_INTERVAL', '2'))
+# Longest delay between edits after backing off from rate limits
+PROGRESS_MAX_INTERVAL = float(os.getenv('PROGRESS_MAX_INTERVAL', '30'))
+
+
+class ProgressReporter:
+    """
+    Reports the progress of a bulk enqueue (e.g. a playlist ingestion) in one message.
+
+    Counting is synchronous and never waits on Discord: `advance` and `skip` only
+    update the counters and wake a background task, which edits the message at most
+    once per interval with the latest counts, so any number of updates between two
+    edits costs a single request. When an edit is rate limited (a 429, or disnake
+    holding the request back until the bucket resets), the interval is stretched
+    to the observed delay instead of queueing more edits behind it.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[disnake.Embed], Awaitable[object]],
+        render: Callable[['ProgressReporter'], disnake.Embed],
+        total: Optional[int] = None,
+        *,
+        interval: float = PROGRESS_UPDATE_INTERVAL,
+        max_interval: float = PROGRESS_MAX_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initializes the ProgressReporter.
+
+        Args:
+            publish: Coroutine function posting or editing the progress message with an embed.
+            render: Callable building the progress embed from the reporter.
+            total: Number of items expected, if known.
+            interval: Minimum seconds between two edits.
+            max_interval: Upper bound of the interval after rate-limit backoff.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.publish = publish
+        self.render = render
+        self.total = total
+        self.interval = interval
+        self.max_interval = max_interval
+        self.clock = clock
+        self.added = 0  # Items enqueued
+        self.skipped = 0  # Items that could not be enqueued
+        self.current = None  # Title of the last enqueued item
+        self.edits = 0  # Messages published so far
+        self.started_at = clock()
+        self._delay = interval  # Current interval, stretched while rate limited
+        self._next_edit = self.started_at  # Earliest time of the next edit
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def processed(self) -> int:
+        """Items handled so far, enqueued or skipped."""
+        return self.added + self.skipped
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the reporter was created."""
+        return self.clock() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Items handled per second."""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until every item is handled, or None if unknown."""
+        rate = self.rate
+        if self.total is None or rate <= 0:
+            return None
+        return max(self.total - self.processed, 0) / rate
+
+    def advance(self, count: int = 1, current: Optional[str] = None) -> None:
+        """
+        Counts enqueued items and schedules an update of the message.
+
+        Args:
+            count: Number of items enqueued.
+            current: Title of the last enqueued item.
+        """
+        self.added += count
+        if current:
+            self.current = current
+        self._touch()
+
+    def skip(self, count: int = 1) -> None:
+        """
+        Counts items that could not be enqueued and schedules an update of the message.
+
+        Args:
+            count: Number of items skipped.
+        """
+        self.skipped += count
+        self._touch()
+
+    def _touch(self):
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        """Publishes the latest counts whenever the interval allows, until nothing changed."""
+        while self._dirty:
+            wait = self._next_edit - self.clock()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await self._publish()
+
+    async def start(self, embed: Optional[disnake.Embed] = None) -> None:
+        """
+        Posts the progress message right away; later updates wait for the interval.
+
+        Args:
+            embed: Optional first embed (e.g. "processing N tracks"); defaults to the rendered progress.
+        """
+        await self._publish(embed)
+
+    async def _publish(self, embed=None):
+        self._dirty = False
+        started = self.clock()
+        retry_after = 0.0
+        try:
+            await self.publish(embed if embed is not None else self.render(self))
+            self.edits += 1
+        except disnake.HTTPException as e:
+            if e.status == 429:
+                retry_after = float(getattr(e, 'retry_after', 0) or self._delay * 2)
+            logger.warning(f"Could not update progress message: {str(e)}")
+        took = self.clock() - started
+        if retry_after or took > self._delay:
+            # Rate limited: space the next edit by the delay Discord imposed
+            self._delay = min(max(retry_after, took, self._delay * 2), self.max_interval)
+        else:
+            self._delay = self.interval
+        self._next_edit = self.clock() + self._delay
+
+    async def close(self) -> None:
+        """
+        Stops the scheduled updates and publishes the final counts if they were not shown yet.
+        """
+        self.cancel()
+        if self._dirty or self.edits == 0:
+            await self._publish()
+
+    def cancel(self) -> None:
+        """Stops the scheduled updates without publishing (e.g. when the ingestion is cancelled)."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            self._dirty = True  # The cancelled edit may not have been sent
+        self._task = None
@@ -0,0 +1,116 @@
+import asyncio  # For concurrent, cancellable resolution tasks
+import os  # For reading configuration from environment variables
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+# Maximum number of YouTube searches running at the same time for one playlist
+SPOTIFY_RESOLVE_WORKERS = int(os.getenv('SPOTIFY_RESOLVE_WORKERS', '3'))
+
+
+def fetch_playlist_items(sp, url) -> List[dict]:
+    """
+    Fetches every track of a Spotify playlist, following pagination.
+
+    `sp.playlist_tracks` only returns the first page (100 items); the remaining
+    pages are requested through `sp.next` until the playlist is exhausted.
+    This is a blocking call and must run in an executor.
+
+    Args:
+        sp: The Spotify API client.
+        url: The playlist URL, URI or ID.
+
+    Returns:
+        list: The playlist's track objects in playlist order (local or removed tracks are skipped).
+    """
+    tracks = []
+    page = sp.playlist_tracks(url)
+    while page:
+        tracks.extend(item['track'] for item in page['items'] if item.get('track'))
+        page = sp.next(page) if page.get('next') else None
+    return tracks
+
+
+class PlaylistResolver:
+    """
+    Resolves Spotify tracks to YouTube URLs with bounded parallelism.
+
+    Tracks already present in the mapping store are answered without searching.
+    The remaining searches fan out across at most `workers` concurrent tasks, but
+    results are yielded strictly in playlist order, as soon as every earlier track
+    is done. Closing or cancelling the consumer cancels all outstanding searches.
+    """
+
+    def __init__(
+        self,
+        search: Callable[[str], Awaitable[Optional[str]]],
+        workers: int = SPOTIFY_RESOLVE_WORKERS,
+        mapping=None
+    ):
+        """
+        Initializes the PlaylistResolver.
+
+        Args:
+            search: Coroutine function returning the first YouTube URL for a query (or None).
+            workers: Maximum number of concurrent searches.
+            mapping: Optional SpotifyMappingStore consulted before searching and filled afterwards.
+        """
+        self.search = search
+        self.workers = max(1, workers)
+        self.mapping = mapping
+
+    @staticmethod
+    def search_query(track) -> str:
+        """
+        Builds the YouTube search query for a Spotify track.
+
+        Args:
+            track: A Spotify track object.
+
+        Returns:
+            str: "<name> <first artist>".
+        """
+        return f"{track['name']} {track['artists'][0]['name']}"
+
+    async def resolve(self, tracks: List[dict]) -> AsyncIterator[Tuple[dict, Optional[str]]]:
+        """
+        Resolves the given Spotify tracks, yielding results in playlist order.
+
+        Args:
+            tracks: Spotify track objects in playlist order.
+
+        Yields:
+            tuple: (spotify_track, youtube_url or None).
+        """
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def resolve_one(track):
+            async with semaphore:
+                try:
+                    return await self.search(self.search_query(track))
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    return None  # A single failed search must not abort the playlist
+
+        # Tracks mapped by an earlier resolution need no search at all
+        known = await self.mapping.fetch_many(track.get('id') for track in tracks) if self.mapping else {}
+        tasks = [
+            None if track.get('id') in known else asyncio.ensure_future(resolve_one(track))
+            for track in tracks
+        ]
+        resolved = []
+        try:
+            for track, task in zip(tracks, tasks):
+                if task is None:
+                    yield track, known[track['id']].url
+                    continue
+                youtube_url = await task
+                if youtube_url and track.get('id'):
+                    resolved.append((track['id'], youtube_url, track['name']))
+                yield track, youtube_url
+        finally:
+            # Runs on normal completion, on cancellation and when the consumer stops early
+            for task in tasks:
+                if task is not None:
+                    task.cancel()
+            if self.mapping and resolved:
+                self.mapping.save_many(resolved)  # One transaction, written off the event loop
@@ -0,0 +1,344 @@
+import asyncio  # For timeouts and the concurrency limit
+import logging  # For reporting cookie loading problems
+import os  # For locating the cookies file and reading configuration
+import threading  # For keeping one YoutubeDL instance per worker thread
+from typing import Any, Dict, List, Optional, Tuple
+
+import yt_dlp as youtube_dlp  # Library for extracting information from YouTube (fork of youtube-dl)
+
+from utils.audio_cache import audio_cache, cache_key  # Disk cache of downloaded audio files
+from utils.blocking import run_blocking  # Runs the extractions in the dedicated yt-dlp thread pool
+from utils.metadata_cache import metadata_cache  # Shared LRU+TTL cache of yt-dlp extraction results
+from utils.search_cache import search_cache  # Normalized-query cache of search results
+from utils.single_flight import SingleFlight  # Joins concurrent extractions of the same URL
+
+logger = logging.getLogger(__name__)  # Create a logger for this module
+
+# Define the project root by going up two directories from the current file's directory
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Cookies file shared by every extraction (authenticated requests)
+COOKIES_FILE = os.getenv('YTDL_COOKIES_FILE', os.path.join(project_root, 'cookies.txt'))
+
+# Maximum number of extractions running at the same time (waiting callers queue up)
+YTDL_MAX_CONCURRENCY = int(os.getenv('YTDL_MAX_CONCURRENCY', os.getenv('BLOCKING_YTDL_WORKERS', '4')))
+# Seconds before a search or metadata extraction is abandoned
+YTDL_TIMEOUT = float(os.getenv('YTDL_TIMEOUT', '30'))
+# Seconds before a download is abandoned
+YTDL_DOWNLOAD_TIMEOUT = float(os.getenv('YTDL_DOWNLOAD_TIMEOUT', '300'))
+
+# Options shared by every YoutubeDL instance of the bot
+ytdl_format_options = {
+    'format': 'bestaudio/best',  # Select the best available audio quality
+    'outtmpl': audio_cache.outtmpl,  # Downloads land in the audio cache, named by extractor and video ID
+    'restrictfilenames': True,  # Restrict filenames to ASCII characters
+    'noplaylist': True,  # A video URL with a list parameter resolves to the video only
+    'nocheckcertificate': True,  # Do not check SSL certificates
+    'ignoreerrors': False,  # Stop on errors
+    'logtostderr': False,  # Do not log messages to stderr
+    'quiet': True,  # Suppress verbose output
+    'no_warnings': True,  # Suppress warnings
+    'default_search': 'auto',  # Automatically search if the input is not a URL
+    'source_address': '0.0.0.0',  # Bind to an IPv4 address to avoid issues with IPv6
+    'socket_timeout': 15  # Seconds before a stalled network request fails
+}
+
+
+def load_cookie_jar(path):
+    """
+    Loads the cookies file once so that every YoutubeDL instance shares the same jar.
+
+    Args:
+        path: Path to a Netscape-format cookies file.
+
+    Returns:
+        The loaded cookie jar, or None if the file is missing or invalid.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        from yt_dlp.cookies import YoutubeDLCookieJar
+        jar = YoutubeDLCookieJar(path)
+        jar.load()
+        return jar
+    except Exception as e:
+        logger.warning(f"Could not load cookies from {path}: {str(e)}")
+        return None
+
+
+class YTDLService:
+    """
+    Single entry point for every yt-dlp extraction made by the bot.
+
+    YoutubeDL instances are not thread-safe, so each worker thread of the yt-dlp
+    pool lazily builds its own instance from the central options; all of them
+    share one cookie jar. Calls are limited to `max_concurrency` at a time and
+    abandoned after a per-call timeout.
+    """
+
+    def __init__(
+        self,
+        options: Optional[Dict[str, Any]] = None,
+        *,
+        cookies_file: Optional[str] = COOKIES_FILE,
+        max_concurrency: int = YTDL_MAX_CONCURRENCY,
+        timeout: float = YTDL_TIMEOUT,
+        download_timeout: float = YTDL_DOWNLOAD_TIMEOUT,
+        factory=youtube_dlp.YoutubeDL
+    ):
+        """
+        Initializes the YTDLService.
+
+        Args:
+            options: YoutubeDL options (defaults to ytdl_format_options).
+            cookies_file: Cookies file shared by every instance (None to disable).
+            max_concurrency: Maximum number of extractions running at the same time.
+            timeout: Default timeout, in seconds, for searches and extractions.
+            download_timeout: Default timeout, in seconds, for downloads.
+            factory: Callable building a YoutubeDL from an options dict.
+        """
+        self.options = dict(options or ytdl_format_options)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.download_timeout = download_timeout
+        self.factory = factory
+        self.cookie_jar = load_cookie_jar(cookies_file)
+        if self.cookie_jar is None and cookies_file and os.path.isfile(cookies_file):
+            self.options['cookiefile'] = cookies_file  # Fall back to letting each instance read the file
+        self._local = threading.local()  # Per-thread YoutubeDL instances
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._flights = SingleFlight()  # Resolves and downloads in progress, by URL
+        self._download_waiters: Dict[str, List[dict]] = {}  # URL -> callers to pin its file for
+
+    # ======================
+    # BLOCKING HELPERS (run in the yt-dlp thread pool)
+    # ======================
+
+    def client(self, **overrides):
+        """
+        Returns the YoutubeDL instance of the calling thread.
+        Calls with option overrides get a fresh, throwaway instance instead.
+        """
+        if overrides:
+            return self._build({**self.options, **overrides})
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self._build(self.options)
+        return client
+
+    def _build(self, options):
+        """Builds a YoutubeDL instance attached to the shared cookie jar."""
+        client = self.factory(dict(options))
+        if self.cookie_jar is not None:
+            client.cookiejar = self.cookie_jar
+        return client
+
+    def _extract(self, url, download):
+        """Runs extract_info with this thread's instance."""
+        return self.client().extract_info(url, download=download)
+
+    def _extract_download(self, url):
+        """
+        Downloads a URL with this thread's instance.
+
+        Returns:
+            tuple: (info of the single track, file name it was saved to). The file name
+            comes from the same instance, so the event loop never builds one.
+        """
+        client = self.client()
+        info = client.extract_info(url, download=True)
+        if 'entries' in info:
+            info = info['entries'][0]
+        return info, client.prepare_filename(info)
+
+    def _extract_flat_page(self, url, start, count):
+        """Flat-extracts one page of a playlist (IDs, titles and durations, no formats)."""
+        client = self.client(extract_flat='in_playlist', playliststart=start, playlistend=start + count - 1)
+        return client.extract_info(url, download=False)
+
+    # ======================
+    # ASYNC API
+    # ======================
+
+    def _limit(self):
+        """Returns the concurrency semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args, timeout=None):
+        """
+        Runs a blocking helper in the yt-dlp thread pool under the concurrency limit.
+        Raises asyncio.TimeoutError if it does not finish in time (the worker thread
+        finishes in the background, but the caller is released).
+        """
+        async with self._limit():
+            return await asyncio.wait_for(run_blocking('ytdl', func, *args), timeout=timeout)
+
+    async def extract(self, url, *, download=False, timeout=None):
+        """
+        Runs a raw extraction, without consulting or filling the metadata cache.
+
+        Args:
+            url: The URL (or search string) to extract.
+            download: Whether to also download the media.
+            timeout: Seconds before giving up (defaults to the service timeouts).
+
+        Returns:
+            dict: The raw yt-dlp info (may be a playlist).
+        """
+        if timeout is None:
+            timeout = self.download_timeout if download else self.timeout
+        return await self._run(self._extract, url, download, timeout=timeout)
+
+    async def search(self, query, *, limit=1, timeout=None) -> List[Dict[str, Any]]:
+        """
+        Searches YouTube, consulting the shared search cache first.
+        Identical searches already in flight are joined instead of repeated.
+
+        Args:
+            query: The search terms.
+            limit: Maximum number of results.
+            timeout: Seconds before giving up.
+
+        Returns:
+            list: The results' info dicts (possibly empty).
+        """
+        return await search_cache.get_or_search(
+            query, limit, lambda: self._search(query, limit, timeout)
+        )
+
+    async def _search(self, query, limit, timeout):
+        """
+        Runs a search extraction and caches every result in the metadata cache.
+        """
+        data = await self.extract(f"ytsearch{limit}:{query}", timeout=timeout)
+        results = [entry for entry in data.get('entries') or [] if entry]
+        # Playing any of the results later is a cache hit
+        for entry in results:
+            if entry.get('webpage_url'):
+                metadata_cache.put(entry['webpage_url'], entry)
+        return results
+
+    async def resolve(self, url, *, require_stream=False, timeout=None) -> Dict[str, Any]:
+        """
+        Returns the info of a single track, consulting the shared metadata cache first.
+        Concurrent resolves of the same URL share a single extraction.
+
+        Args:
+            url: The track URL.
+            require_stream: Whether a still-valid direct stream URL is required.
+            timeout: Seconds before giving up.
+
+        Returns:
+            dict: The track info (the first entry if the URL is a playlist).
+        """
+        info = await metadata_cache.get(url, require_stream=require_stream)
+        if info is not None:
+            return info
+        # A fresh extraction always includes the stream, so it serves both kinds of callers
+        return await self._flights.do(('resolve', url), lambda: self._resolve(url, timeout))
+
+    async def _resolve(self, url, timeout):
+        """
+        Extracts a single track and caches its info.
+        """
+        info = await self.extract(url, timeout=timeout)
+        # If the result is a playlist, take the first entry
+        if 'entries' in info:
+            info = info['entries'][0]
+        metadata_cache.put(url, info)
+        return info
+
+    async def download(self, url, *, timeout=None) -> Tuple[Dict[str, Any], str]:
+        """
+        Downloads a track and caches its info.
+        Tracks already in the audio cache are returned without extracting anything,
+        and concurrent downloads of the same URL share a single download.
+        The returned file is pinned in the audio cache: release it with
+        audio_cache.release once it is no longer needed.
+
+        Args:
+            url: The track URL.
+            timeout: Seconds before giving up.
+
+        Returns:
+            tuple: (info, filename of the downloaded file).
+        """
+        # The file is pinned for every waiting caller inside the flight, before any of them
+        # resumes, so another task's eviction can never remove it in between
+        waiter = {}
+        self._download_waiters.setdefault(url, []).append(waiter)
+        try:
+            info, filename = await self._flights.do(('download', url), lambda: self._download(url, timeout))
+        except BaseException:
+            if 'filename' in waiter:
+                audio_cache.release(waiter['filename'])  # Pinned for this caller, which gave up
+            else:
+                self._forget_waiter(url, waiter)
+            raise
+        if 'filename' not in waiter:
+            # Joined a download that had just finished: the result was returned without suspending
+            self._forget_waiter(url, waiter)
+            audio_cache.acquire(filename)
+        return info, filename
+
+    async def _download(self, url, timeout):
+        """
+        Downloads a single track, unless its file is already in the audio cache,
+        and pins the file for the callers waiting on it.
+        """
+        info = await metadata_cache.get_metadata(url)
+        if info is not None:
+            filename = audio_cache.lookup(cache_key(info))
+            if filename is not None:
+                self._pin_for_waiters(url, filename)
+                return info, filename
+
+        info, filename = await self._run(
+            self._extract_download, url,
+            timeout=self.download_timeout if timeout is None else timeout
+        )
+        metadata_cache.put(url, info)
+        audio_cache.add(filename)
+        self._pin_for_waiters(url, filename)
+        return info, filename
+
+    def _pin_for_waiters(self, url, filename):
+        """Pins a downloaded file once per waiting caller, then applies the cache budget."""
+        for waiter in self._download_waiters.pop(url, []):
+            audio_cache.acquire(filename)
+            waiter['filename'] = filename
+        audio_cache.evict()  # The new file may have pushed the cache over its budget
+
+    def _forget_waiter(self, url, waiter):
+        """Removes a caller that no longer waits for a download of the URL."""
+        waiters = [other for other in self._download_waiters.get(url, []) if other is not waiter]
+        if waiters:
+            self._download_waiters[url] = waiters
+        else:
+            self._download_waiters.pop(url, None)
+
+    async def playlist_page(self, url, start, count, *, timeout=None) -> Dict[str, Any]:
+        """
+        Flat-extracts one page of a playlist.
+
+        Args:
+            url: The playlist URL.
+            start: 1-based index of the first entry.
+            count: Number of entries in the page.
+            timeout: Seconds before giving up.
+
+        Returns:
+            dict: The playlist info with the page's flat entries.
+        """
+        return await self._run(
+            self._extract_flat_page, url, start, count,
+            timeout=self.timeout if timeout is None else timeout
+        )
+
+
+# Extraction service shared by all music cogs
+ytdl_service = YTDLService()
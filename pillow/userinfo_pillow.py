@@ -18,7 +18,7 @@ def create_user_info_canvas(member) -> BytesIO:
 
     # Foto de Perfil (posição fixa)
     avatar_url = member.display_avatar.url
-    response = requests.get(avatar_url)
+    response = requests.get(avatar_url, timeout=10)
     profile_image = Image.open(BytesIO(response.content))
     profile_image = profile_image.resize((100, 100))
     image.paste(profile_image, (50, 50))
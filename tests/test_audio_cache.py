@@ -0,0 +1,106 @@
+# Import required testing modules
+import os  # Path helpers and file inspection
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary directories standing in for the cache directory
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('AUDIO_CACHE_DIR', tempfile.mkdtemp())  # Keep the shared cache out of the project
+
+from utils.audio_cache import AudioFileCache, cache_key  # Code under test
+
+
+class TestAudioFileCache(unittest.TestCase):
+    """Unit tests for the on-disk audio file cache.
+
+    Tests include:
+    - Keys built from the extractor and video ID
+    - Lookups of cached files (hits and misses)
+    - LRU eviction under the byte budget
+    - Pinned files are never evicted
+    - Rebuilding the index from an existing directory
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, key, size, ext='webm'):
+        """Creates a fake downloaded file of the given size."""
+        path = os.path.join(self.directory, f'{key}.{ext}')
+        with open(path, 'wb') as f:
+            f.write(b'\0' * size)
+        return path
+
+    def test_cache_key(self):
+        """Keys combine extractor and ID, and are None if either is missing."""
+        self.assertEqual(cache_key({'extractor': 'youtube', 'id': 'dQw4w9WgXcQ'}), 'youtube-dQw4w9WgXcQ')
+        self.assertEqual(cache_key({'extractor': 'youtube:tab', 'id': 'x'}), 'youtube_tab-x')
+        self.assertIsNone(cache_key({'id': 'dQw4w9WgXcQ'}))
+
+    def test_lookup(self):
+        """Registered files are found by key; unknown or deleted files are misses."""
+        cache = AudioFileCache(self.directory, max_bytes=1000)
+        path = self.write('youtube-a', 10)
+        cache.add(path)
+        self.assertEqual(cache.lookup('youtube-a'), path)
+        self.assertIsNone(cache.lookup('youtube-b'))
+
+        os.remove(path)
+        self.assertIsNone(cache.lookup('youtube-a'))
+        self.assertNotIn('youtube-a', cache)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def test_lru_eviction(self):
+        """The least recently used files are deleted once the budget is exceeded."""
+        cache = AudioFileCache(self.directory, max_bytes=250)
+        a, b, c = (self.write(f'youtube-{key}', 100) for key in 'abc')
+        cache.add(a)
+        cache.add(b)
+        cache.lookup('youtube-a')  # b becomes the least recently used
+        cache.add(c)
+        cache.evict()
+
+        self.assertTrue(os.path.exists(a))
+        self.assertFalse(os.path.exists(b))
+        self.assertTrue(os.path.exists(c))
+        self.assertEqual(cache.total_bytes, 200)
+
+    def test_pinned_files_are_kept(self):
+        """A file in use survives eviction and becomes evictable once released."""
+        cache = AudioFileCache(self.directory, max_bytes=150)
+        a, b = self.write('youtube-a', 100), self.write('youtube-b', 100)
+        cache.add(a)
+        cache.acquire(a)
+        cache.acquire(a)
+        cache.add(b)
+        cache.acquire(b)
+        cache.evict()
+        self.assertTrue(os.path.exists(a) and os.path.exists(b))
+
+        cache.release(a)
+        self.assertTrue(os.path.exists(a))  # Still one reference left
+        cache.release(a)
+        self.assertFalse(os.path.exists(a))
+        self.assertTrue(os.path.exists(b))
+        self.assertEqual(cache.stats()['in_use'], 1)
+
+    def test_index_rebuilt_from_directory(self):
+        """Files left by a previous run are indexed, ignoring partial downloads."""
+        self.write('youtube-a', 10)
+        self.write('youtube-b', 20, ext='m4a')
+        self.write('youtube-c', 30, ext='webm.part')
+
+        cache = AudioFileCache(self.directory, max_bytes=1000)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.total_bytes, 30)
+        self.assertTrue(cache.lookup('youtube-b').endswith('youtube-b.m4a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
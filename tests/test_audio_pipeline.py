@@ -0,0 +1,118 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+from unittest import mock  # Replaces the FFmpeg process
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music import audio_pipeline  # Code under test
+from extra_modules.music.audio_pipeline import (
+    PlaybackClock, PrimedAudio, format_position, needs_pcm, open_ffmpeg, parse_position
+)
+
+
+class FakeFFmpeg:
+    """FFmpeg source stand-in producing a fixed number of Opus frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.cleaned = False
+
+    def read(self):
+        if self.frames <= 0:
+            return b''
+        self.frames -= 1
+        return b'frame'
+
+    def is_opus(self):
+        return True
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class TestAudioPipeline(unittest.TestCase):
+    """Unit tests for the Opus passthrough and PCM FFmpeg sources.
+
+    Tests include:
+    - Only volumes other than 1.0 need the PCM path
+    - Opus audio is copied by FFmpeg and other codecs are encoded with libopus
+    - Primed frames are not lost and the frame counter gives the position
+    - The playback clock only advances with frames and starts at the seek position
+    - Absolute and relative seek positions are parsed
+    """
+
+    def test_needs_pcm(self):
+        """The original level is passed through; any other volume is decoded."""
+        self.assertFalse(needs_pcm(1.0))
+        self.assertTrue(needs_pcm(0.5))
+        self.assertTrue(needs_pcm(1.5))
+
+        original = audio_pipeline.OPUS_PASSTHROUGH
+        audio_pipeline.OPUS_PASSTHROUGH = False
+        try:
+            self.assertTrue(needs_pcm(1.0))
+        finally:
+            audio_pipeline.OPUS_PASSTHROUGH = original
+
+    def ffmpeg_args(self, **kwargs):
+        """Open FFmpeg with the process replaced and return its command line."""
+        with mock.patch('subprocess.Popen') as popen:
+            source = open_ffmpeg('track.webm', **kwargs)
+        self.assertIsInstance(source, PrimedAudio)
+        return popen.call_args.args[0]
+
+    def test_open_ffmpeg_codecs(self):
+        """Opus packets are copied without decoding; other codecs and the PCM path are not."""
+        args = self.ffmpeg_args(pcm=False, acodec='opus', start=5)
+        self.assertEqual(args[args.index('-c:a') + 1], 'copy')
+        self.assertEqual(args[args.index('-ss') + 1], '5.000')
+
+        args = self.ffmpeg_args(pcm=False, acodec='mp4a.40.2')
+        self.assertEqual(args[args.index('-c:a') + 1], 'libopus')
+
+        args = self.ffmpeg_args(pcm=True, acodec='opus')
+        self.assertNotIn('-c:a', args)
+        self.assertIn('s16le', args)
+
+    def test_primed_frames_and_position(self):
+        """The primed frame is played first and every played frame advances the position."""
+        source = PrimedAudio(FakeFFmpeg(3), start=10.0)
+        self.assertTrue(source.prime())
+        self.assertEqual(source.position, 10.0)
+
+        frames = [source.read() for _ in range(4)]
+        self.assertEqual(frames, [b'frame'] * 3 + [b''])
+        self.assertAlmostEqual(source.position, 10.06)
+        self.assertTrue(source.is_opus())
+
+    def test_prime_rejected_input(self):
+        """A source that produces no audio fails priming."""
+        self.assertFalse(PrimedAudio(FakeFFmpeg(0)).prime())
+
+    def test_playback_clock(self):
+        """The clock counts 20 ms frames from the position FFmpeg was opened at."""
+        clock = PlaybackClock(90.0)
+        for _ in range(150):
+            clock.tick()
+        self.assertAlmostEqual(clock.position, 93.0)
+        self.assertEqual(format_position(clock.position), '1:33')
+        self.assertEqual(format_position(3725.4), '1:02:05')
+        self.assertEqual(format_position(-1), '0:00')
+
+    def test_parse_position(self):
+        """Seconds, M:SS and H:MM:SS are absolute; a sign makes them relative."""
+        self.assertEqual(parse_position('90'), 90.0)
+        self.assertEqual(parse_position('1:30'), 90.0)
+        self.assertEqual(parse_position('1:01:30'), 3690.0)
+        self.assertEqual(parse_position('+15', current=60.0), 75.0)
+        self.assertEqual(parse_position('-1:00', current=75.0), 15.0)
+        for text in ('', 'abc', '1:2:3:4', '1:-5', 'nan', 'inf'):
+            with self.assertRaises(ValueError):
+                parse_position(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
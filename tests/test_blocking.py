@@ -0,0 +1,87 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the gateway
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import threading  # To check which thread ran each call
+import time  # To block the event loop on purpose
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.blocking import BlockingGateway, LoopLagMonitor  # Code under test
+from utils.metrics import metrics  # Records the duration of every blocking call
+
+
+class TestBlockingGateway(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the blocking-call gateway.
+
+    Tests include:
+    - Calls run outside the event loop thread, in the dependency's own pool
+    - Pools are sized per dependency
+    - Unknown dependencies are rejected
+    """
+
+    async def asyncSetUp(self):
+        self.gateway = BlockingGateway({'ytdl': 2, 'spotify': 1})
+
+    async def asyncTearDown(self):
+        self.gateway.shutdown(wait=True)
+
+    async def test_runs_in_dedicated_pool(self):
+        """Each dependency gets its own named threads, never the loop's thread."""
+        loop_thread = threading.current_thread().name
+        ytdl_thread = await self.gateway.run('ytdl', lambda: threading.current_thread().name)
+        spotify_thread = await self.gateway.run('spotify', lambda: threading.current_thread().name)
+
+        self.assertNotEqual(ytdl_thread, loop_thread)
+        self.assertTrue(ytdl_thread.startswith('blocking-ytdl'))
+        self.assertTrue(spotify_thread.startswith('blocking-spotify'))
+        self.assertIsNotNone(metrics.get('blocking.ytdl'))
+
+    async def test_pool_size_bounds_concurrency(self):
+        """A slow dependency never uses more threads than its pool allows."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_call():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(self.gateway.run('ytdl', slow_call) for _ in range(6)))
+        self.assertEqual(peak, 2)
+
+    async def test_unknown_dependency(self):
+        """Calls must name a configured dependency."""
+        with self.assertRaises(KeyError):
+            await self.gateway.run('unknown', lambda: None)
+
+
+class TestLoopLagMonitor(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the event loop lag monitor."""
+
+    async def test_logs_blocking_callback(self):
+        """Blocking the loop past the threshold is logged with the culprit's stack."""
+        monitor = LoopLagMonitor(threshold=0.05, interval=0.01)
+        monitor.start()
+        try:
+            with self.assertLogs('utils.blocking', level='WARNING') as logs:
+                await asyncio.sleep(0.03)
+                time.sleep(0.2)  # Deliberately hold the event loop
+                await asyncio.sleep(0.03)
+        finally:
+            monitor.stop()
+
+        output = '\n'.join(logs.output)
+        self.assertIn('Event loop blocked for', output)
+        self.assertIn('test_logs_blocking_callback', output)  # Stack captured while stalled
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 # Import required modules for testing
+import asyncio  # Event loop required by the bot constructor
 import os  # Operating system interface for environment access
 import unittest  # Python unit testing framework
 from unittest.mock import patch  # Mocking utilities
@@ -14,6 +15,16 @@ class TestBotInitialization(unittest.TestCase):
     - Environment variable handling
     - Error conditions for missing credentials
     """
+
+    def setUp(self):
+        """Give each test its own event loop; async tests elsewhere clear the default one."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        """Close the event loop created for the test."""
+        asyncio.set_event_loop(None)
+        self.loop.close()
     
     @patch.dict(os.environ, {"TOKEN_BOT": "test_token", "PREFIX_BOT": "!"}, clear=True)
     def test_bot_initialization(self):
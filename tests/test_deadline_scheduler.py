@@ -0,0 +1,117 @@
+# Import required testing modules
+import asyncio  # Event loop used by the scheduler's timer
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import time  # To measure when deadlines fire
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.deadline_scheduler import DeadlineScheduler  # Code under test
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Unit tests for the heap-based deadline scheduler (driven by run_due).
+
+    Tests include:
+    - Deadlines fire in order once due
+    - Cancelled deadlines never fire
+    - Re-arming a key replaces its previous deadline
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = DeadlineScheduler(clock=self.clock)
+        self.fired = []
+
+    def arm(self, key, delay):
+        self.scheduler.arm(key, delay, lambda: self.fired.append(key))
+
+    def test_fire_in_order(self):
+        """Only due deadlines fire, earliest first."""
+        self.arm('b', 20)
+        self.arm('a', 10)
+        self.arm('c', 30)
+
+        self.clock.now = 25
+        self.assertEqual(self.scheduler.run_due(), ['a', 'b'])
+        self.assertEqual(self.fired, ['a', 'b'])
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_cancel(self):
+        """A cancelled deadline is dropped without firing."""
+        self.arm('a', 10)
+        self.assertTrue(self.scheduler.cancel('a'))
+        self.assertFalse(self.scheduler.cancel('a'))
+
+        self.clock.now = 60
+        self.assertEqual(self.scheduler.run_due(), [])
+        self.assertNotIn('a', self.scheduler)
+
+    def test_rearm_replaces(self):
+        """Re-arming a key moves its deadline instead of adding a second one."""
+        self.arm('a', 10)
+        self.clock.now = 5
+        self.arm('a', 10)
+        self.assertEqual(self.scheduler.deadline('a'), 15)
+
+        self.clock.now = 12
+        self.assertEqual(self.scheduler.run_due(), [])
+        self.clock.now = 15
+        self.assertEqual(self.scheduler.run_due(), ['a'])
+        self.assertEqual(self.fired, ['a'])
+
+
+class TestDeadlineSchedulerTimer(unittest.IsolatedAsyncioTestCase):
+    """Tests for the event loop timer of the deadline scheduler.
+
+    Tests include:
+    - Deadlines fire on time without polling
+    - Coroutine callbacks are scheduled on the loop
+    - An earlier deadline armed later still fires first
+    """
+
+    async def test_fires_on_time(self):
+        """A deadline fires close to its due time and runs coroutine callbacks."""
+        scheduler = DeadlineScheduler()
+        done = asyncio.Event()
+        fired_at = []
+
+        async def callback():
+            fired_at.append(time.monotonic())
+            done.set()
+
+        armed_at = time.monotonic()
+        scheduler.arm('guild', 0.05, callback)
+        await asyncio.wait_for(done.wait(), timeout=1)
+        self.assertGreaterEqual(fired_at[0] - armed_at, 0.045)
+        self.assertLess(fired_at[0] - armed_at, 0.5)
+        scheduler.close()
+
+    async def test_earlier_deadline_preempts_timer(self):
+        """Arming a sooner deadline reschedules the single timer."""
+        scheduler = DeadlineScheduler()
+        order = []
+        scheduler.arm('late', 0.2, lambda: order.append('late'))
+        scheduler.arm('soon', 0.01, lambda: order.append('soon'))
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(order, ['soon'])
+        await asyncio.sleep(0.25)
+        self.assertEqual(order, ['soon', 'late'])
+        scheduler.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music import dsp  # Code under test
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is not installed
+    np = None
+
+FRAME = 960  # Samples per channel in a 20 ms frame
+
+
+def frame_of(value):
+    """A 16-bit stereo frame where every sample has the same value."""
+    return np.full((FRAME, 2), value, dtype=np.int16).tobytes()
+
+
+def samples_of(frame):
+    return np.frombuffer(frame, dtype=np.int16).reshape(-1, 2)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestDSP(unittest.TestCase):
+    """Unit tests for the NumPy DSP stage.
+
+    Tests include:
+    - Unprocessed frames are returned untouched
+    - Volume changes are ramped over one frame, then held
+    - Loudness gain and clipping
+    - Block-processed biquads match the sample-by-sample recursion
+    """
+
+    def test_unity_passes_frames_through(self):
+        """Without volume, gain or equalizer the frame is not converted at all."""
+        chain = dsp.DSPChain()
+        frame = frame_of(1000)
+        self.assertIs(chain.process(frame), frame)
+        self.assertEqual(chain.process(b''), b'')
+
+    def test_volume_ramp(self):
+        """A new volume fades in during the next frame and applies fully afterwards."""
+        chain = dsp.DSPChain()
+        chain.process(frame_of(10000))
+        chain.volume = 0.5
+        ramped = samples_of(chain.process(frame_of(10000)))
+        self.assertEqual(ramped[0, 0], 10000)
+        self.assertEqual(ramped[-1, 0], 5000)
+        self.assertTrue(np.all(np.diff(ramped[:, 0].astype(int)) <= 0))
+
+        held = samples_of(chain.process(frame_of(10000)))
+        self.assertTrue(np.all(held == 5000))
+
+    def test_gain_and_clipping(self):
+        """The track gain multiplies the volume and the result is clipped to 16 bits."""
+        chain = dsp.DSPChain()
+        chain.process(frame_of(0), gain=dsp.db_to_gain(6.0))  # Start the ramp at the gained level
+        boosted = samples_of(chain.process(frame_of(30000), gain=dsp.db_to_gain(6.0)))
+        self.assertTrue(np.all(boosted == 32767))
+
+    def test_biquad_blocks_match_recursion(self):
+        """Filtering frame by frame gives the same output as the plain recursion."""
+        signal = np.random.default_rng(0).normal(scale=1000, size=(3 * FRAME, 2))
+        for kind in ('peaking', 'lowshelf', 'highshelf'):
+            band = dsp.Biquad(kind, 1000.0, 6.0, 1.0)
+            reference = dsp.Biquad(kind, 1000.0, 6.0, 1.0)
+            blocks = np.concatenate([band.process(signal[i:i + FRAME]) for i in range(0, len(signal), FRAME)])
+            expected = np.array([reference._simulate(signal[:, c], (0.0, 0.0, 0.0, 0.0)) for c in range(2)]).T
+            np.testing.assert_allclose(blocks, expected, atol=1e-6)
+
+    def test_equalizer_presets(self):
+        """Presets replace the bands and mark the chain as filtering."""
+        chain = dsp.DSPChain()
+        chain.set_equalizer(dsp.EQ_PRESETS['bass'], 'bass')
+        self.assertTrue(chain.filtering)
+        self.assertEqual(chain.preset, 'bass')
+        self.assertEqual(len(chain.process(frame_of(1000))), FRAME * 4)
+
+        chain.set_equalizer(dsp.EQ_PRESETS['flat'], 'flat')
+        self.assertFalse(chain.filtering)
+
+    def test_unknown_filter(self):
+        """Unknown filter kinds are rejected."""
+        with self.assertRaises(ValueError):
+            dsp.biquad_coefficients('notch', 1000.0, 0.0, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
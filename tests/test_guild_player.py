@@ -0,0 +1,316 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the players
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import threading  # To fire track-end callbacks from another thread, like the audio player
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.queue_manager import registry  # Queues read by the players
+from utils.track import Track  # Compact track record stored in the queues
+from extra_modules.music.guild_player import GuildPlayer, GuildPlayers  # Code under test
+
+
+class FakeSource:
+    """Audio source stand-in with the attributes the player reads."""
+
+    def __init__(self, url, opus=True, volume=1.0):
+        self.data = {'title': url, 'duration': 60}
+        self.title = url
+        self.duration = 60
+        self.volume = volume
+        self.opus = opus
+        self.position = 0.0
+        self.gain_db = 0.0
+        self.cleaned = False
+        self.ended = False  # Set to make read() report the end of the track
+
+    def read(self):
+        return b'' if self.ended else b'frame'
+
+    def is_opus(self):
+        return self.opus
+
+    def reopen(self, *, volume, start=None):
+        source = FakeSource(self.title, opus=volume == 1.0, volume=volume)
+        source.position = self.position if start is None else start
+        source.track = self.track
+        return source
+
+    async def prime(self):
+        return True
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class FakeVoiceClient:
+    """Voice client stand-in that records what it plays."""
+
+    def __init__(self):
+        self.played = []
+        self.after = None
+        self.source = None
+
+    def is_playing(self):
+        return self.after is not None
+
+    @property
+    def playing(self):
+        """The track's own source, unwrapped from the gapless mixer."""
+        return getattr(self.source, 'current', self.source)
+
+    def play(self, source, after):
+        self.source = source
+        self.after = after
+        self.played.append(self.playing.title)
+
+    def finish(self):
+        """Ends the current track from another thread, like disnake's audio player."""
+        after, self.after = self.after, None
+        thread = threading.Thread(target=after, args=(None,))
+        thread.start()
+        thread.join()
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, embed=None):
+        self.sent.append(embed)
+
+
+class TestGuildPlayer(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for per-guild players.
+
+    Tests include:
+    - A slow track start in one guild does not block other guilds
+    - Track-end callbacks from the audio thread advance the queue
+    - A failed track is reported and skipped
+    - Playback without a voice connection does nothing
+    - Volume changes reopen Opus passthrough tracks on the PCM path
+    - The next track is opened ahead of time and started without a gap
+    - Queue changes replace the track opened ahead of time
+    - Seeking reopens the current track at the new position
+    - A removed player ignores the track-end callback of the stopped track
+    - Background tasks are referenced until they finish and their failures logged
+    """
+
+    async def asyncSetUp(self):
+        self.gates = {}  # url -> Event a source waits for before being created
+        self.created = []  # Every source created, in order
+
+        async def create_source(guild_id, url):
+            if url in self.gates:
+                await self.gates[url].wait()
+            if url.startswith('broken'):
+                raise RuntimeError('unavailable')
+            source = FakeSource(url)
+            self.created.append(source)
+            return source, 'stream'
+
+        self.voice_clients = {}
+        # Tracks last 60 s, so the next one is opened as soon as a track starts
+        self.players = GuildPlayers(lambda guild_id: GuildPlayer(
+            guild_id, create_source, voice_client=lambda: self.voice_clients.get(guild_id), preload=60
+        ))
+
+    async def asyncTearDown(self):
+        for guild_id in (901, 902):
+            registry.remove(guild_id)
+
+    def player(self, guild_id, *urls):
+        player = self.players.get(guild_id)
+        self.voice_clients[guild_id] = FakeVoiceClient()
+        self.channel = FakeChannel()
+        player.notifier.bind(self.channel)
+        for url in urls:
+            registry.get(guild_id).add_to_queue(Track(url, url))
+        return player
+
+    async def test_guilds_start_in_parallel(self):
+        """A guild waiting on a slow resolve does not delay another guild's start."""
+        self.gates['slow'] = asyncio.Event()
+        slow = self.player(901, 'slow')
+        fast = self.player(902, 'fast')
+
+        slow_start = asyncio.create_task(slow.play_next())
+        await asyncio.sleep(0)
+        await asyncio.wait_for(fast.play_next(), timeout=1)
+        self.assertEqual(fast.voice_client.played, ['fast'])
+        self.assertFalse(slow_start.done())
+
+        self.gates['slow'].set()
+        await slow_start
+        self.assertEqual(slow.voice_client.played, ['slow'])
+
+    async def test_track_end_from_audio_thread(self):
+        """Ending a track from another thread plays the next one and records the history."""
+        player = self.player(901, 'a', 'b')
+        await player.play_next()
+        player.voice_client.finish()
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if player.voice_client.played == ['a', 'b']:
+                break
+
+        self.assertEqual(player.voice_client.played, ['a', 'b'])
+        self.assertEqual([track.url for track in registry.get(901).get_recent_tracks()], ['a'])
+
+    async def test_failed_track_is_skipped(self):
+        """A track whose source cannot be created is reported and the next one plays."""
+        player = self.player(901, 'broken', 'ok')
+        await player.play_next()
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if player.voice_client.played:
+                break
+
+        self.assertEqual(player.voice_client.played, ['ok'])
+        self.assertEqual(len(self.channel.sent), 2)  # Error message, then "now playing"
+
+    async def test_disconnected_guild(self):
+        """A guild without a voice client keeps its queue and stays idle."""
+        player = self.player(901, 'a')
+        del self.voice_clients[901]
+        await player.play_next()
+        self.assertTrue(player.state.idle)
+        self.assertEqual(registry.get(901).queue_length(), 1)
+
+    async def test_volume_reopens_opus_track(self):
+        """Changing the volume of a passthrough track swaps in a PCM source at the same position."""
+        player = self.player(901, 'a', 'b')
+        await player.play_next()
+        passthrough = player.source
+        passthrough.position = 12.5
+
+        await player.set_volume(0.4)
+        replacement = player.voice_client.playing
+        self.assertIsNot(replacement, passthrough)
+        self.assertIs(player.source, replacement)
+        self.assertFalse(replacement.is_opus())
+        self.assertEqual((replacement.volume, replacement.position), (0.4, 12.5))
+        self.assertTrue(passthrough.cleaned)
+
+        # A PCM track is scaled in place, and the volume is kept for the next tracks
+        await player.set_volume(0.6)
+        self.assertIs(player.voice_client.playing, replacement)
+        self.assertEqual(replacement.volume, 0.6)
+        self.assertEqual(player.volume, 0.6)
+
+        # The end of the replacement records the original track and plays the next one
+        player.voice_client.finish()
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if player.voice_client.played == ['a', 'b']:
+                break
+        self.assertEqual([track.url for track in registry.get(901).get_recent_tracks()], ['a'])
+
+    async def preloaded(self, player):
+        """Waits until the mixer holds the next track."""
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if player.mixer.next is not None:
+                return player.mixer.next
+        self.fail('The next track was not opened ahead of time')
+
+    async def test_gapless_transition(self):
+        """The next track is opened while one plays and taken off the queue only when it starts."""
+        player = self.player(901, 'a', 'b', 'c')
+        queue = registry.get(901)
+        await player.play_next()
+        first = player.source
+        upcoming = await self.preloaded(player)
+        self.assertEqual(upcoming.title, 'b')
+        self.assertEqual([track.url for track in queue.show_queue()], ['b', 'c'])
+
+        # The audio thread reads past the end of 'a' and gets the first frame of 'b'
+        first.ended = True
+        thread = threading.Thread(target=player.voice_client.source.read)
+        thread.start()
+        thread.join()
+        following = await self.preloaded(player)
+
+        self.assertIs(player.source, upcoming)
+        self.assertEqual(following.title, 'c')
+        self.assertEqual(player.voice_client.played, ['a'])  # The voice client never stopped
+        self.assertEqual(queue.get_current_track().url, 'b')
+        self.assertEqual([track.url for track in queue.show_queue()], ['c'])
+        self.assertEqual([track.url for track in queue.get_recent_tracks()], ['a'])
+        self.assertTrue(first.cleaned)
+
+    async def test_queue_change_replaces_preloaded_track(self):
+        """Removing the head of the queue discards the track opened for it and opens the new head."""
+        player = self.player(901, 'a', 'b', 'c')
+        await player.play_next()
+        upcoming = await self.preloaded(player)
+
+        registry.get(901).remove_from_queue(0)
+        player.on_queue_changed('remove')  # Routed by the Play cog's queue listener
+        self.assertTrue(upcoming.cleaned)
+        self.assertEqual((await self.preloaded(player)).title, 'c')
+
+        # Stopping playback releases the track opened ahead of time as well
+        player.voice_client.source.cleanup()
+        self.assertTrue(all(source.cleaned for source in self.created))
+
+    async def test_seek(self):
+        """Seeking swaps in the same track opened at the new position, without touching the queue."""
+        player = self.player(901, 'a', 'b')
+        self.assertFalse(await player.seek(10))  # Nothing is playing yet
+        await player.play_next()
+        original = player.source
+        original.position = 30.0
+
+        self.assertTrue(await player.seek(75.5))
+        self.assertIsNot(player.source, original)
+        self.assertEqual(player.position, 75.5)
+        self.assertIs(player.voice_client.playing, player.source)
+        self.assertTrue(player.source.is_opus())  # The volume still allows the passthrough
+        self.assertTrue(original.cleaned)
+        self.assertEqual(player.voice_client.played, ['a'])
+        self.assertEqual([track.url for track in registry.get(901).show_queue()], ['b'])
+
+    async def test_leave_ignores_late_track_end(self):
+        """After leaving, the stopped track's callback neither recreates the queue nor reports idle."""
+        states = []
+        player = self.player(901, 'a', 'b')
+        player.state.on_change = lambda guild_id, state: states.append(state)
+        await player.play_next()
+        states.clear()
+
+        # Same order as the Leave cog: detach the player, stop the voice client, drop the queue
+        self.players.remove(901)
+        player.voice_client.finish()
+        registry.remove(901)
+        await asyncio.sleep(0.05)
+
+        self.assertNotIn(901, registry)
+        self.assertNotIn(901, self.players)
+        self.assertEqual(states, [])
+        self.assertEqual(player.voice_client.played, ['a'])
+
+    async def test_background_tasks_are_kept_and_logged(self):
+        """Spawned tasks stay referenced while running and a failure is logged, not lost."""
+        player = self.player(901)
+        gate = asyncio.Event()
+
+        async def fail():
+            await gate.wait()
+            raise RuntimeError('boom')
+
+        task = player.spawn(fail())
+        self.assertIn(task, player._tasks)
+        with self.assertLogs('extra_modules.music.guild_player', level='ERROR') as logs:
+            gate.set()
+            await asyncio.wait([task])
+            await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+        self.assertEqual(player._tasks, set())
+        self.assertIn('boom', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# Import required testing modules
+import asyncio  # Event loop used by the disconnect deadlines
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.queue_manager import GuildQueueRegistry  # Queues dropped on disconnect
+from extra_modules.music.playback_state import PlaybackState  # States that arm the deadlines
+from extra_modules.music.inactivity_handler import InactivityHandler  # Code under test
+
+
+class FakeVoiceClient:
+    """Voice client stand-in with controllable playback flags."""
+
+    def __init__(self, guild):
+        self.guild = guild
+        self.playing = False
+        self.paused = False
+        self.disconnected = asyncio.Event()
+
+    def is_playing(self):
+        return self.playing
+
+    def is_paused(self):
+        return self.paused
+
+    def stop(self):
+        self.playing = self.paused = False
+
+    async def disconnect(self, force=False):
+        self.disconnected.set()
+
+
+class FakeGuild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+        self.voice_client = FakeVoiceClient(self)
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, embed=None):
+        self.sent.append(embed)
+
+
+class FakeBot:
+    def __init__(self, guilds):
+        self.guilds = {guild.id: guild for guild in guilds}
+
+    def get_guild(self, guild_id):
+        return self.guilds.get(guild_id)
+
+    def get_cog(self, name):
+        return None
+
+
+class FakeQueueManager:
+    def __init__(self):
+        self.registry = GuildQueueRegistry()
+
+
+class TestInactivityHandler(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the deadline-based inactivity handler.
+
+    Tests include:
+    - Idle guilds are disconnected when their deadline expires
+    - Resuming playback cancels the deadline
+    - Paused guilds use the paused timeout
+    """
+
+    async def asyncSetUp(self):
+        self.guild = FakeGuild(1)
+        self.channel = FakeChannel()
+        self.handler = InactivityHandler(
+            FakeBot([self.guild]), FakeQueueManager(), idle_timeout=0.02, paused_timeout=0.05
+        )
+
+    async def asyncTearDown(self):
+        self.handler.cog_unload()
+
+    async def test_idle_disconnect(self):
+        """An idle guild is disconnected and notified once its deadline expires."""
+        self.handler.arm_idle(1, channel=self.channel)
+        await asyncio.wait_for(self.guild.voice_client.disconnected.wait(), timeout=1)
+        self.assertEqual(len(self.channel.sent), 1)
+        self.assertNotIn(1, self.handler.scheduler)
+
+    async def test_playing_cancels_deadline(self):
+        """A guild that starts playing keeps its connection."""
+        self.handler.on_playback_state(1, PlaybackState.IDLE)
+        self.handler.on_playback_state(1, PlaybackState.RESOLVING)
+        self.guild.voice_client.playing = True
+        await asyncio.sleep(0.05)
+        self.assertFalse(self.guild.voice_client.disconnected.is_set())
+        self.assertNotIn(1, self.handler.scheduler)
+
+    async def test_paused_timeout(self):
+        """Pausing arms the longer paused deadline."""
+        self.guild.voice_client.paused = True
+        self.handler.on_playback_state(1, PlaybackState.PAUSED)
+        await asyncio.sleep(0.03)
+        self.assertFalse(self.guild.voice_client.disconnected.is_set())
+        await asyncio.wait_for(self.guild.voice_client.disconnected.wait(), timeout=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# Import required testing modules
+import asyncio  # Event loop used by the background analyses
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary audio cache directory
+import threading  # To block a measurement until the test releases it
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('LOUDNESS_CACHE_PATH', '')  # Keep the shared cache in memory during tests
+os.environ.setdefault('AUDIO_CACHE_DIR', tempfile.mkdtemp())  # Keep cache files out of the project
+
+from utils.loudness_cache import Loudness, LoudnessStore  # Measurements read by the analyzer
+from extra_modules.music.loudness_analyzer import (  # Code under test
+    LoudnessAnalyzer,
+    normalization_gain,
+    parse_ebur128
+)
+
+EBUR128_OUTPUT = """
+[Parsed_ebur128_0 @ 0x55] t: 9.9 TARGET:-23 LUFS M: -10.1 S: -10.3 I: -10.4 LUFS
+[Parsed_ebur128_0 @ 0x55] Summary:
+
+  Integrated loudness:
+    I:          -9.8 LUFS
+    Threshold: -19.9 LUFS
+
+  True peak:
+    Peak:        0.4 dBFS
+"""
+
+INFO = {'extractor': 'youtube', 'id': 'abc', 'url': 'https://stream.example/abc'}
+
+
+class TestLoudnessAnalyzer(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the background loudness analyzer.
+
+    Tests include:
+    - Parsing FFmpeg's ebur128 summary
+    - Normalization gains with peak-limited boosts and a tolerance
+    - Each track is analyzed once and its gain is then read from the cache
+    - Partially measured streams are measured again once downloaded
+    - Measurements are written to the store outside the event loop
+    """
+
+    def setUp(self):
+        self.store = LoudnessStore()
+        self.calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+        def measure(path, seconds):
+            self.gate.wait()
+            self.calls.append((path, seconds))
+            return Loudness(-8.0, -0.5, bool(seconds))
+
+        self.analyzer = LoudnessAnalyzer(self.store, measure=measure, enabled=True, stream_seconds=30)
+
+    def test_parse(self):
+        """The summary values are used, not the running measurements."""
+        self.assertEqual(parse_ebur128(EBUR128_OUTPUT), Loudness(-9.8, 0.4, False))
+        self.assertIsNone(parse_ebur128('Error opening input'))
+        self.assertIsNone(parse_ebur128('Summary:\n I: -inf LUFS\n Peak: -inf dBFS'))
+
+    def test_normalization_gain(self):
+        """Loud tracks are cut, quiet ones boosted up to the peak and boost limits."""
+        self.assertEqual(normalization_gain(None), 0.0)
+        self.assertEqual(normalization_gain(Loudness(-8.0, 0.0, False), target=-14), -6.0)
+        self.assertEqual(normalization_gain(Loudness(-30.0, -20.0, False), target=-14, max_boost=6), 6.0)
+        self.assertEqual(normalization_gain(Loudness(-20.0, -3.0, False), target=-14, max_boost=6), 2.0)
+        self.assertEqual(normalization_gain(Loudness(-14.5, -3.0, False), target=-14, tolerance=1), 0.0)
+        # A quiet track already peaking near full scale is never turned down
+        self.assertEqual(normalization_gain(Loudness(-20.0, -0.5, False), target=-14, max_boost=6), 0.0)
+
+    async def test_analyzed_once(self):
+        """A track is measured once in the background; later plays read the gain from the cache."""
+        self.assertEqual(self.analyzer.gain_db(INFO), 0.0)
+        self.gate.clear()
+        task = self.analyzer.schedule(INFO)
+        self.assertIsNone(self.analyzer.schedule(INFO))  # Already being analyzed
+        self.gate.set()
+        await task
+
+        self.assertEqual(self.calls, [('https://stream.example/abc', 30)])
+        self.assertLess(self.analyzer.gain_db(INFO), 0.0)
+        self.assertIsNone(self.analyzer.schedule(INFO))  # Cache hit
+
+    async def test_download_replaces_partial(self):
+        """A stream measured partially is measured again from its downloaded file, then never again."""
+        await self.analyzer.schedule(INFO)
+        with tempfile.NamedTemporaryFile(suffix='.webm') as file:
+            await self.analyzer.schedule(INFO, file.name)
+            self.assertIsNone(self.analyzer.schedule(INFO, file.name))
+        self.assertEqual(self.calls[-1][1], None)
+        self.assertFalse(self.store.get('youtube-abc').partial)
+
+    async def test_stored_outside_the_event_loop(self):
+        """The SQLite write happens in the same pool thread as the measurement."""
+        threads = []
+        put = self.store.put
+        self.store.put = lambda key, loudness: (threads.append(threading.current_thread()), put(key, loudness))
+
+        await self.analyzer.schedule(INFO)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIsNotNone(self.store.get('youtube-abc'))
+
+    async def test_disabled(self):
+        """With normalization disabled nothing is analyzed and no gain is applied."""
+        self.analyzer.enabled = False
+        self.store.put('youtube-abc', Loudness(-8.0, -0.5, False))
+        self.assertIsNone(self.analyzer.schedule(INFO))
+        self.assertEqual(self.analyzer.gain_db(INFO), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
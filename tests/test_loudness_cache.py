@@ -0,0 +1,54 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary directory for the SQLite database
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('LOUDNESS_CACHE_PATH', '')  # Keep the shared cache in memory during tests
+
+from utils.loudness_cache import Loudness, LoudnessStore  # Code under test
+
+
+class TestLoudnessStore(unittest.TestCase):
+    """Unit tests for the persistent loudness cache.
+
+    Tests include:
+    - Lookups of measured and unknown videos
+    - Partial measurements never replace full ones
+    - Persistence across restarts
+    """
+
+    def test_get_and_put(self):
+        """Measurements are returned by key; unknown videos return None."""
+        store = LoudnessStore()
+        store.put('youtube-a', Loudness(-9.5, -0.2, False))
+        self.assertEqual(store.get('youtube-a'), Loudness(-9.5, -0.2, False))
+        self.assertIsNone(store.get('youtube-b'))
+        self.assertIn('youtube-a', store)
+        self.assertEqual(len(store), 1)
+
+    def test_partial_measurements(self):
+        """A full measurement replaces a partial one, but not the other way around."""
+        store = LoudnessStore()
+        store.put('youtube-a', Loudness(-12.0, -1.0, True))
+        store.put('youtube-a', Loudness(-10.0, -0.5, False))
+        store.put('youtube-a', Loudness(-20.0, -6.0, True))
+        self.assertEqual(store.get('youtube-a'), Loudness(-10.0, -0.5, False))
+
+    def test_persistence(self):
+        """Measurements survive reopening the database."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache', 'loudness.sqlite3')
+            store = LoudnessStore(path)
+            store.put('youtube-a', Loudness(-16.0, -3.0, False))
+            store.close()
+
+            reopened = LoudnessStore(path)
+            self.assertEqual(reopened.get('youtube-a'), Loudness(-16.0, -3.0, False))
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# Import required testing modules
+import os  # Path helpers and environment access
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary directories for the on-disk backend
+import threading  # Checks which thread writes to the disk
+import time  # Builds stream URLs with an "expire" timestamp
+import unittest  # Python testing framework
+
+# Ensure the project root is importable and keep the default cache in memory only
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('METADATA_CACHE_PATH', '')
+
+from utils.ttl_cache import TTLCache  # LRU+TTL base cache under test
+from utils.metadata_cache import MetadataCache, SQLiteMetadataBackend  # Metadata cache under test
+
+
+class FakeClock:
+    """Manually advanced clock so TTL expiry can be tested without sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def video_info(video_id, expire_in=3600):
+    """Build a minimal yt-dlp info dict for a single video."""
+    return {
+        'id': video_id,
+        'title': f"Title {video_id}",
+        'duration': 200,
+        'webpage_url': f"https://www.youtube.com/watch?v={video_id}",
+        'url': f"https://rr1.googlevideo.com/videoplayback?expire={int(time.time() + expire_in)}",
+        'acodec': 'opus',
+        'formats': [{'url': 'https://format'}] * 10,
+    }
+
+
+class TestTTLCache(unittest.TestCase):
+    """Unit tests for LRU eviction, TTL expiry and hit/miss counters."""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted once the cache is full."""
+        cache = TTLCache(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' becomes the least recently used
+        cache.set('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_ttl_expiry_and_counters(self):
+        """Expired entries are misses and are dropped on access."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=10, ttl=10, clock=clock)
+        cache.set('a', 1)
+
+        self.assertEqual(cache.get('a'), 1)
+        clock.now = 11
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 0)
+
+
+class TestMetadataCache(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the split metadata/stream cache."""
+
+    async def test_metadata_outlives_expired_stream(self):
+        """A stream URL past its expire parameter is not returned, but metadata is."""
+        cache = MetadataCache()
+        url = "https://youtu.be/abc"
+        cache.put(url, video_info('abc', expire_in=60))  # Inside the safety margin
+
+        info = await cache.get(url)
+        self.assertEqual(info['title'], "Title abc")
+        self.assertNotIn('url', info)
+        self.assertNotIn('formats', info)
+        self.assertIsNone(await cache.get(url, require_stream=True))
+
+    async def test_indexed_by_webpage_url(self):
+        """Entries are reachable through both the request URL and the webpage URL."""
+        cache = MetadataCache()
+        cache.put("https://youtu.be/abc", video_info('abc'))
+
+        info = await cache.get("https://www.youtube.com/watch?v=abc", require_stream=True)
+        self.assertEqual(info['acodec'], 'opus')
+        self.assertEqual(cache.stats()['metadata_hits'], 1)
+
+    async def test_disk_backend_survives_restart(self):
+        """A new cache instance reads entries written by a previous one."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metadata.sqlite3')
+            first = MetadataCache(backend=SQLiteMetadataBackend(path))
+            first.put("u", video_info('abc'))
+            first.flush()  # The write is queued on the SQLite thread
+            first.backend.close()
+
+            restarted = MetadataCache(backend=SQLiteMetadataBackend(path))
+            info = await restarted.get("u", require_stream=True)
+            self.assertEqual(info['id'], 'abc')
+            self.assertEqual(restarted.stats()['metadata_hits'], 1)
+            restarted.backend.close()
+
+    async def test_put_does_not_wait_for_disk(self):
+        """put() returns before the SQLite write, which happens on the worker thread."""
+        with tempfile.TemporaryDirectory() as directory:
+            backend = SQLiteMetadataBackend(os.path.join(directory, 'metadata.sqlite3'))
+            cache = MetadataCache(backend=backend)
+            threads = []
+            store = backend.store
+            backend.store = lambda *args: (threads.append(threading.current_thread()), store(*args))
+
+            cache.put("u", video_info('abc'))
+            self.assertEqual((await cache.get("u"))['id'], 'abc')  # Served from memory meanwhile
+            cache.flush()
+            self.assertEqual(len(threads), 4)  # Metadata and stream rows, under both URLs
+            self.assertTrue(all(thread is not threading.main_thread() for thread in threads))
+            self.assertIsNotNone(backend.load('metadata', 'u'))
+            backend.close()
+
+
+if __name__ == "__main__":
+    # Execute all test cases when run as main script
+    unittest.main()
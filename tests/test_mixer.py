@@ -0,0 +1,151 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music.mixer import MixerSource  # Code under test
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is not installed
+    np = None
+
+FRAME_BYTES = 3840  # 20 ms of 48 kHz 16-bit stereo PCM
+
+
+class FrameSource:
+    """Source returning `frames` constant frames, counting them like PrimedAudio."""
+
+    def __init__(self, value, frames, opus=False):
+        self.value = value
+        self.frames = frames
+        self.read_frames = 0
+        self.duration = frames * 0.02
+        self.opus = opus
+        self.cleaned = False
+
+    @property
+    def position(self):
+        return self.read_frames * 0.02
+
+    def read(self):
+        if self.read_frames >= self.frames:
+            return b''
+        self.read_frames += 1
+        if self.opus:
+            return bytes([self.value])  # Stand-in for an Opus packet
+        return int(self.value).to_bytes(2, 'little', signed=True) * (FRAME_BYTES // 2)
+
+    def is_opus(self):
+        return self.opus
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class TestMixerSource(unittest.TestCase):
+    """Unit tests for the gapless mixer.
+
+    Tests include:
+    - The next track starts in the same read the current one ends
+    - Frames are tagged as Opus or PCM according to the track they came from
+    - A cancelled next track is never played
+    - Crossfades overlap the tracks with equal-power curves
+    - The current track's metadata is readable through the mixer
+    """
+
+    def setUp(self):
+        self.transitions = []
+
+    def mixer(self, current, crossfade=0.0):
+        return MixerSource(current, crossfade=crossfade,
+                           on_transition=lambda previous, new: self.transitions.append((previous, new)))
+
+    def read_all(self, mixer):
+        frames = []
+        while frame := mixer.read():
+            frames.append((frame, mixer.is_opus()))
+        return frames
+
+    def test_gapless_transition(self):
+        """No empty frame separates two tracks and the transition is reported once."""
+        first, second = FrameSource(1, 3), FrameSource(2, 2)
+        mixer = self.mixer(first)
+        self.assertTrue(mixer.queue_next(second))
+        self.assertFalse(mixer.queue_next(FrameSource(3, 1)))  # Only one track is queued ahead
+
+        frames = self.read_all(mixer)
+        self.assertEqual(len(frames), 5)
+        self.assertEqual([frame[:2] for frame, _ in frames], [b'\x01\x00'] * 3 + [b'\x02\x00'] * 2)
+        self.assertEqual(self.transitions, [(first, second)])
+        self.assertTrue(first.cleaned)
+        self.assertIs(mixer.current, second)
+
+    def test_opus_flag_follows_the_frame(self):
+        """An Opus track followed by a PCM track switches the encoding with the first PCM frame."""
+        mixer = self.mixer(FrameSource(1, 2, opus=True))
+        mixer.queue_next(FrameSource(2, 2))
+        self.assertEqual([opus for _, opus in self.read_all(mixer)], [True, True, False, False])
+
+    def test_cancelled_next_track(self):
+        """A next track taken back before the current one ends is never read."""
+        first, second = FrameSource(1, 2), FrameSource(2, 2)
+        mixer = self.mixer(first)
+        mixer.queue_next(second)
+        self.assertIs(mixer.cancel_next(), second)
+
+        self.assertEqual(len(self.read_all(mixer)), 2)
+        self.assertEqual(second.read_frames, 0)
+        self.assertEqual(self.transitions, [])
+
+    def test_replace_current(self):
+        """The current track is only replaced while it is still the one playing."""
+        first, second = FrameSource(1, 2), FrameSource(2, 2)
+        mixer = self.mixer(first)
+        self.assertTrue(mixer.replace_current(first, second))
+        self.assertFalse(mixer.replace_current(first, FrameSource(3, 1)))
+        self.assertIs(mixer.current, second)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_crossfade(self):
+        """During the last second both tracks are mixed, fading one out and the other in."""
+        first, second = FrameSource(10000, 100), FrameSource(10000, 100)
+        mixer = self.mixer(first, crossfade=1.0)
+        mixer.queue_next(second)
+
+        frames = [mixer.read() for _ in range(60)]
+        # The next track can no longer be taken back once it is fading in
+        self.assertIsNone(mixer.cancel_next())
+        frames += [frame for frame, _ in self.read_all(mixer)]
+        frames = [np.frombuffer(frame, dtype=np.int16) for frame in frames]
+        self.assertEqual(len(frames), 150)  # Two 2 s tracks overlapping for 1 s
+        self.assertTrue(all(frame[0] == 10000 for frame in frames[:50]))
+        # Equal power: two identical signals sum to sqrt(2) times the level mid-fade
+        self.assertAlmostEqual(frames[75].max() / 10000, np.sqrt(2), delta=0.05)
+        self.assertTrue(all(frame[-1] == 10000 for frame in frames[101:]))
+        self.assertEqual(len(self.transitions), 1)
+
+    def test_current_track_metadata(self):
+        """Commands reading the voice client's source see the current track's attributes."""
+        first, second = FrameSource(1, 1), FrameSource(2, 1)
+        first.title, second.title = 'first', 'second'
+        mixer = self.mixer(first)
+        mixer.queue_next(second)
+        self.assertEqual((mixer.title, mixer.duration), ('first', 0.02))
+        self.read_all(mixer)
+        self.assertEqual(mixer.title, 'second')
+        self.assertFalse(hasattr(mixer, 'filename'))
+
+    def test_cleanup_releases_both_tracks(self):
+        first, second = FrameSource(1, 2), FrameSource(2, 2)
+        mixer = self.mixer(first)
+        mixer.queue_next(second)
+        mixer.cleanup()
+        self.assertTrue(first.cleaned and second.cleaned)
+
+
+if __name__ == '__main__':
+    unittest.main()
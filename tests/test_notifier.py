@@ -0,0 +1,93 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+import disnake  # For the HTTP exceptions raised by message edits
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music.notifier import GuildNotifier  # Code under test
+
+
+class FakeResponse:
+    """Minimal aiohttp response used to build disnake HTTP exceptions."""
+
+    status = 404
+    reason = 'Not Found'
+
+
+class FakeMessage:
+    def __init__(self, embed):
+        self.embed = embed
+        self.deleted = False
+
+    async def edit(self, embed=None):
+        if self.deleted:
+            raise disnake.NotFound(FakeResponse(), 'Unknown Message')
+        self.embed = embed
+
+
+class FakeChannel:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, embed=None):
+        message = FakeMessage(embed)
+        self.messages.append(message)
+        return message
+
+
+class TestGuildNotifier(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the per-guild notifier.
+
+    Tests include:
+    - Nothing is sent before a channel is bound
+    - Status messages are edited in place
+    - Deleted status messages are posted again
+    - Binding another channel starts new status messages
+    """
+
+    async def test_unbound(self):
+        """Without a channel, messages are dropped."""
+        notifier = GuildNotifier(1)
+        self.assertIsNone(await notifier.send('hello'))
+        self.assertIsNone(await notifier.update('status', 'hello'))
+
+    async def test_update_edits_in_place(self):
+        """Updates of one key edit the same message."""
+        channel = FakeChannel()
+        notifier = GuildNotifier(1, channel)
+        await notifier.update('playlist', 'page 1')
+        await notifier.update('playlist', 'page 2')
+        await notifier.send('now playing')
+
+        self.assertEqual(len(channel.messages), 2)
+        self.assertEqual(channel.messages[0].embed, 'page 2')
+
+    async def test_deleted_message_is_reposted(self):
+        """If the status message was deleted, the next update posts a new one."""
+        channel = FakeChannel()
+        notifier = GuildNotifier(1, channel)
+        first = await notifier.update('playlist', 'page 1')
+        first.deleted = True
+        second = await notifier.update('playlist', 'page 2')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.embed, 'page 2')
+
+    async def test_rebind(self):
+        """Status messages of the previous channel are not edited after rebinding."""
+        old, new = FakeChannel(), FakeChannel()
+        notifier = GuildNotifier(1, old)
+        await notifier.update('playlist', 'page 1')
+        notifier.bind(new)
+        await notifier.update('playlist', 'page 2')
+
+        self.assertEqual(old.messages[0].embed, 'page 1')
+        self.assertEqual(new.messages[0].embed, 'page 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
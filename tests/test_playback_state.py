@@ -0,0 +1,93 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.metrics import metrics  # Shared metrics registry filled by the state machine
+from extra_modules.music.playback_state import PlaybackState, PlaybackStateMachine  # Code under test
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPlaybackStateMachine(unittest.TestCase):
+    """Unit tests for the per-guild playback state machine.
+
+    Tests include:
+    - The idle -> resolving -> playing -> paused cycle
+    - Only one event can start a track at a time
+    - Invalid transitions are ignored
+    - Transition latency metrics
+    - Transition listeners
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.machine = PlaybackStateMachine(1, clock=self.clock)
+
+    def test_full_cycle(self):
+        """A track goes through resolving, playing, paused and back to idle."""
+        self.assertTrue(self.machine.idle)
+        self.assertTrue(self.machine.begin('enqueue'))
+        self.assertIs(self.machine.state, PlaybackState.RESOLVING)
+        self.assertTrue(self.machine.started())
+        self.assertTrue(self.machine.pause())
+        self.assertIs(self.machine.state, PlaybackState.PAUSED)
+        self.assertTrue(self.machine.resume())
+        self.assertTrue(self.machine.stop())
+        self.assertTrue(self.machine.idle)
+
+    def test_single_advance(self):
+        """While a track is being resolved or played, other events cannot start another."""
+        self.assertTrue(self.machine.begin('enqueue'))
+        self.assertFalse(self.machine.begin('track_end'))
+        self.machine.started()
+        self.assertFalse(self.machine.begin('watchdog'))
+
+        self.machine.stop()
+        self.assertTrue(self.machine.begin('track_end'))
+
+    def test_invalid_transitions_are_ignored(self):
+        """Pausing an idle guild or stopping twice leaves the state unchanged."""
+        self.assertFalse(self.machine.pause())
+        self.assertFalse(self.machine.resume())
+        self.assertFalse(self.machine.stop())
+        self.assertFalse(self.machine.started())
+        self.assertTrue(self.machine.idle)
+
+    def test_latency_metrics(self):
+        """Transitions record the time spent in the previous state and the advance latency per event."""
+        self.clock.now = 10.0
+        self.machine.begin('track_end')
+        self.clock.now = 10.4
+        self.machine.started()
+        self.clock.now = 190.4
+        self.machine.stop()
+
+        self.assertAlmostEqual(metrics.get('playback.advance.track_end').last, 0.4)
+        self.assertAlmostEqual(metrics.get('playback.resolving_to_playing').last, 0.4)
+        self.assertAlmostEqual(metrics.get('playback.playing_to_idle').last, 180.0)
+        self.assertAlmostEqual(metrics.get('playback.idle_to_resolving').last, 10.0)
+
+    def test_on_change(self):
+        """The listener is notified of every transition, but not of ignored ones."""
+        changes = []
+        machine = PlaybackStateMachine(7, clock=self.clock, on_change=lambda *change: changes.append(change))
+        machine.begin('enqueue')
+        machine.pause()
+        machine.stop()
+        self.assertEqual(changes, [(7, PlaybackState.RESOLVING), (7, PlaybackState.IDLE)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the prefetcher
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.queue_manager import GuildQueueRegistry  # Per-guild queues watched by the prefetcher
+from utils.track import Track  # Compact track record stored in the queues
+from extra_modules.music.prefetcher import Prefetcher  # Background resolver under test
+
+
+class TestPrefetcher(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the background prefetch window.
+
+    Tests include:
+    - Only the next N tracks are resolved
+    - Work is cancelled when tracks are removed from the queue
+    - The track that starts playing keeps its in-flight resolve
+    """
+
+    async def asyncSetUp(self):
+        """Create a registry watched by a prefetcher with a controllable resolver."""
+        self.started = []
+        self.cancelled = []
+        self.release = asyncio.Event()
+
+        async def resolve(url):
+            self.started.append(url)
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(url)
+                raise
+
+        self.registry = GuildQueueRegistry()
+        self.prefetcher = Prefetcher(resolve=resolve, depth=2)
+        self.registry.add_listener(self.prefetcher.on_queue_changed)
+        self.queue = self.registry.get(1)
+
+    async def asyncTearDown(self):
+        self.prefetcher.cancel_all()
+        await asyncio.sleep(0)
+
+    async def test_resolves_only_the_window(self):
+        """Only the first `depth` queued tracks are prefetched."""
+        for name in ("a", "b", "c"):
+            self.queue.add_to_queue(Track(name, name))
+        await asyncio.sleep(0)
+
+        self.assertEqual(sorted(self.started), ["a", "b"])
+
+    async def test_clear_cancels_pending_work(self):
+        """Clearing the queue cancels every pending resolve."""
+        for name in ("a", "b"):
+            self.queue.add_to_queue(Track(name, name))
+        await asyncio.sleep(0)
+
+        self.queue.clear_queue()
+        await asyncio.sleep(0)
+        self.assertEqual(sorted(self.cancelled), ["a", "b"])
+
+    async def test_next_track_keeps_its_resolve(self):
+        """The dequeued track is not cancelled, and the window slides forward."""
+        for name in ("a", "b", "c"):
+            self.queue.add_to_queue(Track(name, name))
+        await asyncio.sleep(0)
+
+        self.queue.get_next()
+        await asyncio.sleep(0)
+        self.assertEqual(self.cancelled, [])
+        self.assertEqual(sorted(self.started), ["a", "b", "c"])
+
+
+if __name__ == "__main__":
+    # Execute all test cases when run as main script
+    unittest.main()
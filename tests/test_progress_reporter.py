@@ -0,0 +1,89 @@
+# Import required testing modules
+import asyncio  # Event loop used by the background publisher
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music.progress_reporter import ProgressReporter  # Code under test
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressReporter(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the debounced progress reporter.
+
+    Tests include:
+    - Bursts of updates are coalesced into few edits
+    - Closing publishes the final counts
+    - Throughput and ETA computation
+    - Slow (rate limited) edits stretch the interval
+    """
+
+    async def asyncSetUp(self):
+        self.published = []
+
+        async def publish(embed):
+            self.published.append(embed)
+
+        self.publish = publish
+        self.render = lambda progress: (progress.added, progress.skipped)
+
+    async def test_coalesces_updates(self):
+        """Hundreds of updates within one interval cost a single edit."""
+        progress = ProgressReporter(self.publish, self.render, 500, interval=60)
+        for _ in range(500):
+            progress.advance()
+            await asyncio.sleep(0)
+        self.assertEqual(self.published, [(1, 0)])
+
+        await progress.close()
+        self.assertEqual(self.published, [(1, 0), (500, 0)])
+
+    async def test_close_without_changes(self):
+        """Closing after the last counts were shown does not edit again."""
+        progress = ProgressReporter(self.publish, self.render, interval=60)
+        await progress.start('processing')
+        await progress.close()
+        self.assertEqual(self.published, ['processing'])
+        progress.skip()
+        await progress.close()
+        self.assertEqual(self.published, ['processing', (0, 1)])
+
+    async def test_rate_and_eta(self):
+        """Throughput counts skipped items and the ETA covers the remaining ones."""
+        clock = FakeClock()
+        progress = ProgressReporter(self.publish, self.render, 100, interval=60, clock=clock)
+        self.assertIsNone(progress.eta)
+        progress.advance(count=15)
+        progress.skip(count=5)
+        clock.now = 10.0
+        self.assertEqual(progress.rate, 2.0)
+        self.assertEqual(progress.eta, 40.0)
+        progress.cancel()
+
+    async def test_slow_edit_backs_off(self):
+        """An edit that took longer than the interval delays the next one by as much."""
+        clock = FakeClock()
+
+        async def slow_publish(embed):
+            clock.now += 5.0  # Held back by the rate limiter
+            self.published.append(embed)
+
+        progress = ProgressReporter(slow_publish, self.render, interval=1, max_interval=3, clock=clock)
+        await progress.start('processing')
+        self.assertEqual(progress._delay, 3)
+        self.assertEqual(progress._next_edit, 8.0)
+        progress.cancel()
+
+
+if __name__ == '__main__':
+    unittest.main()
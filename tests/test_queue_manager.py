@@ -0,0 +1,188 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import queue_manager  # Per-guild queue engine under test
+from utils.track import Track  # Compact track record stored in the queues
+
+
+class TestGuildQueueRegistry(unittest.TestCase):
+    """Unit tests for the per-guild queue registry.
+
+    Tests include:
+    - Isolation of queues, history and current track between guilds
+    - FIFO ordering and priority insertion
+    - Queue limit enforcement
+    - Batch insertion at any position with a single capacity check
+    """
+
+    def setUp(self):
+        """Use a fresh registry so tests never share state."""
+        self.registry = queue_manager.GuildQueueRegistry()
+
+    def test_guilds_are_isolated(self):
+        """Tracks added to one guild must never leak into another guild."""
+        first = self.registry.get(1)
+        second = self.registry.get(2)
+
+        first.add_to_queue(Track("A", "a"))
+        second.add_to_queue(Track("B", "b"))
+
+        self.assertEqual(first.get_next().title, "A")
+        self.assertEqual(first.get_current_track().title, "A")
+        self.assertIsNone(second.get_current_track())
+        self.assertEqual([t.title for t in second.show_queue()], ["B"])
+        self.assertTrue(first.is_empty())
+
+    def test_registry_returns_same_queue(self):
+        """The same guild ID always maps to the same queue object until removed."""
+        queue = self.registry.get(42)
+        self.assertIs(queue, self.registry.get(42))
+
+        self.registry.remove(42)
+        self.assertNotIn(42, self.registry)
+        self.assertIsNot(queue, self.registry.get(42))
+
+    def test_priority_and_skip(self):
+        """Priority tracks go to the front and skip drops from the front."""
+        queue = self.registry.get(1)
+        for title in ("A", "B", "C"):
+            queue.add_to_queue(Track(title, "url"))
+        queue.add_to_queue(Track("P", "url"), next_in_queue=True)
+
+        self.assertEqual([t.title for t in queue.show_queue()], ["P", "A", "B", "C"])
+        queue.skip(2)
+        self.assertEqual([t.title for t in queue.show_queue()], ["B", "C"])
+
+    def test_history_is_most_recent_first(self):
+        """History keeps the most recently played track first."""
+        queue = self.registry.get(1)
+        queue.add_to_played(Track("old", "url"))
+        queue.add_to_played(Track("new", "url"))
+
+        self.assertEqual([t.title for t in queue.get_recent_tracks()], ["new", "old"])
+        self.assertEqual(len(queue.get_recent_tracks(limit=1)), 1)
+
+    def test_history_is_bounded(self):
+        """History evicts the oldest entry once MAX_HISTORY is reached."""
+        original_history = queue_manager.MAX_HISTORY
+        queue_manager.MAX_HISTORY = 3
+        try:
+            queue = queue_manager.GuildQueue(1)
+            for title in ("A", "B", "C", "D"):
+                queue.add_to_played(Track(title, "url"))
+        finally:
+            queue_manager.MAX_HISTORY = original_history
+
+        self.assertEqual([t.title for t in queue.get_recent_tracks()], ["D", "C", "B"])
+
+    def test_peek_and_remove(self):
+        """peek does not consume tracks and remove_from_queue validates the index."""
+        queue = self.registry.get(1)
+        for title in ("A", "B", "C"):
+            queue.add_to_queue(Track(title, "url"))
+
+        self.assertEqual([t.title for t in queue.peek(2)], ["A", "B"])
+        self.assertEqual(queue.remove_from_queue(1).title, "B")
+        self.assertEqual(queue.queue_length(), 2)
+        with self.assertRaises(IndexError):
+            queue.remove_from_queue(5)
+
+    def test_listeners_receive_change_events(self):
+        """Registry listeners are told about every change of any guild queue."""
+        events = []
+        self.registry.add_listener(lambda queue, event: events.append((queue.guild_id, event)))
+
+        queue = self.registry.get(5)
+        queue.add_to_queue(Track("A", "url"))
+        queue.add_to_queue(Track("B", "url"))
+        queue.get_next()
+        queue.skip(1)
+        self.registry.remove(5)
+
+        self.assertEqual(events, [(5, 'add'), (5, 'add'), (5, 'next'), (5, 'remove'), (5, 'clear')])
+
+    def test_queue_limit(self):
+        """Adding past QUEUE_LIMIT raises ValueError."""
+        queue = self.registry.get(1)
+        original_limit = queue_manager.QUEUE_LIMIT
+        queue_manager.QUEUE_LIMIT = 2
+        try:
+            queue.add_to_queue(Track("A", "url"))
+            queue.add_to_queue(Track("B", "url"))
+            with self.assertRaises(ValueError):
+                queue.add_to_queue(Track("C", "url"))
+        finally:
+            queue_manager.QUEUE_LIMIT = original_limit
+
+    def test_add_many_positions(self):
+        """Batches keep their order at the end, the front or any index."""
+        queue = self.registry.get(1)
+        queue.add_many([Track(title, "url") for title in ("A", "B", "C")])
+        queue.add_many([Track("X", "url"), Track("Y", "url")], position=1)
+        queue.add_many([Track("F", "url")], position=0)
+        queue.add_many([Track("Z", "url")], position=-1)
+        queue.add_many([Track("E", "url")], position=100)
+
+        self.assertEqual([t.title for t in queue.show_queue()], ["F", "A", "X", "Y", "B", "Z", "C", "E"])
+
+    def test_add_many_limit(self):
+        """Only the tracks that fit are accepted, with one 'add' event and no exception."""
+        events = []
+        self.registry.add_listener(lambda queue, event: events.append(event))
+        queue = self.registry.get(1)
+        original_limit = queue_manager.QUEUE_LIMIT
+        queue_manager.QUEUE_LIMIT = 3
+        try:
+            queue.add_to_queue(Track("A", "url"))
+            result = queue.add_many([Track(title, "url") for title in ("B", "C", "D", "E")])
+            empty = queue.add_many([Track("F", "url")], position=0)
+        finally:
+            queue_manager.QUEUE_LIMIT = original_limit
+
+        self.assertEqual([t.title for t in result.accepted], ["B", "C"])
+        self.assertEqual([t.title for t in result.rejected], ["D", "E"])
+        self.assertEqual([t.title for t in empty.rejected], ["F"])
+        self.assertEqual([t.title for t in queue.show_queue()], ["A", "B", "C"])
+        self.assertEqual(events, ['add', 'add'])
+
+
+class TestTrack(unittest.TestCase):
+    """Unit tests for the compact Track record."""
+
+    def test_from_info_keeps_only_compact_fields(self):
+        """Building from yt-dlp data keeps the display fields and drops the rest."""
+        info = {
+            "title": "Song",
+            "webpage_url": "https://youtube.com/watch?v=x",
+            "duration": 215.4,
+            "thumbnail": "https://i.ytimg.com/x.jpg",
+            "formats": [{"url": "https://stream"}] * 20,
+        }
+        track = Track.from_info(info, requester=7)
+
+        self.assertEqual(track.title, "Song")
+        self.assertEqual(track.url, "https://youtube.com/watch?v=x")
+        self.assertEqual(track.duration, 215)
+        self.assertEqual(track.requester, 7)
+        self.assertFalse(hasattr(track, "__dict__"))
+
+    def test_track_is_immutable(self):
+        """Tracks cannot be mutated; replace returns a new record."""
+        track = Track("A", "url")
+        with self.assertRaises(AttributeError):
+            track.title = "B"
+
+        renamed = track.replace(title="B")
+        self.assertEqual(track.title, "A")
+        self.assertEqual(renamed.title, "B")
+        self.assertEqual(renamed.url, "url")
+
+
+if __name__ == "__main__":
+    # Execute all test cases when run as main script
+    unittest.main()
@@ -0,0 +1,82 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the cache
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('METADATA_CACHE_PATH', '')  # Keep the shared cache in memory during tests
+
+from utils.search_cache import SearchCache, normalize_query  # Code under test
+
+
+def make_results(count):
+    """Build search results in the yt-dlp format."""
+    return [
+        {'id': f'v{i}', 'title': f'Song {i}', 'webpage_url': f'https://www.youtube.com/watch?v=v{i}',
+         'url': f'https://media.example/v{i}', 'formats': [{}] * 20}
+        for i in range(count)
+    ]
+
+
+class TestSearchCache(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the normalized search cache.
+
+    Tests include:
+    - Query normalization (case, whitespace, accents)
+    - Results fetched with a larger limit serve smaller ones
+    - Expiration
+    - Concurrent identical searches run only once
+    """
+
+    def test_normalize_query(self):
+        """Case, repeated whitespace and accents do not change the key."""
+        self.assertEqual(normalize_query('  Coração   VALENTE\t'), 'coracao valente')
+        self.assertEqual(normalize_query('Beyoncé  Halo'), normalize_query('beyonce halo'))
+
+    def test_limits_and_compact_results(self):
+        """A 3-result search serves a 1-result lookup, but not the other way around."""
+        cache = SearchCache()
+        cache.put('Some Song', 3, make_results(3))
+
+        first = cache.get('some  song', 1)
+        self.assertEqual([r['id'] for r in first], ['v0'])
+        self.assertNotIn('formats', first[0])  # Only stable metadata is kept
+
+        cache.put('other song', 1, make_results(1))
+        self.assertIsNone(cache.get('other song', 3))
+
+    def test_expiration(self):
+        """Results are not served after the TTL."""
+        now = [0.0]
+        cache = SearchCache(ttl=60, clock=lambda: now[0])
+        cache.put('song', 1, make_results(1))
+        now[0] = 61
+        self.assertIsNone(cache.get('song', 1))
+
+    async def test_coalesces_concurrent_searches(self):
+        """Identical searches in flight at the same time share one request."""
+        cache = SearchCache()
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return make_results(1)
+
+        queries = ['Song Name', 'song name', ' SONG  name ', 'Sóng Name', 'song name']
+        results = await asyncio.gather(*(cache.get_or_search(q, 1, search) for q in queries))
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(r[0]['id'] == 'v0' for r in results))
+        self.assertEqual(cache.stats()['coalesced'], 4)
+
+        # Later lookups are served from the cache
+        await cache.get_or_search('song name', 1, search)
+        self.assertEqual(calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
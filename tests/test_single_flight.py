@@ -0,0 +1,99 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the utility
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.single_flight import SingleFlight  # Code under test
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for single-flight request coalescing.
+
+    Tests include:
+    - N concurrent callers trigger exactly one extraction
+    - Different keys run independently
+    - Failures reach every caller and release the key
+    - Cancelling one caller does not cancel the others
+    """
+
+    async def asyncSetUp(self):
+        """Create a single-flight group and a slow, counting extraction."""
+        self.flight = SingleFlight()
+        self.extractions = []
+        self.release = asyncio.Event()
+
+        async def extract(url):
+            self.extractions.append(url)
+            await self.release.wait()
+            return {'webpage_url': url, 'title': 'Song'}
+
+        self.extract = extract
+
+    async def test_concurrent_callers_share_one_extraction(self):
+        """Ten concurrent resolves of the same URL run one extraction."""
+        url = 'https://www.youtube.com/watch?v=abc'
+        callers = [
+            asyncio.ensure_future(self.flight.do(url, lambda: self.extract(url)))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*callers)
+
+        self.assertEqual(self.extractions, [url])
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.flight.shared, 9)
+        self.assertEqual(len(self.flight), 0)
+
+        # Once finished, the key is released and a new call extracts again
+        await self.flight.do(url, lambda: self.extract(url))
+        self.assertEqual(len(self.extractions), 2)
+
+    async def test_different_keys_run_independently(self):
+        """Each key gets its own extraction."""
+        self.release.set()
+        await asyncio.gather(*(
+            self.flight.do(url, lambda url=url: self.extract(url))
+            for url in ('a', 'b', 'a', 'b', 'c')
+        ))
+        self.assertEqual(sorted(self.extractions), ['a', 'b', 'c'])
+
+    async def test_failure_reaches_every_caller(self):
+        """All callers see the same error, and the key can be retried afterwards."""
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError('extraction failed')
+
+        results = await asyncio.gather(
+            *(self.flight.do('url', failing) for _ in range(3)),
+            return_exceptions=True
+        )
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertFalse(self.flight.in_flight('url'))
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """A caller that gives up leaves the shared extraction running."""
+        first = asyncio.ensure_future(self.flight.do('url', lambda: self.extract('url')))
+        second = asyncio.ensure_future(self.flight.do('url', lambda: self.extract('url')))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+
+        self.assertEqual((await second)['webpage_url'], 'url')
+        self.assertTrue(first.cancelled())
+        self.assertEqual(self.extractions, ['url'])
+
+
+if __name__ == '__main__':
+    unittest.main()
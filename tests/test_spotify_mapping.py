@@ -0,0 +1,73 @@
+# Import required testing modules
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary directory for the SQLite database
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SPOTIFY_MAPPING_PATH', '')  # Keep the shared mapping in memory during tests
+
+from utils.spotify_mapping import SpotifyMappingStore, spotify_track_id, youtube_video_id  # Code under test
+
+
+class TestSpotifyMapping(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the Spotify track -> YouTube video mapping store.
+
+    Tests include:
+    - ID parsing from Spotify and YouTube links
+    - Single and bulk lookups (beyond SQLite's parameter limit)
+    - Persistence across restarts
+    - Event-loop variants that use the SQLite worker thread
+    """
+
+    def test_id_parsing(self):
+        """Track and video IDs are extracted from the common link formats."""
+        track_id = '4uLU6hMCjMI75M1A2tKUQC'
+        self.assertEqual(spotify_track_id(f'https://open.spotify.com/track/{track_id}?si=abc'), track_id)
+        self.assertEqual(spotify_track_id(f'spotify:track:{track_id}'), track_id)
+        self.assertIsNone(spotify_track_id('https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M'))
+
+        self.assertEqual(youtube_video_id('https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=1'), 'dQw4w9WgXcQ')
+        self.assertEqual(youtube_video_id('https://youtu.be/dQw4w9WgXcQ'), 'dQw4w9WgXcQ')
+
+    def test_get_and_bulk_lookup(self):
+        """Only mapped tracks are returned, even for lookups larger than one SQL query."""
+        store = SpotifyMappingStore()
+        store.put('sp0', 'https://www.youtube.com/watch?v=aaaaaaaaaaa', 'Song 0')
+        self.assertEqual(store.get('sp0').url, 'https://www.youtube.com/watch?v=aaaaaaaaaaa')
+        self.assertEqual(store.get('sp0').title, 'Song 0')
+        self.assertIsNone(store.get('missing'))
+
+        store.put_many((f'sp{i}', f'vid{i:08d}', None) for i in range(1, 2000, 2))
+        found = store.get_many(f'sp{i}' for i in range(2000))
+        self.assertEqual(len(found), 1001)
+        self.assertEqual(found['sp1999'].youtube_id, 'vid00001999')
+
+    def test_persists_across_restarts(self):
+        """Mappings written before a restart are found afterwards."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'mapping.sqlite3')
+            store = SpotifyMappingStore(path)
+            store.put('sp0', 'https://youtu.be/aaaaaaaaaaa', 'Song 0')
+            store.close()
+
+            reopened = SpotifyMappingStore(path)
+            self.assertEqual(reopened.get('sp0').youtube_id, 'aaaaaaaaaaa')
+            reopened.close()
+
+    async def test_fetch_and_save_off_the_loop(self):
+        """Queued writes are visible to later fetches, which run on the worker thread."""
+        store = SpotifyMappingStore()
+        store.save_many([('sp0', 'https://youtu.be/aaaaaaaaaaa', 'Song 0'), ('sp1', 'bbbbbbbbbbb', None)])
+        self.assertEqual((await store.fetch('sp0')).title, 'Song 0')
+        self.assertEqual(set(await store.fetch_many(['sp0', 'sp1', 'sp2'])), {'sp0', 'sp1'})
+
+        store.save('sp2', 'ccccccccccc')
+        store.flush()
+        self.assertEqual(len(store), 3)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
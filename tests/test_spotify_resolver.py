@@ -0,0 +1,125 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the resolver
+import os  # Path helpers for locating the project root
+import random  # Randomized search delays to shuffle completion order
+import sys  # Provides access to Python runtime environment
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from extra_modules.music.spotify_resolver import PlaylistResolver, fetch_playlist_items  # Code under test
+from utils.spotify_mapping import SpotifyMappingStore  # Mapping consulted before searching
+
+
+def make_track(index):
+    """Build a minimal Spotify track object."""
+    return {'name': f'song{index}', 'artists': [{'name': f'artist{index}'}]}
+
+
+class FakeSpotify:
+    """Spotify client stub returning a playlist split into pages."""
+
+    def __init__(self, total, page_size=100):
+        self.pages = [
+            [{'track': make_track(i)} for i in range(start, min(start + page_size, total))]
+            for start in range(0, total, page_size)
+        ]
+
+    def _page(self, number):
+        has_next = number + 1 < len(self.pages)
+        return {'items': self.pages[number], 'next': f'page{number + 1}' if has_next else None, 'number': number}
+
+    def playlist_tracks(self, url):
+        return self._page(0)
+
+    def next(self, page):
+        return self._page(page['number'] + 1)
+
+
+class TestPlaylistResolver(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the concurrent Spotify playlist resolver.
+
+    Tests include:
+    - Pagination past the first 100 items
+    - Results come back in playlist order
+    - The number of concurrent searches is bounded
+    - Stopping early cancels outstanding searches
+    - Mapped tracks skip the search and new resolutions are stored
+    """
+
+    def test_fetch_follows_pagination(self):
+        """Every page of the playlist is fetched, in order."""
+        tracks = fetch_playlist_items(FakeSpotify(250), 'playlist')
+        self.assertEqual([t['name'] for t in tracks], [f'song{i}' for i in range(250)])
+
+    async def test_results_in_order_with_bounded_concurrency(self):
+        """Searches overlap up to the worker limit but results keep playlist order."""
+        running = 0
+        peak = 0
+
+        async def search(query):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(random.uniform(0, 0.01))
+            running -= 1
+            return None if query.startswith('song3 ') else f'https://youtu.be/{query.split()[0]}'
+
+        resolver = PlaylistResolver(search, workers=3)
+        tracks = [make_track(i) for i in range(20)]
+        results = [(track['name'], url) async for track, url in resolver.resolve(tracks)]
+
+        self.assertEqual([name for name, _ in results], [f'song{i}' for i in range(20)])
+        self.assertIsNone(results[3][1])
+        self.assertEqual(results[4][1], 'https://youtu.be/song4')
+        self.assertEqual(peak, 3)
+
+    async def test_stopping_early_cancels_pending_searches(self):
+        """Closing the result stream cancels the searches still running."""
+        cancelled = []
+
+        async def search(query):
+            try:
+                await asyncio.sleep(0 if query.startswith('song0 ') else 10)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+            return 'https://youtu.be/first'
+
+        resolver = PlaylistResolver(search, workers=2)
+        results = resolver.resolve([make_track(i) for i in range(5)])
+        track, url = await results.__anext__()
+        self.assertEqual(url, 'https://youtu.be/first')
+
+        await results.aclose()
+        await asyncio.sleep(0)
+        # song1 and song2 held the two worker slots; song3 and song4 never started
+        self.assertEqual(sorted(q.split()[0] for q in cancelled), ['song1', 'song2'])
+
+    async def test_mapping_skips_known_tracks(self):
+        """Known tracks are answered from the mapping; resolved ones are stored for next time."""
+        searched = []
+
+        async def search(query):
+            searched.append(query.split()[0])
+            return f"https://www.youtube.com/watch?v={query.split()[0]:0>11}"
+
+        mapping = SpotifyMappingStore()
+        mapping.put('id1', 'https://www.youtube.com/watch?v=known000001', 'song1')
+        tracks = [dict(make_track(i), id=f'id{i}') for i in range(3)]
+        resolver = PlaylistResolver(search, workers=2, mapping=mapping)
+
+        results = [url async for _, url in resolver.resolve(tracks)]
+        self.assertEqual(results[1], 'https://www.youtube.com/watch?v=known000001')
+        self.assertEqual(sorted(searched), ['song0', 'song2'])
+
+        # Re-queuing the same playlist needs no search at all
+        searched.clear()
+        again = [url async for _, url in resolver.resolve(tracks)]
+        self.assertEqual(again, results)
+        self.assertEqual(searched, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
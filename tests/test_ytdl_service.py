@@ -0,0 +1,189 @@
+# Import required testing modules
+import asyncio  # Event loop primitives used by the service
+import os  # Path helpers for locating the project root
+import sys  # Provides access to Python runtime environment
+import tempfile  # Temporary audio cache directory
+import threading  # To check which thread ran each extraction
+import time  # To simulate slow extractions
+import unittest  # Python testing framework
+
+# Ensure the project root is importable when running from the tests directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('METADATA_CACHE_PATH', '')  # Keep the shared cache in memory during tests
+os.environ.setdefault('AUDIO_CACHE_DIR', tempfile.mkdtemp())  # Keep downloaded files out of the project
+
+try:
+    from extra_modules.music.ytdl_service import YTDLService  # Code under test
+    from utils.audio_cache import audio_cache  # Shared audio file cache used by downloads
+except ImportError:  # yt-dlp is not installed
+    YTDLService = None
+
+
+class FakeYoutubeDL:
+    """YoutubeDL stand-in that records the thread and options of every instance."""
+
+    def __init__(self, params):
+        self.params = params
+        self.owner = threading.get_ident()
+        self.calls = 0
+
+    def extract_info(self, url, download=False):
+        assert threading.get_ident() == self.owner, 'instance shared between threads'
+        self.calls += 1
+        time.sleep(self.params.get('delay', 0.005))
+        if url.startswith('ytsearch'):
+            count = int(url[len('ytsearch'):url.index(':')])
+            return {'entries': [
+                {'id': f'v{i}', 'title': f'result {i}', 'webpage_url': f'https://www.youtube.com/watch?v=v{i}'}
+                for i in range(count)
+            ]}
+        return {'id': 'abc', 'title': 'Song', 'webpage_url': url, 'url': 'https://media.example/abc'}
+
+    def prepare_filename(self, info):
+        return f"youtube-{info['id']}.webm"
+
+
+@unittest.skipIf(YTDLService is None, 'yt-dlp is not installed')
+class TestYTDLService(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the shared yt-dlp extraction service.
+
+    Tests include:
+    - One YoutubeDL instance per worker thread
+    - The concurrency limit
+    - Per-call timeouts
+    - Search, resolve and download results
+    - Concurrent resolves of one URL run a single extraction
+    - Repeat downloads are served from the audio cache
+    - No YoutubeDL instance is built on the event loop thread
+    - Concurrent downloads pin the file for every caller before any of them resumes
+    """
+
+    def make_service(self, **kwargs):
+        return YTDLService(cookies_file=None, factory=FakeYoutubeDL, **kwargs)
+
+    async def test_one_instance_per_thread(self):
+        """Concurrent resolves never share a YoutubeDL instance between threads."""
+        service = self.make_service(max_concurrency=4)
+        await asyncio.gather(*(service.extract(f'https://www.youtube.com/watch?v={i}') for i in range(12)))
+
+    async def test_concurrency_limit(self):
+        """No more than max_concurrency extractions run at the same time."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class CountingYoutubeDL(FakeYoutubeDL):
+            def extract_info(self, url, download=False):
+                nonlocal running, peak
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                try:
+                    return super().extract_info(url, download)
+                finally:
+                    with lock:
+                        running -= 1
+
+        service = YTDLService(cookies_file=None, factory=CountingYoutubeDL, max_concurrency=2)
+        await asyncio.gather(*(service.extract(f'https://www.youtube.com/watch?v={i}') for i in range(8)))
+        self.assertEqual(peak, 2)
+
+    async def test_timeout(self):
+        """A call that takes longer than its timeout releases the caller."""
+        service = YTDLService({'delay': 0.2}, cookies_file=None, factory=FakeYoutubeDL)
+        with self.assertRaises(asyncio.TimeoutError):
+            await service.extract('https://www.youtube.com/watch?v=slow', timeout=0.01)
+
+    async def test_search_resolve_download(self):
+        """The async API returns search results, track info and downloaded file names."""
+        service = self.make_service()
+        results = await service.search('some song', limit=3)
+        self.assertEqual([r['id'] for r in results], ['v0', 'v1', 'v2'])
+
+        info = await service.resolve('https://www.youtube.com/watch?v=abc')
+        self.assertEqual(info['title'], 'Song')
+
+        info, filename = await service.download('https://www.youtube.com/watch?v=abc')
+        self.assertEqual(filename, 'youtube-abc.webm')
+
+    async def test_concurrent_resolves_share_one_extraction(self):
+        """N concurrent resolves of an uncached URL trigger exactly one extraction."""
+        instances = []
+
+        class RecordingYoutubeDL(FakeYoutubeDL):
+            def __init__(self, params):
+                super().__init__(params)
+                instances.append(self)
+
+        service = YTDLService({'delay': 0.05}, cookies_file=None, factory=RecordingYoutubeDL)
+        url = 'https://www.youtube.com/watch?v=single0flight'
+        results = await asyncio.gather(*(service.resolve(url) for _ in range(8)))
+
+        self.assertEqual(sum(instance.calls for instance in instances), 1)
+        self.assertTrue(all(result['title'] == 'Song' for result in results))
+
+    async def test_repeat_download_uses_audio_cache(self):
+        """A second download of a track reuses the cached file and pins it again."""
+        instances = []
+
+        class DownloadingYoutubeDL(FakeYoutubeDL):
+            def __init__(self, params):
+                super().__init__(params)
+                instances.append(self)
+
+            def extract_info(self, url, download=False):
+                info = dict(super().extract_info(url, download), id='cached0', extractor='youtube')
+                if download:
+                    with open(self.prepare_filename(info), 'wb') as f:
+                        f.write(b'audio')
+                return info
+
+            def prepare_filename(self, info):
+                return os.path.join(audio_cache.directory, f"youtube-{info['id']}.webm")
+
+        service = YTDLService(cookies_file=None, factory=DownloadingYoutubeDL)
+        url = 'https://www.youtube.com/watch?v=cached0'
+        _, first = await service.download(url)
+        info, second = await service.download(url)
+
+        self.assertEqual(first, second)
+        self.assertEqual(info['title'], 'Song')
+        self.assertEqual(sum(instance.calls for instance in instances), 1)
+        # The file name is computed in the worker too; the event loop thread builds no instance
+        self.assertNotIn(threading.get_ident(), [instance.owner for instance in instances])
+        self.assertTrue(audio_cache.in_use(first))
+        audio_cache.release(first)
+        audio_cache.release(second)
+        self.assertFalse(audio_cache.in_use(first))
+
+    async def test_concurrent_downloads_are_pinned_in_flight(self):
+        """Every waiter holds its own pin as soon as the shared download finishes."""
+        class DownloadingYoutubeDL(FakeYoutubeDL):
+            def extract_info(self, url, download=False):
+                info = dict(super().extract_info(url, download), id='pinned0', extractor='youtube')
+                if download:
+                    with open(self.prepare_filename(info), 'wb') as f:
+                        f.write(b'audio')
+                return info
+
+            def prepare_filename(self, info):
+                return os.path.join(audio_cache.directory, f"youtube-{info['id']}.webm")
+
+        service = YTDLService({'delay': 0.05}, cookies_file=None, factory=DownloadingYoutubeDL)
+        url = 'https://www.youtube.com/watch?v=pinned0'
+        downloads = [asyncio.ensure_future(service.download(url)) for _ in range(3)]
+        await asyncio.sleep(0)
+        downloads[2].cancel()  # A caller giving up before the download finishes takes no pin
+        done = await asyncio.gather(*downloads, return_exceptions=True)
+
+        filename = done[0][1]
+        self.assertIsInstance(done[2], asyncio.CancelledError)
+        self.assertEqual(service._download_waiters, {})
+        audio_cache.release(filename)
+        self.assertTrue(audio_cache.in_use(filename))  # Still pinned for the second caller
+        audio_cache.release(filename)
+        self.assertFalse(audio_cache.in_use(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
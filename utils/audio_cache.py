@@ -0,0 +1,197 @@
+"""
+Cache em disco dos arquivos de áudio baixados.
+
+Cada arquivo é identificado pelo extrator e pelo ID do vídeo (por exemplo,
+"youtube-dQw4w9WgXcQ.webm"), então tocar a mesma música de novo reaproveita
+o arquivo sem baixar nada. O diretório tem um limite de bytes: quando é
+ultrapassado, os arquivos usados há mais tempo (LRU) são removidos, exceto
+os que estão em uso, protegidos por contagem de referências.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Modelo de nome dos arquivos baixados pelo yt-dlp dentro do diretório do cache
+FILENAME_TEMPLATE = '%(extractor)s-%(id)s.%(ext)s'
+
+_UNSAFE = re.compile(r'[^A-Za-z0-9_-]')
+
+
+def cache_key(info: Dict[str, Any]) -> Optional[str]:
+    """
+    Calcula a chave de um vídeo a partir do resultado do yt-dlp.
+
+    Parâmetros:
+        info (Dict): Metadados com 'extractor' e 'id'
+
+    Retorna:
+        str: Chave "<extrator>-<id>" ou None se faltar algum dos campos
+    """
+    extractor, video_id = info.get('extractor'), info.get('id')
+    if not extractor or not video_id:
+        return None
+    return _UNSAFE.sub('_', f'{extractor}-{video_id}')
+
+
+def key_from_path(path: str) -> str:
+    """Obtém a chave de um arquivo do cache a partir do seu nome."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class AudioFileCache:
+    """
+    Diretório de arquivos de áudio com limite de bytes, descarte LRU e referências.
+
+    Parâmetros:
+        directory (str): Diretório onde os arquivos são guardados
+        max_bytes (int): Tamanho máximo ocupado pelos arquivos
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files: 'OrderedDict[str, Tuple[str, int]]' = OrderedDict()  # chave -> (caminho, bytes)
+        self._refs: Dict[str, int] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    @property
+    def outtmpl(self) -> str:
+        """Modelo de saída do yt-dlp que grava os downloads neste cache."""
+        return os.path.join(self.directory, FILENAME_TEMPLATE)
+
+    def _load_index(self) -> None:
+        """Indexa os arquivos já existentes, do usado há mais tempo para o mais recente."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(('.part', '.ytdl')):
+                stat = entry.stat()
+                entries.append((stat.st_atime, key_from_path(entry.path), entry.path, stat.st_size))
+        for _, key, path, size in sorted(entries):
+            self._files[key] = (path, size)
+            self.total_bytes += size
+
+    def lookup(self, key: Optional[str]) -> Optional[str]:
+        """
+        Procura o arquivo de um vídeo e o marca como usado recentemente.
+
+        Parâmetros:
+            key (str): Chave do vídeo (ver cache_key)
+
+        Retorna:
+            str: Caminho do arquivo ou None se não estiver no cache
+        """
+        with self._lock:
+            entry = self._files.get(key) if key else None
+            if entry is None or not os.path.exists(entry[0]):
+                if entry is not None:
+                    self._forget(key)
+                self.misses += 1
+                return None
+            self._files.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def add(self, path: str) -> None:
+        """
+        Registra um arquivo recém-baixado.
+
+        O limite de bytes não é aplicado aqui, para que o chamador possa marcar o
+        arquivo como em uso (acquire) antes de chamar evict.
+
+        Parâmetros:
+            path (str): Caminho do arquivo dentro do diretório do cache
+        """
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        key = key_from_path(path)
+        with self._lock:
+            self._forget(key)
+            self._files[key] = (path, size)
+            self.total_bytes += size
+
+    def acquire(self, path: str) -> None:
+        """Marca um arquivo como em uso (não será removido até o release correspondente)."""
+        key = key_from_path(path)
+        with self._lock:
+            self._refs[key] = self._refs.get(key, 0) + 1
+            if key in self._files:
+                self._files.move_to_end(key)
+
+    def release(self, path: str) -> None:
+        """Libera uma referência obtida com acquire e aplica o limite de bytes."""
+        key = key_from_path(path)
+        with self._lock:
+            count = self._refs.get(key, 0) - 1
+            if count > 0:
+                self._refs[key] = count
+            else:
+                self._refs.pop(key, None)
+        self.evict()
+
+    def in_use(self, path: str) -> bool:
+        """Indica se um arquivo tem referências ativas."""
+        return key_from_path(path) in self._refs
+
+    def evict(self) -> None:
+        """Remove os arquivos usados há mais tempo até respeitar o limite de bytes."""
+        with self._lock:
+            for key in list(self._files):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                if key in self._refs:
+                    continue  # Em uso: nunca é removido
+                path, _ = self._files[key]
+                self._forget(key)
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not remove cached audio {path}: {str(e)}")
+
+    def _forget(self, key: str) -> None:
+        """Remove uma entrada do índice (o chamador deve segurar o lock)."""
+        entry = self._files.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Contadores do cache.
+
+        Retorna:
+            Dict: acertos, falhas, arquivos, bytes ocupados e arquivos em uso
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'files': len(self._files),
+            'bytes': self.total_bytes,
+            'in_use': len(self._refs),
+        }
+
+
+# Cache global de áudio; AUDIO_CACHE_MAX_BYTES padrão de 2 GiB
+audio_cache = AudioFileCache(
+    os.getenv('AUDIO_CACHE_DIR', os.path.join('storage', 'audio')),
+    int(os.getenv('AUDIO_CACHE_MAX_BYTES', str(2 * 1024 ** 3)))
+)
@@ -0,0 +1,278 @@
+"""
+Gateway único para chamadas bloqueantes feitas pelo bot.
+
+O mesmo event loop atende os dois shards, então qualquer chamada síncrona
+de rede ou de disco (yt-dlp, Spotify, Genius, HTTP, FFmpeg) precisa rodar
+fora dele. Cada dependência tem seu próprio pool de threads, com tamanho
+configurável, para que uma lenta (por exemplo, buscas no YouTube) não ocupe
+as threads das outras.
+
+Os bancos SQLite locais (caches e mapeamentos) têm uma única thread própria,
+que executa leituras e gravações em ordem, uma de cada vez.
+
+Também inclui um monitor que registra em log sempre que algum callback segura
+o event loop por mais tempo que o limite configurado.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Tamanho padrão de cada pool; ajustável por BLOCKING_<NOME>_WORKERS (ex.: BLOCKING_YTDL_WORKERS=6)
+DEFAULT_POOL_SIZES = {
+    'ytdl': 4,      # Extrações, buscas e downloads do yt-dlp
+    'spotify': 2,   # API do Spotify (spotipy)
+    'genius': 2,    # Busca de letras (lyricsgenius)
+    'http': 4,      # Requisições HTTP avulsas (avatares, imagens)
+    'ffmpeg': 4,    # ffprobe e leitura do primeiro quadro do FFmpeg
+    'loudness': 1,  # Análises de loudness em segundo plano (FFmpeg ebur128)
+}
+
+
+class BlockingGateway:
+    """
+    Executa funções bloqueantes em pools de threads separados por dependência.
+
+    Os pools são criados sob demanda, na primeira chamada de cada dependência.
+
+    Parâmetros:
+        sizes (Dict[str, int]): Número de threads de cada pool
+    """
+
+    def __init__(self, sizes: Dict[str, int]):
+        self.sizes = dict(sizes)
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def executor(self, name: str) -> ThreadPoolExecutor:
+        """
+        Obtém (criando se preciso) o pool de uma dependência.
+
+        Parâmetros:
+            name (str): Nome da dependência (ex.: 'ytdl')
+
+        Retorna:
+            ThreadPoolExecutor: Pool exclusivo da dependência
+
+        Levanta:
+            KeyError: Se a dependência não estiver configurada
+        """
+        executor = self._executors.get(name)
+        if executor is None:
+            with self._lock:
+                executor = self._executors.get(name)
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.sizes[name],
+                        thread_name_prefix=f'blocking-{name}'
+                    )
+                    self._executors[name] = executor
+        return executor
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa uma função bloqueante no pool da dependência, sem travar o event loop.
+
+        A duração de cada chamada é registrada na métrica 'blocking.<nome>'.
+
+        Parâmetros:
+            name (str): Nome da dependência (ex.: 'spotify')
+            func (Callable): Função síncrona a executar
+            *args: Argumentos posicionais da função
+
+        Retorna:
+            O valor retornado pela função
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self.executor(name), func, *args)
+        finally:
+            metrics.record(f'blocking.{name}', time.perf_counter() - started)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Encerra todos os pools criados."""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
+
+
+def _pool_sizes_from_env() -> Dict[str, int]:
+    """Lê os tamanhos dos pools das variáveis de ambiente."""
+    return {
+        name: int(os.getenv(f'BLOCKING_{name.upper()}_WORKERS', str(size)))
+        for name, size in DEFAULT_POOL_SIZES.items()
+    }
+
+
+# Gateway global compartilhado por todos os cogs
+gateway = BlockingGateway(_pool_sizes_from_env())
+
+
+async def run_blocking(name: str, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Atalho para gateway.run: executa func(*args) no pool da dependência informada.
+
+    Parâmetros:
+        name (str): Nome da dependência ('ytdl', 'spotify', 'genius', 'http' ou 'ffmpeg')
+        func (Callable): Função síncrona a executar
+        *args: Argumentos posicionais da função
+
+    Retorna:
+        O valor retornado pela função
+    """
+    return await gateway.run(name, func, *args)
+
+
+class SerialWorker:
+    """
+    Thread única que executa funções bloqueantes em ordem de chegada.
+
+    Usada para o disco dos bancos SQLite: as gravações são enfileiradas sem que o
+    event loop espere por elas, e uma leitura enfileirada depois de uma gravação
+    sempre enxerga o dado gravado.
+
+    Parâmetros:
+        name (str): Nome da thread e da métrica 'blocking.<nome>'
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'serial-{name}')
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """
+        Enfileira func(*args) sem esperar pelo resultado; falhas são registradas em log.
+
+        Retorna:
+            Future: Resultado da chamada, para quem quiser esperar por ele
+        """
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._report)
+        return future
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Executa func(*args) na thread, depois das chamadas já enfileiradas, sem travar o event loop.
+
+        Retorna:
+            O valor retornado pela função
+        """
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self._executor.submit(func, *args))
+        finally:
+            metrics.record(f'blocking.{self.name}', time.perf_counter() - started)
+
+    def flush(self) -> None:
+        """Bloqueia até que todas as chamadas enfileiradas terminem (testes e encerramento)."""
+        self._executor.submit(lambda: None).result()
+
+    def _report(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background {self.name} call failed: {future.exception()}")
+
+
+# Thread dos bancos SQLite locais (cache de metadados e mapeamento do Spotify)
+sqlite_worker = SerialWorker('sqlite')
+
+
+class LoopLagMonitor:
+    """
+    Detecta callbacks que seguram o event loop por tempo demais.
+
+    Um callback agendado a cada `interval` segundos marca um "batimento".
+    Uma thread de vigia verifica os batimentos: se o loop ficar parado além do
+    limite, registra em log a pilha de chamadas que está executando naquele
+    momento, o que aponta o culpado. Quando o loop volta a responder, o atraso
+    total é registrado em log e na métrica 'loop_lag'.
+
+    Parâmetros:
+        threshold (float): Atraso máximo tolerado, em segundos
+        interval (float): Intervalo entre batimentos, em segundos
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.1):
+        self.threshold = threshold
+        self.interval = interval
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._loop_thread_id: Optional[int] = None
+        self._expected_at = 0.0
+        self._last_beat = 0.0
+        self._stall_reported = False
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Indica se o monitor está ativo."""
+        return self._loop is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Inicia o monitor; deve ser chamado de dentro do event loop monitorado.
+
+        Parâmetros:
+            loop: Event loop a monitorar (usa o loop em execução se omitido)
+        """
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._schedule()
+
+        self._stop = threading.Event()  # Um evento novo por execução, para não reviver uma vigia antiga
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(self._stop,), name='loop-lag-watchdog', daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Interrompe o monitor."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+        self._loop = None
+
+    def _schedule(self) -> None:
+        """Agenda o próximo batimento."""
+        self._expected_at = time.monotonic() + self.interval
+        self._handle = self._loop.call_later(self.interval, self._beat)
+
+    def _beat(self) -> None:
+        """Batimento executado pelo event loop; mede o atraso em relação ao previsto."""
+        now = time.monotonic()
+        lag = now - self._expected_at
+        self._last_beat = now
+        self._stall_reported = False
+        if lag > self.threshold:
+            metrics.record('loop_lag', lag)
+            logger.warning("Event loop blocked for %.3fs (threshold %.3fs)", lag, self.threshold)
+        self._schedule()
+
+    def _watch(self, stop: threading.Event) -> None:
+        """Thread de vigia: registra a pilha do loop enquanto ele está travado."""
+        while not stop.wait(self.interval):
+            stalled = time.monotonic() - self._last_beat - self.interval
+            if stalled > self.threshold and not self._stall_reported:
+                self._stall_reported = True
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = ''.join(traceback.format_stack(frame)) if frame else '<unavailable>'
+                logger.warning(
+                    "Event loop stalled for more than %.3fs; currently running:\n%s",
+                    stalled, stack
+                )
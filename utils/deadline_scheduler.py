@@ -0,0 +1,141 @@
+"""
+Agendador de prazos por chave baseado em heap, com um único timer no event loop.
+
+Cada chave (por exemplo, o ID de um servidor) tem no máximo um prazo ativo.
+Armar ou cancelar um prazo custa O(log n) e o loop só acorda quando o prazo
+mais próximo vence, então o custo cresce com as mudanças de estado e não com
+o número de chaves monitoradas.
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Executa um callback por chave quando o prazo dela vence.
+
+    Entradas substituídas ou canceladas ficam no heap e são descartadas quando
+    chegam ao topo (remoção preguiçosa).
+
+    Parâmetros:
+        clock (Callable): Função que retorna o instante atual em segundos (útil em testes)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._heap: List[Tuple[float, int, Hashable]] = []  # (prazo, sequência, chave)
+        self._entries: Dict[Hashable, Tuple[float, int, Callable[[], Any]]] = {}  # chave -> (prazo, sequência, callback)
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_deadline: Optional[float] = None
+
+    def arm(self, key: Hashable, delay: float, callback: Callable[[], Any]) -> None:
+        """
+        Arma (ou rearma) o prazo de uma chave.
+
+        Parâmetros:
+            key: Identificador do prazo (substitui o prazo anterior da mesma chave)
+            delay (float): Segundos até o prazo vencer
+            callback (Callable): Função sem argumentos chamada no vencimento; se
+                retornar uma corrotina, ela é agendada no event loop
+        """
+        deadline = self.clock() + delay
+        sequence = next(self._counter)
+        self._entries[key] = (deadline, sequence, callback)
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        self._schedule()
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancela o prazo de uma chave.
+
+        Retorna:
+            bool: True se havia um prazo ativo
+        """
+        return self._entries.pop(key, None) is not None
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Instante (no relógio do agendador) em que o prazo da chave vence, ou None."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def run_due(self) -> List[Hashable]:
+        """
+        Executa os callbacks de todos os prazos vencidos.
+
+        Retorna:
+            List: Chaves cujos prazos venceram, na ordem dos prazos
+        """
+        now = self.clock()
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, sequence, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != sequence:
+                continue  # Prazo cancelado ou substituído
+            del self._entries[key]
+            fired.append(key)
+            try:
+                result = entry[2]()
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result)
+            except Exception:
+                logger.exception(f"Deadline callback for {key!r} failed")
+        self._discard_stale()
+        return fired
+
+    def _discard_stale(self) -> None:
+        """Remove do topo do heap as entradas canceladas ou substituídas."""
+        while self._heap:
+            deadline, sequence, key = self._heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == sequence:
+                break
+            heapq.heappop(self._heap)
+
+    def _schedule(self) -> None:
+        """Ajusta o timer do event loop para o prazo ativo mais próximo."""
+        self._discard_stale()
+        if not self._heap:
+            return
+        deadline = self._heap[0][0]
+        if self._timer is not None and self._timer_deadline is not None and self._timer_deadline <= deadline:
+            return  # O timer atual acorda antes; ele reagenda ao disparar
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Sem event loop: os prazos só vencem via run_due
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_deadline = deadline
+        self._timer = loop.call_later(max(0.0, deadline - self.clock()), self._on_timer)
+
+    def _on_timer(self) -> None:
+        """Dispara os prazos vencidos e agenda o próximo."""
+        self._timer = None
+        self._timer_deadline = None
+        self.run_due()
+        self._schedule()
+
+    def close(self) -> None:
+        """Cancela todos os prazos e o timer."""
+        self._entries.clear()
+        self._heap.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_deadline = None
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
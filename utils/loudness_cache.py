@@ -0,0 +1,103 @@
+"""
+Cache persistente da loudness medida de cada faixa.
+
+A loudness integrada (EBU R128, em LUFS) e o pico real de um vídeo não mudam,
+então são medidos uma única vez por vídeo e gravados em SQLite. Ao tocar a
+faixa de novo o ganho de normalização sai desta tabela, sem nenhuma análise.
+A tabela inteira é carregada em um dicionário em memória ao abrir o banco,
+para que as consultas feitas no event loop nunca toquem no disco; só put()
+grava no SQLite, e deve ser chamado fora do event loop.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+
+class Loudness(NamedTuple):
+    """Medição de loudness de uma faixa."""
+
+    integrated: float  # Loudness integrada em LUFS
+    peak: float  # Pico real em dBFS
+    partial: bool  # True se só o início da faixa foi medido (streaming)
+
+
+class LoudnessStore:
+    """
+    Armazena a loudness medida de cada vídeo, identificado pela chave do cache
+    de áudio ("<extrator>-<id>").
+
+    Parâmetros:
+        path (str): Caminho do banco SQLite (':memory:' para manter só em memória)
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        directory = os.path.dirname(path) if path != ':memory:' else ''
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memo: Dict[str, Loudness] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS loudness ("
+                "key TEXT PRIMARY KEY, integrated REAL NOT NULL, peak REAL NOT NULL, "
+                "partial INTEGER NOT NULL, analyzed_at REAL NOT NULL)"
+            )
+            for key, integrated, peak, partial in self._conn.execute(
+                "SELECT key, integrated, peak, partial FROM loudness"
+            ):
+                self._memo[key] = Loudness(integrated, peak, bool(partial))
+
+    def get(self, key: str) -> Optional[Loudness]:
+        """
+        Obtém a medição de um vídeo, sem acessar o disco.
+
+        Parâmetros:
+            key (str): Chave do vídeo
+
+        Retorna:
+            Loudness: Medição gravada ou None se o vídeo ainda não foi analisado
+        """
+        return self._memo.get(key)
+
+    def put(self, key: str, loudness: Loudness) -> None:
+        """
+        Grava (ou substitui) a medição de um vídeo. Bloqueante: grava no SQLite.
+
+        Uma medição parcial nunca substitui uma medição da faixa inteira.
+
+        Parâmetros:
+            key (str): Chave do vídeo
+            loudness (Loudness): Medição
+        """
+        current = self.get(key)
+        if loudness.partial and current is not None and not current.partial:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO loudness (key, integrated, peak, partial, analyzed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, loudness.integrated, loudness.peak, int(loudness.partial), time.time())
+            )
+        self._memo[key] = loudness
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM loudness").fetchone()[0]
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco de dados."""
+        with self._lock:
+            self._conn.close()
+
+
+# Cache global; LOUDNESS_CACHE_PATH vazio mantém os dados só em memória
+loudness_cache = LoudnessStore(
+    os.getenv('LOUDNESS_CACHE_PATH', os.path.join('storage', 'loudness.sqlite3')) or ':memory:'
+)
@@ -0,0 +1,312 @@
+"""
+Cache compartilhado dos resultados de extract_info do yt-dlp.
+
+Separa os metadados estáveis de uma faixa (título, duração, miniatura, ID)
+da URL direta do áudio, que expira em poucas horas. Cada parte tem sua própria
+validade: os metadados podem ser reaproveitados por dias, enquanto a URL do
+stream só é devolvida enquanto ainda for aceita pelo servidor de origem.
+
+Opcionalmente persiste as entradas em SQLite para sobreviver a reinícios.
+A camada em memória é consultada direto no event loop; o disco só é acessado
+na thread dos bancos SQLite (gravações enfileiradas e leituras após uma falha
+em memória), para que nenhuma consulta trave os shards.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from utils.blocking import SerialWorker, sqlite_worker
+from utils.ttl_cache import TTLCache
+
+# Campos estáveis de uma faixa, válidos por muito tempo
+METADATA_KEYS = (
+    'id', 'title', 'duration', 'thumbnail', 'webpage_url',
+    'extractor', 'extractor_key', 'uploader', 'is_live'
+)
+# Campos ligados à URL direta do áudio, que expira
+STREAM_KEYS = ('url', 'ext', 'acodec', 'abr', 'asr', 'protocol', 'http_headers')
+
+# Margem de segurança antes do "expire" informado pela URL do stream
+STREAM_EXPIRY_MARGIN = 300
+
+
+def split_info(info: Dict[str, Any]) -> tuple:
+    """
+    Separa um resultado do yt-dlp em metadados estáveis e dados do stream.
+
+    Parâmetros:
+        info (Dict): Resultado de extract_info de um único vídeo
+
+    Retorna:
+        tuple: (metadados, stream); stream é None se não houver URL direta
+    """
+    metadata = {key: info[key] for key in METADATA_KEYS if info.get(key) is not None}
+    stream = None
+    if info.get('url'):
+        stream = {key: info[key] for key in STREAM_KEYS if info.get(key) is not None}
+    return metadata, stream
+
+
+def stream_ttl_for(stream_url: str, default_ttl: float) -> float:
+    """
+    Calcula a validade de uma URL de stream.
+
+    URLs do YouTube trazem o parâmetro "expire" (timestamp Unix); quando
+    presente, a validade nunca passa desse instante menos uma margem.
+
+    Parâmetros:
+        stream_url (str): URL direta do áudio
+        default_ttl (float): Validade máxima configurada, em segundos
+
+    Retorna:
+        float: Validade em segundos (0 se já expirada)
+    """
+    try:
+        expire = parse_qs(urlparse(stream_url).query).get('expire')
+        if expire:
+            remaining = float(expire[0]) - time.time() - STREAM_EXPIRY_MARGIN
+            return max(0.0, min(default_ttl, remaining))
+    except (TypeError, ValueError):
+        pass
+    return default_ttl
+
+
+class SQLiteMetadataBackend:
+    """
+    Armazenamento em disco (SQLite) das entradas do cache de metadados.
+
+    Os prazos são gravados como timestamps Unix para continuarem válidos entre
+    reinícios do bot. Os métodos são bloqueantes; o MetadataCache os chama na
+    thread dos bancos SQLite.
+
+    Parâmetros:
+        path (str): Caminho do arquivo do banco de dados
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            for table in ('metadata', 'stream'):
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "key TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+
+    def load(self, table: str, key: str) -> Optional[tuple]:
+        """
+        Lê uma entrada ainda válida.
+
+        Retorna:
+            tuple: (dados, segundos restantes) ou None se ausente/expirada
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT data, expires_at FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            self.delete(table, key)
+            return None
+        return json.loads(row[0]), remaining
+
+    def store(self, table: str, key: str, data: Dict[str, Any], ttl: float) -> None:
+        """Grava (ou substitui) uma entrada com a validade informada."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, data, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time() + ttl)
+            )
+
+    def delete(self, table: str, key: str) -> None:
+        """Remove uma entrada."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco de dados."""
+        with self._lock:
+            self._conn.close()
+
+    def purge_expired(self) -> None:
+        """Remove do disco todas as entradas expiradas."""
+        now = time.time()
+        with self._lock, self._conn:
+            for table in ('metadata', 'stream'):
+                self._conn.execute(f"DELETE FROM {table} WHERE expires_at <= ?", (now,))
+
+
+class MetadataCache:
+    """
+    Cache LRU+TTL de metadados de faixas, com URLs de stream em separado.
+
+    Parâmetros:
+        max_entries (int): Limite de faixas mantidas em memória
+        metadata_ttl (float): Validade dos metadados estáveis, em segundos
+        stream_ttl (float): Validade máxima das URLs de stream, em segundos
+        backend (SQLiteMetadataBackend): Armazenamento em disco opcional
+        worker (SerialWorker): Thread que acessa o disco
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        metadata_ttl: float = 7 * 24 * 3600,
+        stream_ttl: float = 5 * 3600,
+        backend: Optional[SQLiteMetadataBackend] = None,
+        worker: SerialWorker = sqlite_worker
+    ):
+        self.stream_ttl = stream_ttl
+        self.backend = backend
+        self.worker = worker
+        self._metadata = TTLCache(max_entries, metadata_ttl)
+        self._streams = TTLCache(max_entries, stream_ttl)
+
+    async def get_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém os metadados estáveis de uma faixa.
+
+        Parâmetros:
+            url (str): URL da faixa
+
+        Retorna:
+            Dict: Metadados ou None se não estiverem em cache
+        """
+        return await self._lookup(self._metadata, 'metadata', url)
+
+    async def get_stream(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém os dados do stream (URL direta, codec, cabeçalhos) ainda válidos.
+
+        Parâmetros:
+            url (str): URL da faixa
+
+        Retorna:
+            Dict: Dados do stream ou None se ausentes ou expirados
+        """
+        return await self._lookup(self._streams, 'stream', url)
+
+    async def get(self, url: str, *, require_stream: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Obtém um dicionário no formato do yt-dlp com os dados em cache.
+
+        Os campos do stream só são incluídos enquanto a URL direta for válida.
+
+        Parâmetros:
+            url (str): URL da faixa
+            require_stream (bool): Se True, exige uma URL de stream válida
+
+        Retorna:
+            Dict: Metadados (e stream, se válido) ou None
+        """
+        metadata = await self.get_metadata(url)
+        if metadata is None:
+            return None
+
+        stream = await self.get_stream(url)
+        if stream is None:
+            return None if require_stream else dict(metadata)
+        return {**metadata, **stream}
+
+    def put(self, url: str, info: Dict[str, Any]) -> None:
+        """
+        Armazena o resultado de extract_info de um único vídeo.
+
+        A entrada também é indexada pela webpage_url do vídeo, para que buscas
+        e URLs curtas (youtu.be) encontrem o mesmo registro. Não espera pelo
+        disco: a gravação é enfileirada na thread dos bancos SQLite.
+
+        Parâmetros:
+            url (str): URL usada na extração
+            info (Dict): Resultado de extract_info (não uma playlist)
+        """
+        metadata, stream = split_info(info)
+        keys = {url, info.get('webpage_url')} - {None}
+        stream_ttl = stream_ttl_for(stream['url'], self.stream_ttl) if stream else 0
+
+        for key in keys:
+            self._store(self._metadata, 'metadata', key, metadata, self._metadata.ttl)
+            if stream and stream_ttl > 0:
+                self._store(self._streams, 'stream', key, stream, stream_ttl)
+
+    def invalidate_stream(self, url: str) -> None:
+        """
+        Descarta a URL de stream de uma faixa (por exemplo, quando foi rejeitada).
+
+        Parâmetros:
+            url (str): URL da faixa
+        """
+        self._streams.pop(url)
+        if self.backend:
+            self.worker.submit(self.backend.delete, 'stream', url)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Contadores de acertos e falhas do cache.
+
+        Retorna:
+            Dict: hits/misses de metadados e de streams, e o total em memória
+        """
+        return {
+            'metadata_hits': self._metadata.hits,
+            'metadata_misses': self._metadata.misses,
+            'stream_hits': self._streams.hits,
+            'stream_misses': self._streams.misses,
+            'entries': len(self._metadata),
+        }
+
+    def flush(self) -> None:
+        """Bloqueia até que as gravações enfileiradas cheguem ao disco."""
+        self.worker.flush()
+
+    async def _lookup(self, memory: TTLCache, table: str, key: str) -> Optional[Dict[str, Any]]:
+        """Consulta a memória e, em caso de falha, o disco na thread dos bancos SQLite."""
+        value = memory.get(key)
+        if value is not None or self.backend is None:
+            return value
+
+        stored = await self.worker.run(self.backend.load, table, key)
+        if stored is None:
+            return None
+
+        # A falha em memória virou acerto no disco
+        data, remaining = stored
+        memory.misses -= 1
+        memory.hits += 1
+        memory.set(key, data, ttl=remaining)
+        return data
+
+    def _store(self, memory: TTLCache, table: str, key: str, data: Dict[str, Any], ttl: float) -> None:
+        """Grava na memória e, se configurado, enfileira a gravação no disco."""
+        memory.set(key, data, ttl=ttl)
+        if self.backend:
+            self.worker.submit(self.backend.store, table, key, data, ttl)
+
+
+def _build_default_cache() -> MetadataCache:
+    """Cria o cache global a partir das variáveis de ambiente."""
+    path = os.getenv('METADATA_CACHE_PATH', os.path.join('storage', 'metadata.sqlite3'))
+    backend = None
+    if path:
+        backend = SQLiteMetadataBackend(path)
+        backend.purge_expired()
+    return MetadataCache(
+        max_entries=int(os.getenv('METADATA_CACHE_SIZE', '5000')),
+        metadata_ttl=float(os.getenv('METADATA_CACHE_TTL', str(7 * 24 * 3600))),
+        stream_ttl=float(os.getenv('STREAM_URL_TTL', str(5 * 3600))),
+        backend=backend
+    )
+
+
+# Cache global compartilhado por todos os cogs de música
+metadata_cache = _build_default_cache()
@@ -0,0 +1,80 @@
+"""
+Registro simples de métricas de latência do bot de música.
+
+Cada métrica acumula contagem, soma, mínimo, máximo e último valor, e pode
+ser consultada a qualquer momento (por exemplo, em logs ou comandos de debug).
+"""
+
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyStats:
+    """Estatísticas acumuladas de uma métrica de latência (em segundos)."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'last')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.last: Optional[float] = None
+
+    def add(self, seconds: float) -> None:
+        """Acumula uma nova amostra."""
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        self.last = seconds
+
+    @property
+    def mean(self) -> float:
+        """Média das amostras (0 se não houver nenhuma)."""
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Representação em dicionário, útil para logs."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            'last': self.last or 0.0,
+        }
+
+
+class MetricsRecorder:
+    """Coleção de métricas de latência identificadas por nome."""
+
+    def __init__(self):
+        self._stats: Dict[str, LatencyStats] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Registra uma amostra de latência.
+
+        Parâmetros:
+            name (str): Nome da métrica (ex.: 'time_to_first_audio.stream')
+            seconds (float): Valor medido, em segundos
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = LatencyStats()
+        stats.add(seconds)
+        logger.debug("%s: %.3fs (mean %.3fs over %d)", name, seconds, stats.mean, stats.count)
+
+    def get(self, name: str) -> Optional[LatencyStats]:
+        """Obtém as estatísticas de uma métrica (None se nunca registrada)."""
+        return self._stats.get(name)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Retorna todas as métricas em forma de dicionário."""
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+
+# Registro global de métricas do bot
+metrics = MetricsRecorder()
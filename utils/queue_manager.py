@@ -3,130 +3,335 @@ Gerencia filas de reprodução de música para bots do Discord, incluindo:
 - Fila de próximas músicas
 - Histórico de reprodução
 - Controle da faixa atual
+
+Cada servidor (guild) possui sua própria fila isolada, obtida através do
+registro global `registry` (ou do atalho `get_queue`).
 """
 
-from typing import List, Dict, Optional
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from utils.track import Track
 
 # Configurações
 MAX_HISTORY = 10000  # Número máximo de músicas no histórico
 QUEUE_LIMIT = 10000   # Limite máximo de músicas na fila de reprodução
 
-# Estado global
-music_queue: List[Dict] = []     # Fila de próximas músicas (FIFO)
-played_queue: List[Dict] = []    # Histórico de músicas tocadas (MRU primeiro)
-current_track: Optional[Dict] = None  # Faixa atual sendo reproduzida
 
-def add_to_queue(track: Dict, next_in_queue: bool = False) -> None:
-    """
-    Adiciona uma música à fila de reprodução.
-    
-    Parâmetros:
-        track (Dict): Dados da música no formato:
-            {
-                'title': str,         # Título da música
-                'duration': int,      # Duração em segundos
-                'original_url': str,  # URL original do track
-                'source': str         # Fonte (YouTube/Spotify)
-            }
-        next_in_queue (bool): Se True, coloca a música no início da fila
-    """
-    if len(music_queue) >= QUEUE_LIMIT:
-        raise ValueError("A fila de reprodução está cheia!")
-    
-    if next_in_queue:
-        music_queue.insert(0, track)
-    else:
-        music_queue.append(track)
-
-def get_next() -> Optional[Dict]:
-    """
-    Obtém e remove a próxima música da fila, atualizando o histórico.
-    
-    Retorna:
-        Dict: Dados da próxima música ou None se a fila estiver vazia
-    """
-    global current_track
-    
-    if not music_queue:
-        current_track = None
-        return None
-    
-    current_track = music_queue.pop(0)
-    return current_track
-
-def add_to_played(track: Dict) -> None:
-    """
-    Adiciona uma música ao histórico de reprodução.
-    
-    Parâmetros:
-        track (Dict): Dados da música no mesmo formato de add_to_queue
-    """
-    played_queue.insert(0, track)  # Adiciona no início para ordem cronológica reversa
-    
-    # Mantém apenas o histórico máximo definido
-    if len(played_queue) > MAX_HISTORY:
-        played_queue.pop()  # Remove o item mais antigo
+class BatchResult(NamedTuple):
+    """Resultado de GuildQueue.add_many: músicas aceitas e recusadas, na ordem recebida."""
 
-def get_recent_tracks(limit: int = 10000) -> List[Dict]:
-    """
-    Obtém as músicas tocadas recentemente.
-    
-    Parâmetros:
-        limit (int): Número máximo de músicas a retornar
-    
-    Retorna:
-        List[Dict]: Lista de músicas do mais recente para o mais antigo
-    """
-    return played_queue[:min(limit, len(played_queue))]
+    accepted: List[Track]
+    rejected: List[Track]
 
-def show_queue() -> List[Dict]:
-    """
-    Retorna toda a fila de reprodução atual.
-    
-    Retorna:
-        List[Dict]: Cópia da fila de reprodução
+
+class GuildQueue:
     """
-    return music_queue.copy()
+    Fila de reprodução de um único servidor.
 
-def clear_played() -> None:
-    """Limpa todo o histórico de reprodução."""
-    played_queue.clear()
+    Mantém a fila de próximas músicas (FIFO), o histórico de músicas tocadas
+    (MRU primeiro) e a faixa atual, sem compartilhar estado com outros servidores.
 
-def get_current_track() -> Optional[Dict]:
-    """
-    Obtém a música atualmente em reprodução.
-    
-    Retorna:
-        Dict: Dados da música atual ou None se nada estiver tocando
+    Ambas as estruturas são deques: inserir/remover nas pontas e consultar o
+    tamanho custam O(1), e o histórico descarta sozinho o item mais antigo
+    ao atingir MAX_HISTORY.
+
+    Toda alteração da fila de próximas músicas é avisada aos ouvintes
+    registrados, que recebem a fila e o tipo do evento ('add', 'next',
+    'remove' ou 'clear').
     """
-    return current_track
 
-def is_empty() -> bool:
+    def __init__(self, guild_id: int, listeners: Optional[List[Callable]] = None):
+        self.guild_id = guild_id
+        self.listeners: List[Callable] = listeners if listeners is not None else []
+        self.music_queue: Deque[Track] = deque()  # Fila de próximas músicas (FIFO)
+        self.played_queue: Deque[Track] = deque(maxlen=MAX_HISTORY)  # Histórico (MRU primeiro)
+        self.current_track: Optional[Track] = None  # Faixa atual sendo reproduzida
+
+    def add_to_queue(self, track: Track, next_in_queue: bool = False) -> None:
+        """
+        Adiciona uma música à fila de reprodução.
+
+        Parâmetros:
+            track (Track): Registro compacto da música (título, URL, duração,
+                miniatura, origem e quem pediu)
+            next_in_queue (bool): Se True, coloca a música no início da fila
+
+        Levanta:
+            ValueError: Se a fila estiver cheia
+        """
+        if len(self.music_queue) >= QUEUE_LIMIT:
+            raise ValueError("A fila de reprodução está cheia!")
+
+        if next_in_queue:
+            self.music_queue.appendleft(track)
+        else:
+            self.music_queue.append(track)
+        self._changed('add')
+
+    def add_many(self, tracks: Iterable[Track], position: Optional[int] = None) -> BatchResult:
+        """
+        Adiciona várias músicas à fila de uma só vez.
+
+        A capacidade é verificada uma única vez: as músicas que cabem até
+        QUEUE_LIMIT são aceitas e as demais recusadas, sem exceções por item.
+        O lote é inserido em O(k + min(i, n - i)) girando o deque até a
+        posição, em vez de deslocar a fila a cada inserção, e os ouvintes
+        recebem um único evento 'add'.
+
+        Parâmetros:
+            tracks (Iterable[Track]): Músicas a adicionar, na ordem de reprodução
+            position (int): Índice onde o lote começa (0 para o início da fila,
+                negativo conta a partir do fim); None adiciona ao final
+
+        Retorna:
+            BatchResult: Músicas aceitas e recusadas
+        """
+        tracks = list(tracks)
+        free = max(0, QUEUE_LIMIT - len(self.music_queue))
+        result = BatchResult(tracks[:free], tracks[free:])
+        if not result.accepted:
+            return result
+
+        size = len(self.music_queue)
+        if position is None:
+            position = size
+        elif position < 0:
+            position = max(0, size + position)
+        else:
+            position = min(position, size)
+
+        if position == size:
+            self.music_queue.extend(result.accepted)
+        else:
+            # Traz a posição para o início, insere o lote e devolve a ordem original
+            self.music_queue.rotate(-position)
+            self.music_queue.extendleft(reversed(result.accepted))
+            self.music_queue.rotate(position)
+        self._changed('add')
+        return result
+
+    def get_next(self) -> Optional[Track]:
+        """
+        Obtém e remove a próxima música da fila, atualizando a faixa atual.
+
+        Retorna:
+            Track: Dados da próxima música ou None se a fila estiver vazia
+        """
+        if not self.music_queue:
+            self.current_track = None
+            return None
+
+        self.current_track = self.music_queue.popleft()
+        self._changed('next')
+        return self.current_track
+
+    def add_to_played(self, track: Track) -> None:
+        """
+        Adiciona uma música ao histórico de reprodução.
+
+        Parâmetros:
+            track (Track): Registro compacto da música tocada
+        """
+        # Adiciona no início para ordem cronológica reversa; o maxlen do deque
+        # remove o item mais antigo quando o histórico máximo é atingido
+        self.played_queue.appendleft(track)
+
+    def get_recent_tracks(self, limit: int = 10000) -> List[Track]:
+        """
+        Obtém as músicas tocadas recentemente.
+
+        Parâmetros:
+            limit (int): Número máximo de músicas a retornar
+
+        Retorna:
+            List[Track]: Lista de músicas do mais recente para o mais antigo
+        """
+        return list(islice(self.played_queue, max(0, limit)))
+
+    def show_queue(self) -> List[Track]:
+        """
+        Retorna toda a fila de reprodução atual.
+
+        Retorna:
+            List[Track]: Cópia da fila de reprodução
+        """
+        return list(self.music_queue)
+
+    def clear_played(self) -> None:
+        """Limpa todo o histórico de reprodução."""
+        self.played_queue.clear()
+
+    def get_current_track(self) -> Optional[Track]:
+        """
+        Obtém a música atualmente em reprodução.
+
+        Retorna:
+            Track: Dados da música atual ou None se nada estiver tocando
+        """
+        return self.current_track
+
+    def is_empty(self) -> bool:
+        """
+        Verifica se a fila de reprodução está vazia.
+
+        Retorna:
+            bool: True se vazia, False caso contrário
+        """
+        return len(self.music_queue) == 0
+
+    def peek(self, count: int = 1) -> List[Track]:
+        """
+        Consulta as próximas músicas sem removê-las da fila.
+
+        Parâmetros:
+            count (int): Quantidade de músicas a consultar
+
+        Retorna:
+            List[Track]: Até `count` músicas, na ordem de reprodução
+        """
+        return list(islice(self.music_queue, max(0, count)))
+
+    def queue_length(self) -> int:
+        """
+        Obtém a quantidade de músicas aguardando na fila.
+
+        Retorna:
+            int: Número de músicas na fila
+        """
+        return len(self.music_queue)
+
+    def remove_from_queue(self, index: int) -> Track:
+        """
+        Remove uma música específica da fila de reprodução.
+
+        Parâmetros:
+            index (int): Índice da música a ser removida (0-based)
+
+        Retorna:
+            Track: Música removida
+
+        Levanta:
+            IndexError: Se o índice for inválido
+        """
+        if index < 0 or index >= len(self.music_queue):
+            raise IndexError("Índice inválido na fila de reprodução")
+        track = self.music_queue[index]
+        del self.music_queue[index]
+        self._changed('remove')
+        return track
+
+    def skip(self, count: int) -> None:
+        """
+        Descarta as `count` primeiras músicas da fila.
+
+        Parâmetros:
+            count (int): Quantidade de músicas a descartar
+        """
+        for _ in range(min(max(0, count), len(self.music_queue))):
+            self.music_queue.popleft()
+        self._changed('remove')
+
+    def clear_queue(self) -> None:
+        """Limpa toda a fila de reprodução."""
+        self.music_queue.clear()
+        self._changed('clear')
+
+    def _changed(self, event: str) -> None:
+        """
+        Avisa os ouvintes de que a fila de próximas músicas mudou.
+
+        Parâmetros:
+            event (str): Tipo da alteração ('add', 'next', 'remove' ou 'clear')
+        """
+        for listener in list(self.listeners):
+            listener(self, event)
+
+
+class GuildQueueRegistry:
     """
-    Verifica se a fila de reprodução está vazia.
-    
-    Retorna:
-        bool: True se vazia, False caso contrário
+    Registro que entrega uma fila isolada (GuildQueue) para cada servidor.
+
+    As filas são criadas sob demanda no primeiro acesso e podem ser descartadas
+    quando o bot sai do canal de voz do servidor.
     """
-    return len(music_queue) == 0
 
-def remove_from_queue(index: int) -> Dict:
+    def __init__(self):
+        self._queues: Dict[int, GuildQueue] = {}
+        self._listeners: List[Callable] = []  # Compartilhada com todas as filas criadas
+
+    def get(self, guild_id: int) -> GuildQueue:
+        """
+        Obtém (ou cria) a fila do servidor informado.
+
+        Parâmetros:
+            guild_id (int): ID do servidor
+
+        Retorna:
+            GuildQueue: Fila exclusiva do servidor
+        """
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = GuildQueue(guild_id, self._listeners)
+        return queue
+
+    def remove(self, guild_id: int) -> None:
+        """
+        Descarta a fila do servidor informado, se existir.
+
+        A fila é esvaziada antes de ser descartada, para que os ouvintes
+        liberem qualquer trabalho pendente associado a ela.
+
+        Parâmetros:
+            guild_id (int): ID do servidor
+        """
+        queue = self._queues.pop(guild_id, None)
+        if queue is not None:
+            queue.clear_queue()
+
+    def add_listener(self, listener: Callable) -> None:
+        """
+        Registra uma função chamada a cada alteração de qualquer fila.
+
+        Parâmetros:
+            listener (Callable): Função no formato listener(fila, evento)
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable) -> None:
+        """
+        Remove uma função registrada com add_listener.
+
+        Parâmetros:
+            listener (Callable): Função previamente registrada
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._queues
+
+    def __iter__(self) -> Iterator[GuildQueue]:
+        return iter(list(self._queues.values()))
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+
+# Registro global de filas por servidor
+registry = GuildQueueRegistry()
+
+
+def get_queue(guild_id: int) -> GuildQueue:
     """
-    Remove uma música específica da fila de reprodução.
-    
+    Atalho para obter a fila de um servidor no registro global.
+
     Parâmetros:
-        index (int): Índice da música a ser removida (0-based)
-    
+        guild_id (int): ID do servidor
+
     Retorna:
-        Dict: Música removida
-    
-    Levanta:
-        IndexError: Se o índice for inválido
+        GuildQueue: Fila exclusiva do servidor
     """
-    if index < 0 or index >= len(music_queue):
-        raise IndexError("Índice inválido na fila de reprodução")
-    return music_queue.pop(index)
-
-def clear_queue() -> None:
-    """Limpa toda a fila de reprodução."""
-    music_queue.clear()
\ No newline at end of file
+    return registry.get(guild_id)
@@ -0,0 +1,155 @@
+"""
+Cache dos resultados de buscas no YouTube (ytsearch), indexado pela busca normalizada.
+
+As mesmas músicas populares e as mesmas consultas "nome artista" vindas do
+Spotify são buscadas repetidamente; este cache devolve os resultados anteriores
+enquanto forem válidos e junta buscas idênticas simultâneas em uma só.
+
+Os resultados são guardados apenas com os metadados estáveis de cada vídeo;
+as URLs de stream ficam no cache de metadados.
+"""
+
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.metadata_cache import split_info
+from utils.single_flight import SingleFlight
+from utils.ttl_cache import TTLCache
+
+try:
+    from text_unidecode import unidecode
+except ImportError:  # Sem a biblioteca, remove apenas os acentos via Unicode
+    def unidecode(text: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', text)
+        return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normaliza uma busca: remove acentos, ignora maiúsculas e espaços repetidos.
+
+    Parâmetros:
+        query (str): Texto da busca
+
+    Retorna:
+        str: Busca normalizada (ex.: "  Coração  VALENTE " -> "coracao valente")
+    """
+    return _WHITESPACE.sub(' ', unidecode(query)).strip().casefold()
+
+
+class SearchCache:
+    """
+    Cache LRU+TTL de resultados de busca, com agrupamento de buscas em andamento.
+
+    Uma entrada obtida com um limite maior também atende buscas com limite
+    menor (ex.: os 3 resultados do comando search atendem a busca do play).
+
+    Parâmetros:
+        max_entries (int): Limite de buscas mantidas em memória
+        ttl (float): Validade dos resultados, em segundos
+        clock (Callable): Função que retorna o instante atual (útil em testes)
+    """
+
+    def __init__(self, max_entries: int = 2000, ttl: float = 6 * 3600, clock: Callable[[], float] = time.monotonic):
+        self._entries = TTLCache(max_entries, ttl, clock)
+        self._flights = SingleFlight()  # Buscas idênticas em andamento
+
+    def get(self, query: str, limit: int = 1) -> Optional[List[Dict[str, Any]]]:
+        """
+        Obtém os resultados em cache de uma busca.
+
+        Parâmetros:
+            query (str): Texto da busca (normalizado internamente)
+            limit (int): Número de resultados desejados
+
+        Retorna:
+            List[Dict]: Até `limit` resultados, ou None se não estiverem em cache
+        """
+        entry = self._entries.get(normalize_query(query))
+        if entry is None:
+            return None
+        fetched_limit, results = entry
+        # Uma busca com limite menor não sabe se haveria mais resultados
+        if fetched_limit < limit and len(results) >= fetched_limit:
+            return None
+        return list(results[:limit])
+
+    def put(self, query: str, limit: int, results: List[Dict[str, Any]]) -> None:
+        """
+        Armazena os resultados de uma busca.
+
+        Parâmetros:
+            query (str): Texto da busca
+            limit (int): Limite usado na busca
+            results (List[Dict]): Resultados do yt-dlp
+        """
+        if not results:
+            return  # Buscas sem resultado não são guardadas
+        key = normalize_query(query)
+        current = self._entries.get(key)
+        if current is not None and current[0] > limit:
+            return  # Mantém a entrada mais completa
+        self._entries.set(key, (limit, [split_info(result)[0] for result in results]))
+
+    async def get_or_search(
+        self,
+        query: str,
+        limit: int,
+        search: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém os resultados do cache ou executa a busca, agrupando chamadas simultâneas.
+
+        Se uma busca idêntica já estiver em andamento, aguarda o resultado dela em
+        vez de iniciar outra. Cancelar um dos chamadores não cancela a busca dos demais.
+
+        Parâmetros:
+            query (str): Texto da busca
+            limit (int): Número de resultados desejados
+            search (Callable): Função assíncrona que executa a busca de fato
+
+        Retorna:
+            List[Dict]: Resultados da busca (lista vazia se não houver)
+        """
+        cached = self.get(query, limit)
+        if cached is not None:
+            return cached
+
+        key = (normalize_query(query), limit)
+        return list(await self._flights.do(key, lambda: self._search(query, limit, search)))
+
+    async def _search(self, query: str, limit: int, search: Callable[[], Awaitable[List[Dict[str, Any]]]]):
+        """Executa a busca e guarda o resultado."""
+        results = await search()
+        self.put(query, limit, results)
+        return results
+
+    def clear(self) -> None:
+        """Remove todos os resultados em cache."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Contadores do cache.
+
+        Retorna:
+            Dict: acertos, falhas, buscas agrupadas e total de entradas
+        """
+        return {
+            'hits': self._entries.hits,
+            'misses': self._entries.misses,
+            'coalesced': self._flights.shared,
+            'entries': len(self._entries),
+        }
+
+
+# Cache global de buscas compartilhado por todos os cogs de música
+search_cache = SearchCache(
+    max_entries=int(os.getenv('SEARCH_CACHE_SIZE', '2000')),
+    ttl=float(os.getenv('SEARCH_CACHE_TTL', str(6 * 3600)))
+)
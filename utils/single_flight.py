@@ -0,0 +1,61 @@
+"""
+Agrupamento de chamadas assíncronas simultâneas com a mesma chave ("single flight").
+
+Quando várias tarefas pedem o mesmo recurso ao mesmo tempo (por exemplo, a
+extração da mesma URL), apenas a primeira executa a operação; as demais
+aguardam o mesmo resultado. Assim que a operação termina, a chave é liberada
+e a próxima chamada executa a operação novamente (o cache fica a cargo de
+quem usa este utilitário).
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Executa no máximo uma operação por chave de cada vez, compartilhando o resultado.
+
+    Cancelar um dos chamadores não cancela a operação dos demais; se a operação
+    falhar, todos os chamadores recebem a mesma exceção.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0  # Chamadas atendidas por uma operação já em andamento
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Executa func() ou aguarda a execução em andamento para a mesma chave.
+
+        Parâmetros:
+            key: Identificador da operação (ex.: a URL extraída)
+            func (Callable): Função assíncrona sem argumentos que executa a operação
+
+        Retorna:
+            O resultado de func(), compartilhado entre os chamadores simultâneos
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        """Libera a chave e marca a exceção como tratada, mesmo sem chamadores restantes."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Indica se há uma operação em andamento para a chave."""
+        return key in self._calls
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,198 @@
+"""
+Mapeamento persistente de faixas do Spotify para vídeos do YouTube.
+
+O vídeo encontrado para uma faixa do Spotify não muda, então depois da
+primeira resolução (API do Spotify + busca no YouTube) o resultado é gravado
+em SQLite e reutilizado: reenfileirar uma faixa ou uma playlist conhecida
+não faz nenhuma chamada externa para as faixas já mapeadas.
+
+No event loop use fetch/fetch_many/save/save_many, que acessam o banco na
+thread dos bancos SQLite; get/get_many/put/put_many são bloqueantes.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from utils.blocking import SerialWorker, sqlite_worker
+
+# Limite de parâmetros por consulta do SQLite (versões antigas aceitam 999)
+_SQLITE_MAX_VARIABLES = 900
+
+_SPOTIFY_TRACK_ID = re.compile(r'(?:track[/:])([A-Za-z0-9]{22})')
+_YOUTUBE_VIDEO_ID = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})')
+
+
+class MappedTrack(NamedTuple):
+    """Vídeo do YouTube associado a uma faixa do Spotify."""
+
+    youtube_id: str
+    title: Optional[str]
+
+    @property
+    def url(self) -> str:
+        """URL da página do vídeo."""
+        return f'https://www.youtube.com/watch?v={self.youtube_id}'
+
+
+def spotify_track_id(url: str) -> Optional[str]:
+    """
+    Extrai o ID de uma faixa a partir de um link ou URI do Spotify.
+
+    Parâmetros:
+        url (str): Ex.: https://open.spotify.com/track/<id>?si=... ou spotify:track:<id>
+
+    Retorna:
+        str: ID da faixa ou None se o link não for de uma faixa
+    """
+    match = _SPOTIFY_TRACK_ID.search(url or '')
+    return match.group(1) if match else None
+
+
+def youtube_video_id(url: str) -> Optional[str]:
+    """
+    Extrai o ID de um vídeo a partir de uma URL do YouTube.
+
+    Parâmetros:
+        url (str): URL do vídeo (watch, youtu.be, shorts ou embed)
+
+    Retorna:
+        str: ID do vídeo ou None se não for reconhecido
+    """
+    match = _YOUTUBE_VIDEO_ID.search(url or '')
+    return match.group(1) if match else None
+
+
+class SpotifyMappingStore:
+    """
+    Armazena o vídeo do YouTube escolhido para cada faixa do Spotify.
+
+    Parâmetros:
+        path (str): Caminho do banco SQLite (':memory:' para manter só em memória)
+        worker (SerialWorker): Thread que acessa o banco nas variantes assíncronas
+    """
+
+    def __init__(self, path: str = ':memory:', worker: SerialWorker = sqlite_worker):
+        self.worker = worker
+        directory = os.path.dirname(path) if path != ':memory:' else ''
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS spotify_youtube ("
+                "spotify_id TEXT PRIMARY KEY, youtube_id TEXT NOT NULL, title TEXT, updated_at REAL NOT NULL)"
+            )
+
+    def get(self, spotify_id: str) -> Optional[MappedTrack]:
+        """
+        Obtém o vídeo mapeado para uma faixa.
+
+        Parâmetros:
+            spotify_id (str): ID da faixa no Spotify
+
+        Retorna:
+            MappedTrack: Vídeo mapeado ou None se a faixa ainda não foi resolvida
+        """
+        return self.get_many([spotify_id]).get(spotify_id)
+
+    def get_many(self, spotify_ids: Iterable[str]) -> Dict[str, MappedTrack]:
+        """
+        Consulta em lote os vídeos mapeados (por exemplo, de uma playlist inteira).
+
+        Parâmetros:
+            spotify_ids (Iterable[str]): IDs das faixas no Spotify
+
+        Retorna:
+            Dict[str, MappedTrack]: Apenas as faixas já mapeadas
+        """
+        ids = list(dict.fromkeys(spotify_id for spotify_id in spotify_ids if spotify_id))
+        found: Dict[str, MappedTrack] = {}
+        with self._lock:
+            for start in range(0, len(ids), _SQLITE_MAX_VARIABLES):
+                chunk = ids[start:start + _SQLITE_MAX_VARIABLES]
+                rows = self._conn.execute(
+                    "SELECT spotify_id, youtube_id, title FROM spotify_youtube "
+                    f"WHERE spotify_id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for spotify_id, youtube_id, title in rows:
+                    found[spotify_id] = MappedTrack(youtube_id, title)
+        return found
+
+    def put(self, spotify_id: str, youtube_url: str, title: Optional[str] = None) -> None:
+        """
+        Grava (ou atualiza) o vídeo escolhido para uma faixa.
+
+        Parâmetros:
+            spotify_id (str): ID da faixa no Spotify
+            youtube_url (str): URL (ou ID) do vídeo do YouTube
+            title (str): Título da faixa
+        """
+        self.put_many([(spotify_id, youtube_url, title)])
+
+    def put_many(self, mappings: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """
+        Grava vários mapeamentos em uma única transação.
+
+        Parâmetros:
+            mappings (Iterable): Tuplas (spotify_id, youtube_url, título)
+        """
+        now = time.time()
+        rows = []
+        for spotify_id, youtube_url, title in mappings:
+            youtube_id = youtube_video_id(youtube_url) or youtube_url
+            if spotify_id and youtube_id:
+                rows.append((spotify_id, youtube_id, title, now))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO spotify_youtube (spotify_id, youtube_id, title, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    async def fetch(self, spotify_id: str) -> Optional[MappedTrack]:
+        """Como get(), mas consulta o banco na thread dos bancos SQLite."""
+        return (await self.fetch_many([spotify_id])).get(spotify_id)
+
+    async def fetch_many(self, spotify_ids: Iterable[str]) -> Dict[str, MappedTrack]:
+        """Como get_many(), mas consulta o banco na thread dos bancos SQLite."""
+        return await self.worker.run(self.get_many, list(spotify_ids))
+
+    def save(self, spotify_id: str, youtube_url: str, title: Optional[str] = None) -> None:
+        """Como put(), mas apenas enfileira a gravação na thread dos bancos SQLite."""
+        self.save_many([(spotify_id, youtube_url, title)])
+
+    def save_many(self, mappings: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """Como put_many(), mas apenas enfileira a transação na thread dos bancos SQLite."""
+        self.worker.submit(self.put_many, list(mappings))
+
+    def flush(self) -> None:
+        """Bloqueia até que as gravações enfileiradas cheguem ao banco."""
+        self.worker.flush()
+
+    def delete(self, spotify_id: str) -> None:
+        """Remove o mapeamento de uma faixa (por exemplo, se o vídeo ficou indisponível)."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM spotify_youtube WHERE spotify_id = ?", (spotify_id,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM spotify_youtube").fetchone()[0]
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco de dados."""
+        with self._lock:
+            self._conn.close()
+
+
+# Mapeamento global; SPOTIFY_MAPPING_PATH vazio mantém os dados só em memória
+spotify_mapping = SpotifyMappingStore(
+    os.getenv('SPOTIFY_MAPPING_PATH', os.path.join('storage', 'spotify_mapping.sqlite3')) or ':memory:'
+)
@@ -0,0 +1,102 @@
+"""
+Registro compacto e imutável de uma música usada pelas filas e pelos embeds.
+
+Guarda apenas os campos necessários para exibir e reproduzir novamente uma
+faixa, em vez de manter o dicionário completo do yt-dlp (formatos, legendas,
+cabeçalhos) ou o objeto de áudio com o processo do FFmpeg.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class Track:
+    """
+    Música enfileirada, em reprodução ou no histórico.
+
+    Atributos:
+        title (str): Título da música
+        url (str): URL original da faixa (página do vídeo)
+        duration (int): Duração em segundos (None se desconhecida)
+        thumbnail (str): URL da miniatura (None se desconhecida)
+        source (str): Origem da faixa ('youtube' ou 'spotify')
+        requester (int): ID do usuário que pediu a música (None se desconhecido)
+    """
+
+    __slots__ = ('title', 'url', 'duration', 'thumbnail', 'source', 'requester')
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        duration: Optional[int] = None,
+        thumbnail: Optional[str] = None,
+        source: str = 'youtube',
+        requester: Optional[int] = None
+    ):
+        # Os campos são gravados via object.__setattr__ porque __setattr__ é bloqueado
+        object.__setattr__(self, 'title', title)
+        object.__setattr__(self, 'url', url)
+        object.__setattr__(self, 'duration', int(duration) if duration else None)
+        object.__setattr__(self, 'thumbnail', thumbnail)
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'requester', requester)
+
+    @classmethod
+    def from_info(
+        cls,
+        info: Dict[str, Any],
+        *,
+        url: Optional[str] = None,
+        title: Optional[str] = None,
+        source: str = 'youtube',
+        requester: Optional[int] = None
+    ) -> 'Track':
+        """
+        Cria um Track a partir do dicionário retornado pelo yt-dlp.
+
+        Parâmetros:
+            info (Dict): Resultado de extract_info (vídeo único)
+            url (str): URL original; usa webpage_url do info se omitida
+            title (str): Título preferido; usa o título do info se omitido
+            source (str): Origem da faixa
+            requester (int): ID do usuário que pediu a música
+
+        Retorna:
+            Track: Registro compacto com os campos relevantes
+        """
+        return cls(
+            title=title or info.get('title') or 'Unknown Track',
+            url=url or info.get('webpage_url') or info.get('url'),
+            duration=info.get('duration'),
+            thumbnail=info.get('thumbnail'),
+            source=source,
+            requester=requester
+        )
+
+    def replace(self, **changes) -> 'Track':
+        """
+        Cria uma cópia do Track com alguns campos alterados.
+
+        Retorna:
+            Track: Novo registro com os campos informados substituídos
+        """
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return Track(**fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Track é imutável")
+
+    def __delattr__(self, name):
+        raise AttributeError("Track é imutável")
+
+    def __eq__(self, other):
+        if not isinstance(other, Track):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        return f"Track(title={self.title!r}, url={self.url!r}, source={self.source!r})"
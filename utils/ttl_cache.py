@@ -0,0 +1,101 @@
+"""
+Cache em memória com descarte LRU e expiração por tempo (TTL).
+
+Usado como camada base pelos caches de metadados e de buscas.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Dicionário limitado que descarta o item usado há mais tempo (LRU) quando
+    cheio e ignora itens cujo prazo de validade já passou.
+
+    Parâmetros:
+        max_entries (int): Número máximo de itens mantidos
+        ttl (float): Validade padrão de cada item, em segundos
+        clock (Callable): Função que retorna o instante atual (útil em testes)
+    """
+
+    def __init__(self, max_entries: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._data: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.hits = 0    # Consultas atendidas pelo cache
+        self.misses = 0  # Consultas sem item válido
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtém um item válido e o marca como usado recentemente.
+
+        Parâmetros:
+            key: Chave do item
+
+        Retorna:
+            O valor armazenado ou None se ausente ou expirado
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Armazena um item, descartando os menos usados se o limite for excedido.
+
+        Parâmetros:
+            key: Chave do item
+            value: Valor a armazenar
+            ttl (float): Validade específica deste item (usa a padrão se omitida)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            self._data.pop(key, None)
+            return
+
+        self._data[key] = (self.clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def expires_in(self, key: Hashable) -> Optional[float]:
+        """
+        Informa quantos segundos faltam para o item expirar, sem contar como consulta.
+
+        Retorna:
+            float: Segundos restantes ou None se o item não existir
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        return entry[0] - self.clock()
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove um item, retornando seu valor (ou None)."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Remove todos os itens."""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > self.clock()
+
+    def __len__(self) -> int:
+        return len(self._data)